@@ -0,0 +1,22 @@
+-- Audio cache eviction support
+-- 1. The audio_cache trigger called update_updated_at_column(), but audio_cache has no
+--    updated_at column, so every UPDATE failed and last_accessed never moved.
+-- 2. Indexes used by the eviction job and the storage reconciliation.
+
+CREATE OR REPLACE FUNCTION update_last_accessed_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Only reads bump recency; maintenance updates (e.g. file_size fixes) do not
+    IF NEW.access_count IS DISTINCT FROM OLD.access_count THEN
+        NEW.last_accessed = NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS update_audio_cache_last_accessed ON audio_cache;
+CREATE TRIGGER update_audio_cache_last_accessed BEFORE UPDATE ON audio_cache
+    FOR EACH ROW EXECUTE FUNCTION update_last_accessed_column();
+
+CREATE INDEX IF NOT EXISTS idx_audio_cache_minio_key ON audio_cache(minio_key);
+CREATE INDEX IF NOT EXISTS idx_audio_cache_last_accessed ON audio_cache(last_accessed);
@@ -0,0 +1,5 @@
+-- Lesson catalog (GET /api/lessons)
+-- content_version is bumped by the API whenever a lesson's words change, letting
+-- clients detect stale days from the metadata listing without fetching content.
+
+ALTER TABLE lessons ADD COLUMN IF NOT EXISTS content_version INTEGER NOT NULL DEFAULT 1;
@@ -0,0 +1,110 @@
+-- Learner progress aggregates (GET /api/progress/stats, /leaderboard, /days)
+-- Maintained incrementally by a trigger on progress, so dashboards read one row
+-- (or one index range) instead of aggregating the progress table per request.
+--   user_progress_stats: days completed and daily streaks per learner
+--   day_progress_stats:  learners who started / completed each lesson day
+
+CREATE TABLE IF NOT EXISTS user_progress_stats (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    days_completed INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0, -- Consecutive UTC dates with a completion, ending at last_completed_on
+    longest_streak INTEGER NOT NULL DEFAULT 0,
+    last_completed_on DATE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now())
+);
+-- Top-N and "my rank" (count of learners ahead) are range scans on this index
+CREATE INDEX IF NOT EXISTS idx_user_progress_stats_rank ON user_progress_stats(days_completed DESC, user_id);
+
+CREATE TABLE IF NOT EXISTS day_progress_stats (
+    day_id INTEGER PRIMARY KEY,
+    learners_started INTEGER NOT NULL DEFAULT 0,
+    learners_completed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION apply_progress_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+    was_completed BOOLEAN := TG_OP <> 'INSERT' AND COALESCE(OLD.completed, FALSE);
+    is_completed BOOLEAN := TG_OP <> 'DELETE' AND COALESCE(NEW.completed, FALSE);
+    today DATE := timezone('utc', now())::date;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO day_progress_stats (day_id, learners_started)
+        VALUES (NEW.day_id, 1)
+        ON CONFLICT (day_id) DO UPDATE SET learners_started = day_progress_stats.learners_started + 1;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE day_progress_stats SET learners_started = learners_started - 1 WHERE day_id = OLD.day_id;
+    END IF;
+
+    IF is_completed AND NOT was_completed THEN
+        UPDATE day_progress_stats SET learners_completed = learners_completed + 1 WHERE day_id = NEW.day_id;
+        INSERT INTO user_progress_stats (user_id, days_completed, current_streak, longest_streak, last_completed_on)
+        VALUES (NEW.user_id, 1, 1, 1, today)
+        ON CONFLICT (user_id) DO UPDATE SET
+            days_completed = user_progress_stats.days_completed + 1,
+            current_streak = CASE
+                WHEN user_progress_stats.last_completed_on = today THEN user_progress_stats.current_streak
+                WHEN user_progress_stats.last_completed_on = today - 1 THEN user_progress_stats.current_streak + 1
+                ELSE 1
+            END,
+            longest_streak = GREATEST(user_progress_stats.longest_streak, CASE
+                WHEN user_progress_stats.last_completed_on = today THEN user_progress_stats.current_streak
+                WHEN user_progress_stats.last_completed_on = today - 1 THEN user_progress_stats.current_streak + 1
+                ELSE 1
+            END),
+            last_completed_on = today,
+            updated_at = timezone('utc', now());
+    ELSIF was_completed AND NOT is_completed THEN
+        UPDATE day_progress_stats SET learners_completed = learners_completed - 1 WHERE day_id = OLD.day_id;
+        UPDATE user_progress_stats
+        SET days_completed = days_completed - 1, updated_at = timezone('utc', now())
+        WHERE user_id = OLD.user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS apply_progress_stats ON progress;
+CREATE TRIGGER apply_progress_stats AFTER INSERT OR DELETE OR UPDATE OF completed ON progress
+    FOR EACH ROW EXECUTE FUNCTION apply_progress_stats();
+
+-- Backfill from existing progress (writes are blocked meanwhile, so nothing is counted twice).
+-- Streaks are rebuilt from the date of each completed row's last update.
+BEGIN;
+LOCK TABLE progress IN SHARE MODE;
+TRUNCATE user_progress_stats, day_progress_stats;
+
+INSERT INTO day_progress_stats (day_id, learners_started, learners_completed)
+SELECT day_id, count(*), count(*) FILTER (WHERE completed)
+FROM progress
+GROUP BY day_id;
+
+WITH completion_dates AS (
+    SELECT DISTINCT user_id, updated_at::date AS completed_on
+    FROM progress
+    WHERE completed
+),
+runs AS (
+    -- Consecutive dates share (date - row_number)
+    SELECT user_id, count(*) AS length, max(completed_on) AS ended_on
+    FROM (
+        SELECT user_id, completed_on,
+               completed_on - (row_number() OVER (PARTITION BY user_id ORDER BY completed_on))::int AS run
+        FROM completion_dates
+    ) numbered
+    GROUP BY user_id, run
+)
+INSERT INTO user_progress_stats (user_id, days_completed, current_streak, longest_streak, last_completed_on)
+SELECT
+    totals.user_id,
+    totals.days_completed,
+    (SELECT length FROM runs WHERE runs.user_id = totals.user_id ORDER BY ended_on DESC LIMIT 1),
+    (SELECT max(length) FROM runs WHERE runs.user_id = totals.user_id),
+    (SELECT max(ended_on) FROM runs WHERE runs.user_id = totals.user_id)
+FROM (
+    SELECT user_id, count(*) AS days_completed
+    FROM progress
+    WHERE completed
+    GROUP BY user_id
+) totals;
+COMMIT;
@@ -0,0 +1,6 @@
+-- Delta sync for learner progress (GET /api/progress/changes)
+-- Keyset (updated_at, id) per user: an unchanged device costs one empty index probe.
+-- CONCURRENTLY avoids blocking progress writes; run outside a transaction block.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_progress_user_updated
+    ON progress(user_id, updated_at, id);
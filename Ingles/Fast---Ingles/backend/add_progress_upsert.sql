@@ -0,0 +1,25 @@
+-- Learner progress API (app/routers/progress.py)
+-- 1. Progress is written with INSERT ... ON CONFLICT (user_id, day_id), which needs a
+--    unique constraint on those columns (older databases may lack it).
+-- 2. `completed` is a boolean (older schemas stored it as an integer).
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conrelid = 'progress'::regclass AND contype = 'u'
+          AND conkey = ARRAY[
+              (SELECT attnum FROM pg_attribute WHERE attrelid = 'progress'::regclass AND attname = 'user_id'),
+              (SELECT attnum FROM pg_attribute WHERE attrelid = 'progress'::regclass AND attname = 'day_id')
+          ]::smallint[]
+    ) THEN
+        ALTER TABLE progress ADD CONSTRAINT progress_user_id_day_id_key UNIQUE (user_id, day_id);
+    END IF;
+
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name = 'progress' AND column_name = 'completed') = 'integer' THEN
+        ALTER TABLE progress ALTER COLUMN completed DROP DEFAULT;
+        ALTER TABLE progress ALTER COLUMN completed TYPE BOOLEAN USING completed <> 0;
+        ALTER TABLE progress ALTER COLUMN completed SET DEFAULT FALSE;
+    END IF;
+END $$;
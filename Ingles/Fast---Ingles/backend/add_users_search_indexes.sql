@@ -0,0 +1,12 @@
+-- Admin user list (GET /api/admin/users)
+-- 1. Keyset pagination, newest first: (created_at, id) descending.
+-- 2. Substring search on name/email (lower(...) LIKE '%q%') through trigram indexes.
+-- 3. Case-insensitive email lookups (bulk import existence check).
+-- CONCURRENTLY avoids blocking sign-ups; run outside a transaction block.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_created_at_id ON users(created_at DESC, id DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_trgm ON users USING gin (lower(email) gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_name_trgm ON users USING gin (lower(name) gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_lower ON users (lower(email));
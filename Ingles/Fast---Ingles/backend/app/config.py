@@ -13,6 +13,20 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "postgresql+asyncpg://postgres:postgres@db:5432/fastingles"
+    DB_POOL_SIZE: int = 5  # Persistent connections per worker
+    DB_MAX_OVERFLOW: int = 10  # Extra connections opened under burst load
+    DB_POOL_TIMEOUT_SECONDS: float = 30  # Max wait for a free connection before erroring
+    DB_POOL_RECYCLE_SECONDS: int = 30 * 60  # Replace connections older than this (-1 = never)
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout (pooler may drop idle ones)
+    # Direct (session-mode) connection for hot reads; prepared statements are cached
+    # per connection there. Empty = hot reads use DATABASE_URL like everything else
+    DATABASE_DIRECT_URL: str = ""
+    DB_DIRECT_STATEMENT_CACHE_SIZE: int = 100
+    # Read replicas for GET endpoints (round-robin over replicas within the lag limit)
+    READ_REPLICA_URLS: list[str] = []
+    READ_REPLICA_MAX_LAG_SECONDS: float = 5.0  # Lag beyond this sends reads to the primary
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: int = 5
+    READ_YOUR_WRITES_SECONDS: int = 30  # Clients that just wrote read from the primary this long
     
     # Supabase
     SUPABASE_URL: str = ""
@@ -42,12 +56,90 @@ class Settings(BaseSettings):
     DEEPSEEK_API_KEY: str = ""
     DEEPSEEK_MODEL: str = "deepseek-chat"
     
+    # Max completion tokens per lesson generation call (Claude, OpenAI, DeepSeek)
+    LLM_MAX_TOKENS: int = 8000
+    # Gemini 2.5 counts thinking tokens against the output limit, so it needs its own
+    # (the model's maximum, as before any cap was set)
+    GEMINI_MAX_OUTPUT_TOKENS: int = 65536
+    
+    # Vocabulary index (reuse of words already present in other lessons)
+    VOCAB_INDEX_TTL_SECONDS: int = 10 * 60
+    VOCAB_EXCLUDE_MAX_WORDS: int = 300  # Cap on words listed in the exclusion prompt
+    
+    # Preview Pool (pre-generated lesson previews for popular combinations)
+    PREVIEW_POOL_ENABLED: bool = True
+    PREVIEW_POOL_SIZE: int = 2  # Ready previews kept per (topic, category, word_count)
+    PREVIEW_POOL_MAX_AGE_SECONDS: int = 60 * 60  # Discard previews older than this
+    PREVIEW_POOL_MAX_COMBOS: int = 10  # Only the most requested combinations are kept warm
+    PREVIEW_POOL_REFILL_INTERVAL_SECONDS: int = 60
+    PREVIEW_POOL_IDLE_SECONDS: int = 60 * 60 * 24  # Forget combinations not requested for this long
+    PREVIEW_POOL_CONCURRENCY: int = 2  # Max parallel background LLM calls
+    
     # MinIO Object Storage
     MINIO_ENDPOINT: str = "minio:9000"
     MINIO_ACCESS_KEY: str = "minioadmin"
     MINIO_SECRET_KEY: str = "minioadmin123"
     MINIO_BUCKET: str = "fastingles-storage"
     MINIO_SECURE: bool = False
+    MINIO_REGION: str = ""  # Set to skip the bucket-location lookup (e.g. "us-east-1")
+    
+    # Storage backend: "minio" or "local" (files under STORAGE_LOCAL_ROOT, served by the API)
+    STORAGE_BACKEND: str = "minio"
+    STORAGE_LOCAL_ROOT: str = "./storage"
+    STORAGE_LOCAL_BASE_URL: str = ""  # Prefix for signed /api/storage URLs ("" = same origin)
+    STORAGE_SIGNING_KEY: str = ""  # HMAC key for signed URLs (defaults to SECRET_KEY)
+    
+    # Audio delivery
+    AUDIO_URL_MODE: str = "presigned"  # "presigned" (MinIO URLs) or "app" (signed /api/audio URLs)
+    AUDIO_DISK_CACHE_DIR: str = "/tmp/fastingles-audio-cache"  # Node-local copy of hot audio
+    AUDIO_DISK_CACHE_MAX_BYTES: int = 512 * 1024 ** 2  # Per worker; 0 disables the disk cache
+    AUDIO_ACCEL_REDIRECT: bool = False  # Let nginx send /api/audio bytes (X-Accel-Redirect)
+    AUDIO_ACCEL_MINIO_LOCATION: str = "/_minio/"  # nginx internal location proxying to MinIO
+    AUDIO_ACCEL_STORAGE_LOCATION: str = "/_storage/"  # nginx internal alias of STORAGE_LOCAL_ROOT
+    AUDIO_ACCEL_PRESIGN_SECONDS: int = 300  # Lifetime of the presigned URL nginx fetches
+    PUBLIC_DICTIONARY_ENABLED: bool = False  # Serve global/dictionary/ from a public-read path
+    STORAGE_PUBLIC_BASE_URL: str = ""  # Public/CDN base for those objects (default: MinIO endpoint/bucket)
+    PUBLIC_AUDIO_CACHE_CONTROL: str = "public, max-age=31536000, immutable"
+    
+    # Storage client (backend calls run on a bounded thread pool)
+    STORAGE_MAX_WORKERS: int = 16  # Concurrent MinIO operations per API worker
+    STORAGE_POOL_SIZE: int = 16  # HTTP connections kept per MinIO host
+    STORAGE_CONNECT_TIMEOUT_SECONDS: float = 5
+    STORAGE_READ_TIMEOUT_SECONDS: float = 30
+    STORAGE_MAX_RETRIES: int = 3
+    STORAGE_OPERATION_TIMEOUT_SECONDS: float = 60  # Upper bound awaited per operation
+    STORAGE_BATCH_CONCURRENCY: int = 8  # Parallel operations per bulk call (upload_many, ...)
+    
+    # Storage reconciliation (audio_cache <-> MinIO)
+    STORAGE_RECONCILE_BATCH_SIZE: int = 500  # Rows/objects fixed per batch
+    STORAGE_RECONCILE_GRACE_SECONDS: int = 60 * 60  # Newer objects are never considered orphans
+    
+    # TTS cache keys
+    TTS_CASE_POLICY: str = "lower"  # "lower" (case-insensitive cache keys) or "preserve"
+    
+    # Audio cache eviction (global/dictionary/ is exempt)
+    AUDIO_CACHE_BYTE_BUDGET: int = 2 * 1024 ** 3  # Bytes of evictable audio to keep
+    AUDIO_EVICTION_TARGET_RATIO: float = 0.9  # Evict down to this fraction of the budget
+    AUDIO_EVICTION_INTERVAL_SECONDS: int = 6 * 60 * 60  # 0 disables the scheduled run
+    AUDIO_EVICTION_HALF_LIFE_HOURS: float = 72  # Access weight halves after this long unused
+    AUDIO_EVICTION_BATCH_SIZE: int = 200  # Rows/objects deleted per batch
+    
+    # Learner progress (write-behind: updates are coalesced per user/day, then bulk upserted)
+    PROGRESS_FLUSH_INTERVAL_SECONDS: float = 5
+    PROGRESS_BUFFER_MAX_ENTRIES: int = 5000  # Flush early when this many (user, day) pairs are pending
+    PROGRESS_SYNC_SETTLE_SECONDS: int = 5  # Newer rows are re-sent by /api/progress/changes
+    
+    # Bulk user import (POST /api/admin/users/import)
+    PASSWORD_HASH_WORKERS: int = 2  # Processes hashing passwords (bcrypt is CPU bound)
+    USER_IMPORT_MAX_ROWS: int = 5000
+    USER_IMPORT_MAX_BYTES: int = 5 * 1024 ** 2  # Uploads are refused past this size, before parsing
+    USER_IMPORT_BATCH_SIZE: int = 200  # Rows validated, hashed and inserted per transaction
+    
+    # Bulk lesson import (POST /api/lessons/import, scripts/transfer_lessons.py)
+    LESSON_IMPORT_BATCH_SIZE: int = 50  # Lessons upserted per transaction
+    
+    # Metrics
+    METRICS_WINDOW_SECONDS: int = 60 * 60  # Rolling window for histograms
     
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost", "http://localhost:80", "http://localhost:5173", "http://localhost:3000", "http://127.0.0.1", "https://ingles.n8nprueba.shop"]
@@ -1,30 +1,122 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Request, Response
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
+from app.services.metrics import PoolStats, get_pool_stats
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool recording checkout waits and connect latency into PoolStats."""
+
+    stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.stats:
+                self.stats.timeouts += 1
+            raise
+        finally:
+            if self.stats:
+                self.stats.checkouts += 1
+                self.stats.checkout_wait.observe(time.perf_counter() - started)
+
+    def _create_connection(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._create_connection()
+        except Exception:
+            if self.stats:
+                self.stats.connect_failures += 1
+            raise
+        if self.stats:
+            self.stats.connects += 1
+            self.stats.connect_latency.observe(time.perf_counter() - started)
+        return connection
 
-engine = create_async_engine(
+    def recreate(self):
+        # Called on engine.dispose() and after disconnects; keep reporting to the same stats
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+
+# Engines by name, reported by pool_status()
+_engines: dict[str, AsyncEngine] = {}
+
+
+def _create_engine(name: str, url: str, **kwargs) -> AsyncEngine:
+    """Pooled engine sized by the DB_POOL_* settings, instrumented under `name`."""
+    new_engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        **kwargs
+    )
+    new_engine.pool.stats = get_pool_stats(name)
+    _engines[name] = new_engine
+    return new_engine
+
+
+_SERVER_SETTINGS = {
+    "jit": "off",
+    "statement_timeout": "60000"
+}
+
+engine = _create_engine(
+    "primary",
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
     # Required for Supabase Transaction Pooler (pgbouncer/Supavisor)
     # Transaction mode doesn't support prepared statements
     connect_args={
         "prepared_statement_cache_size": 0,
-        "server_settings": {
-            "jit": "off",
-            "statement_timeout": "60000"
-        }
+        "server_settings": _SERVER_SETTINGS
     }
 )
 
+# Hot read paths: a session-mode connection keeps its prepared statements, so repeated
+# queries skip parse/plan. Falls back to the pooler-safe engine when not configured.
+direct_engine = _create_engine(
+    "direct",
+    settings.DATABASE_DIRECT_URL,
+    connect_args={
+        "prepared_statement_cache_size": settings.DB_DIRECT_STATEMENT_CACHE_SIZE,
+        "server_settings": _SERVER_SETTINGS
+    }
+) if settings.DATABASE_DIRECT_URL else engine
+
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False
 )
 
+direct_session = async_sessionmaker(
+    direct_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all models."""
@@ -40,7 +132,221 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+async def get_direct_db() -> AsyncSession:
+    """
+    Dependency for read-only hot paths (lesson and audio cache lookups).
+    Writes must keep using get_db: the direct connection bypasses the pooler.
+    """
+    async with direct_session() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+# Set on responses of write endpoints; while present, get_read_db reads from the primary
+READ_PRIMARY_COOKIE = "fi_read_primary"
+
+# Seconds the replica is behind (0 when it has replayed everything it received).
+# NULL without a streaming WAL receiver: receive = replay then only means nothing
+# new arrives, so the replica is falling behind by an unknown amount.
+_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN NULL
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+""")
+
+
+@dataclass
+class _Replica:
+    name: str
+    engine: AsyncEngine
+    session: async_sessionmaker
+    lag_seconds: Optional[float] = None
+    healthy: bool = False  # Unknown until the first lag check
+    error: Optional[str] = None
+
+
+class ReadReplicas:
+    """
+    Read replicas behind get_read_db.
+
+    A background task measures each replica's replay lag; replicas within
+    READ_REPLICA_MAX_LAG_SECONDS are used round-robin, and reads fall back to the
+    primary when none is (or before the first check).
+    """
+
+    def __init__(
+        self,
+        urls: list[str] = settings.READ_REPLICA_URLS,
+        max_lag_seconds: float = settings.READ_REPLICA_MAX_LAG_SECONDS,
+        interval_seconds: int = settings.READ_REPLICA_CHECK_INTERVAL_SECONDS
+    ):
+        self.max_lag_seconds = max_lag_seconds
+        self.interval_seconds = interval_seconds
+        self.replicas: list[_Replica] = []
+        for i, url in enumerate(urls):
+            replica_engine = _create_engine(
+                f"replica-{i}",
+                url,
+                # Replicas may also sit behind a transaction pooler
+                connect_args={
+                    "prepared_statement_cache_size": 0,
+                    "server_settings": _SERVER_SETTINGS
+                }
+            )
+            self.replicas.append(_Replica(
+                name=f"replica-{i}",
+                engine=replica_engine,
+                session=async_sessionmaker(replica_engine, class_=AsyncSession, expire_on_commit=False)
+            ))
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def pick(self) -> Optional[async_sessionmaker]:
+        """Session factory of the next healthy replica, or None to use the primary."""
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        self._next += 1
+        return healthy[self._next % len(healthy)].session
+
+    @staticmethod
+    async def _lag(replica: _Replica) -> Optional[float]:
+        async with replica.engine.connect() as conn:
+            return await conn.scalar(_REPLICA_LAG_SQL)
+
+    async def _check(self, replica: _Replica):
+        try:
+            lag = await asyncio.wait_for(self._lag(replica), timeout=max(1, self.interval_seconds))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if replica.healthy:
+                logger.warning(f"Read replica {replica.name} unavailable: {e}")
+            replica.healthy, replica.lag_seconds, replica.error = False, None, str(e)
+            return
+        replica.lag_seconds = float(lag) if lag is not None else None
+        replica.error = None if lag is not None else "WAL receiver not streaming"
+        healthy = replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag_seconds
+        if replica.healthy and not healthy:
+            detail = f"{replica.lag_seconds}s" if replica.lag_seconds is not None else replica.error
+            logger.warning(f"Read replica {replica.name} lagging ({detail}), using primary")
+        replica.healthy = healthy
+
+    async def check(self):
+        """Measure the lag of every replica once."""
+        await asyncio.gather(*(self._check(r) for r in self.replicas))
+
+    async def _loop(self):
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        """Start lag monitoring (no-op without replicas)."""
+        if self._task is None and self.replicas:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"Monitoring {len(self.replicas)} read replica(s)")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def snapshot(self) -> list[dict]:
+        return [
+            {"name": r.name, "healthy": r.healthy, "lag_seconds": r.lag_seconds, "error": r.error}
+            for r in self.replicas
+        ]
+
+
+# Singleton instance
+_read_replicas: Optional[ReadReplicas] = None
+
+
+def get_read_replicas() -> ReadReplicas:
+    """Get or create the read replica set."""
+    global _read_replicas
+    if _read_replicas is None:
+        _read_replicas = ReadReplicas()
+    return _read_replicas
+
+
+async def get_read_db(request: Request) -> AsyncSession:
+    """
+    Dependency for read-only GET endpoints: a healthy replica when available.
+
+    Clients that recently wrote (see mark_read_primary) and requests made while
+    every replica lags are served by the direct/primary engine instead.
+    """
+    factory = None
+    if READ_PRIMARY_COOKIE not in request.cookies:
+        factory = get_read_replicas().pick()
+    async with (factory or direct_session)() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+def mark_read_primary(response: Response):
+    """Pin the client's reads to the primary long enough for replicas to catch up."""
+    if get_read_replicas().replicas:
+        response.set_cookie(
+            READ_PRIMARY_COOKIE, "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax"
+        )
+
+
+async def estimate_count(db: AsyncSession, table: str) -> int:
+    """Planner row estimate for a table (no scan; refreshed by autovacuum/ANALYZE)."""
+    result = await db.execute(
+        text("SELECT GREATEST(reltuples, 0)::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table}
+    )
+    return result.scalar() or 0
+
+
+async def estimate_query_count(db: AsyncSession, query) -> int:
+    """
+    Planner row estimate for a SELECT (EXPLAIN, nothing is executed).
+    Bound values are rendered as literals, so only use it with plain column filters.
+    """
+    conn = await db.connection()  # Connect first: literal escaping depends on server settings
+    compiled = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+    plan = result.scalar()
+    if isinstance(plan, str):  # asyncpg returns json as text
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+def pool_status() -> dict:
+    """Live occupancy plus checkout/connect metrics of every engine's pool."""
+    status = {}
+    for name, pooled_engine in _engines.items():
+        pool = pooled_engine.pool
+        status[name] = {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(0, pool.overflow()),
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            **(pool.stats.snapshot() if pool.stats else {})
+        }
+    return status
@@ -4,10 +4,22 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 # from app.database import init_db
+from app.database import get_read_replicas
 from app.routers.auth import router as auth_router
 from app.routers.lessons import router as lessons_router
 from app.routers.tts import router as tts_router
 from app.routers.admin import router as admin_router
+from app.routers.admin_storage import router as admin_storage_router
+from app.routers.metrics import router as metrics_router
+from app.routers.storage import router as storage_router
+from app.routers.audio import router as audio_router
+from app.routers.progress import router as progress_router
+from app.services.audio_disk_cache import get_audio_disk_cache
+from app.services.preview_pool import get_preview_pool
+from app.services.progress_buffer import get_progress_buffer
+from app.services.storage_maintenance import get_audio_cache_evictor
+from app.services.storage_service import get_storage_service
+from app.services.user_import import close_password_hash_pool
 
 settings = get_settings()
 
@@ -19,9 +31,23 @@ async def lifespan(app: FastAPI):
     # print("🚀 Starting Fast-Ingles API...")
     # await init_db()
     # print("✅ Database initialized")
+    await get_storage_service().ensure_bucket()
+    get_audio_disk_cache()  # Index the node-local audio cache before serving (AUDIO_URL_MODE="app" only)
+    if settings.PREVIEW_POOL_ENABLED:
+        get_preview_pool().start()
+    get_audio_cache_evictor().start()
+    get_read_replicas().start()
+    get_progress_buffer().start()
     yield
     # Shutdown
     print("👋 Shutting down...")
+    if settings.PREVIEW_POOL_ENABLED:
+        await get_preview_pool().stop()
+    await get_progress_buffer().stop()  # Flush buffered progress before exiting
+    await get_audio_cache_evictor().stop()
+    await get_read_replicas().stop()
+    get_storage_service().close()
+    close_password_hash_pool()
 
 
 app = FastAPI(
@@ -40,6 +66,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count"],  # Paginated admin listings
 )
 
 # Include routers
@@ -47,6 +74,11 @@ app.include_router(auth_router)
 app.include_router(lessons_router)
 app.include_router(tts_router)
 app.include_router(admin_router)
+app.include_router(admin_storage_router)
+app.include_router(metrics_router)
+app.include_router(storage_router)
+app.include_router(audio_router)
+app.include_router(progress_router)
 
 
 @app.get("/")
@@ -1,6 +1,7 @@
 from app.models.user import User
 from app.models.lesson import Lesson
 from app.models.progress import Progress
+from app.models.progress_stats import UserProgressStats, DayProgressStats
 from app.models.audio_cache import AudioCache
 
-__all__ = ["User", "Lesson", "Progress", "AudioCache"]
+__all__ = ["User", "Lesson", "Progress", "UserProgressStats", "DayProgressStats", "AudioCache"]
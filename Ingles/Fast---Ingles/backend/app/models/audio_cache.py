@@ -11,7 +11,7 @@ class AudioCache(Base):
     text_content = Column(Text, nullable=False)
     language = Column(String(10), nullable=False)  # 'en-US', 'es-ES'
     provider = Column(String(50), nullable=False)  # 'gemini', 'browser', etc.
-    minio_key = Column(String(500), nullable=False)  # Path in MinIO bucket
+    minio_key = Column(String(500), nullable=False, index=True)  # Path in MinIO bucket
     file_size = Column(Integer, nullable=True)
     duration_seconds = Column(Float, nullable=True)
     created_at = Column(DateTime, server_default=func.now())
@@ -14,6 +14,7 @@ class Lesson(Base):
     word_count = Column(Integer, nullable=False)
     ai_provider = Column(String, nullable=True)  # Which AI generated this
     ai_model = Column(String, nullable=True)
+    content_version = Column(Integer, nullable=False, default=1, server_default="1")  # Bumped on every content change
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, Boolean, DateTime, ForeignKey, Index, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -6,12 +7,18 @@ from app.database import Base
 class Progress(Base):
     """User progress tracking model."""
     __tablename__ = "progress"
+    __table_args__ = (
+        # Target of the progress upsert (ON CONFLICT (user_id, day_id))
+        UniqueConstraint("user_id", "day_id", name="progress_user_id_day_id_key"),
+        # Keyset for the delta sync feed (GET /api/progress/changes)
+        Index("idx_progress_user_updated", "user_id", "updated_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     day_id = Column(Integer, nullable=False)
     current_index = Column(Integer, default=0)
-    completed = Column(Integer, default=0)  # Boolean as int
+    completed = Column(Boolean, default=False)
     score = Column(Integer, default=0)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
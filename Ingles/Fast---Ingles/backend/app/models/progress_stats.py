@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class UserProgressStats(Base):
+    """
+    Per-learner progress aggregates.
+    Maintained by the apply_progress_stats trigger on progress (add_progress_stats.sql);
+    the API only reads it.
+    """
+    __tablename__ = "user_progress_stats"
+    
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    days_completed = Column(Integer, nullable=False, default=0)
+    current_streak = Column(Integer, nullable=False, default=0)  # Ends at last_completed_on
+    longest_streak = Column(Integer, nullable=False, default=0)
+    last_completed_on = Column(Date, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now())
+
+
+# Top-N and "my rank" (count of learners ahead) are range scans on this index
+Index("idx_user_progress_stats_rank", UserProgressStats.days_completed.desc(), UserProgressStats.user_id)
+
+
+class DayProgressStats(Base):
+    """Learners who started / completed each lesson day (trigger-maintained)."""
+    __tablename__ = "day_progress_stats"
+    
+    day_id = Column(Integer, primary_key=True)
+    learners_started = Column(Integer, nullable=False, default=0)
+    learners_completed = Column(Integer, nullable=False, default=0)
@@ -1,12 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import json
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, tuple_
 from typing import List, Optional
-from pydantic import BaseModel, EmailStr
+from datetime import datetime
+from uuid import UUID
+from pydantic import BaseModel, EmailStr, field_validator
 
-from app.database import get_db
+from app.database import estimate_count, estimate_query_count, get_db
 from app.models.user import User
 from app.schemas.user import UserResponse
+from app.services.user_import import (
+    ImportFormat,
+    export_users,
+    import_users,
+    normalize_email,
+    parse_import,
+    read_upload
+)
+from app.utils.cursors import InvalidCursor, decode_cursor, encode_cursor
 from app.utils.security import get_current_admin, get_password_hash
 
 router = APIRouter(prefix="/api/admin/users", tags=["Admin - Users"])
@@ -21,6 +36,8 @@ class AdminUserCreate(BaseModel):
     password: str
     role: str = "user"
 
+    _normalize_email = field_validator("email", mode="before")(normalize_email)
+
 
 class AdminUserUpdate(BaseModel):
     """Schema for admin updating a user."""
@@ -30,17 +47,67 @@ class AdminUserUpdate(BaseModel):
     role: Optional[str] = None
     status: Optional[str] = None
 
+    _normalize_email = field_validator("email", mode="before")(normalize_email)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 # --- Endpoints ---
 
 @router.get("", response_model=List[UserResponse])
 async def get_all_users(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    role: Optional[str] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    q: Optional[str] = Query(None, min_length=1, max_length=100),
     db: AsyncSession = Depends(get_db),
     current_admin: User = Depends(get_current_admin)
 ):
-    """Get all users (admin only)."""
-    result = await db.execute(select(User).order_by(User.created_at.desc()))
+    """
+    List users, newest first (admin only).
+
+    Keyset-paginated on (created_at, id): pass the X-Next-Cursor response header as
+    `cursor` to get the next page (absent on the last page). `q` matches a substring
+    of the name or email (trigram-indexed). X-Total-Count is the planner's estimate
+    of matching users, not an exact count.
+    """
+    query = select(User)
+    if role:
+        query = query.where(User.role == role)
+    if status_filter:
+        query = query.where(User.status == status_filter)
+    if q:
+        pattern = f"%{_escape_like(q.lower())}%"
+        query = query.where(or_(
+            func.lower(User.email).like(pattern, escape="\\"),
+            func.lower(User.name).like(pattern, escape="\\")
+        ))
+    
+    total = await (
+        estimate_query_count(db, query) if role or status_filter or q
+        else estimate_count(db, "users")
+    )
+    
+    if cursor:
+        try:
+            created_at, user_id = decode_cursor(cursor, datetime, UUID)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        query = query.where(tuple_(User.created_at, User.id) < tuple_(created_at, user_id))
+    
+    result = await db.execute(
+        query.order_by(User.created_at.desc(), User.id.desc()).limit(limit + 1)
+    )
     users = result.scalars().all()
+    if len(users) > limit:
+        users = users[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(users[-1].created_at, users[-1].id)
+    response.headers["X-Total-Count"] = str(total)
     return users
 
 
@@ -51,8 +118,8 @@ async def admin_create_user(
     current_admin: User = Depends(get_current_admin)
 ):
     """Create a new user (admin only)."""
-    # Check if email exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
+    # Check if email exists (case-insensitive, idx_users_email_lower)
+    result = await db.execute(select(User).where(func.lower(User.email) == user_data.email))
     if result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -74,6 +141,45 @@ async def admin_create_user(
     return user
 
 
+@router.post("/import")
+async def import_users_file(
+    file: UploadFile = File(...),
+    format: Optional[ImportFormat] = None,
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Create users in bulk from a CSV (header: name,email,password[,role]) or NDJSON file (admin only).
+
+    The format defaults to the file extension. Results stream back as NDJSON, one
+    line per input row ("created", "exists", "duplicate" or "invalid") as each
+    batch commits, followed by a summary line.
+    """
+    fmt = format or ("csv" if (file.filename or "").lower().endswith(".csv") else "ndjson")
+    try:
+        rows = parse_import(await read_upload(file), fmt)
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid import file: {e}")
+    
+    async def results():
+        async for result in import_users(rows):
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
+@router.get("/export")
+async def export_users_file(
+    format: ImportFormat = "ndjson",
+    current_admin: User = Depends(get_current_admin)
+):
+    """Download every user as NDJSON or CSV, streamed (admin only; no password hashes)."""
+    return StreamingResponse(
+        export_users(format),
+        media_type="text/csv" if format == "csv" else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="users.{format}"'}
+    )
+
+
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
@@ -115,8 +221,10 @@ async def admin_update_user(
         user.name = user_data.name
     if user_data.email is not None:
         # Check if new email is taken by another user
-        if user_data.email != user.email:
-            email_check = await db.execute(select(User).where(User.email == user_data.email))
+        if user_data.email != user.email.lower():
+            email_check = await db.execute(
+                select(User).where(func.lower(User.email) == user_data.email, User.id != user.id)
+            )
             if email_check.scalar_one_or_none():
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -0,0 +1,39 @@
+"""
+Admin Storage Router for Fast-Ingles.
+Maintenance operations on the audio cache and MinIO bucket.
+"""
+
+from dataclasses import asdict
+from fastapi import APIRouter, Depends
+
+from app.models.user import User
+from app.services.storage_maintenance import get_audio_cache_evictor, reconcile_audio_storage
+from app.utils.security import get_current_admin
+
+router = APIRouter(prefix="/api/admin/storage", tags=["Admin - Storage"])
+
+
+@router.post("/reconcile")
+async def reconcile_storage(
+    apply: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Compare audio_cache with MinIO and report (or fix, with apply=true)
+    dangling rows, orphaned objects and zero-size entries (admin only).
+    """
+    report = await reconcile_audio_storage(dry_run=not apply)
+    return {"summary": report.summary(), **asdict(report)}
+
+
+@router.post("/evict")
+async def evict_audio_cache(
+    apply: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Evict the least valuable audio (recency x frequency) until the cache fits
+    AUDIO_CACHE_BYTE_BUDGET; dry run unless apply=true (admin only).
+    """
+    report = await get_audio_cache_evictor().run(dry_run=not apply)
+    return {"summary": report.summary(), **asdict(report)}
@@ -0,0 +1,64 @@
+"""
+Audio Router for Fast-Ingles.
+Serves TTS audio through signed URLs, either by handing the transfer to nginx
+(X-Accel-Redirect) or from the node-local disk cache with a storage fallback.
+"""
+
+import time
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.config import get_settings
+from app.services.audio_disk_cache import get_audio_disk_cache
+from app.services.storage_service import (
+    AUDIO_PREFIXES,
+    AUDIO_ROUTE,
+    IMMUTABLE_AUDIO_PREFIXES,
+    get_storage_service
+)
+from app.utils.url_signing import verify
+
+settings = get_settings()
+router = APIRouter(prefix=AUDIO_ROUTE, tags=["Audio"])
+
+
+@router.get("/{key:path}")
+async def get_audio(key: str, sig: str, expires: Optional[int] = None):
+    """
+    Stream an audio object (URLs come from StorageService.get_audio_url).
+    Supports range requests; hot objects never leave the node.
+    """
+    immutable = key.startswith(IMMUTABLE_AUDIO_PREFIXES)
+    # Stable (non-expiring) links are only issued for immutable keys
+    if (expires is None and not immutable) or not verify(AUDIO_ROUTE, key, expires, sig):
+        raise HTTPException(status_code=403, detail="Invalid or expired signature")
+    if not key.startswith(AUDIO_PREFIXES):
+        raise HTTPException(status_code=404, detail="Audio not found")
+
+    headers = {
+        # Content-addressed audio never changes, so clients may keep it forever
+        "Cache-Control": settings.PUBLIC_AUDIO_CACHE_CONTROL if immutable
+        else f"private, max-age={max(0, expires - int(time.time()))}"
+    }
+    storage = get_storage_service()
+
+    if settings.AUDIO_ACCEL_REDIRECT:
+        # nginx streams the bytes (and handles Range); headers above are kept
+        headers["X-Accel-Redirect"] = await storage.internal_redirect(key)
+        return Response(media_type="audio/mpeg", headers=headers)
+
+    cache = get_audio_disk_cache()
+    path = storage.local_path(key)  # Local backend: already on disk
+    if path is None and cache is None:
+        # Disk cache disabled: proxy the object
+        if not await storage.object_exists(key):
+            raise HTTPException(status_code=404, detail="Audio not found")
+        return StreamingResponse(storage.stream_object(key), media_type="audio/mpeg", headers=headers)
+    if path is None:
+        path = await cache.fetch(key, storage.download_object)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Audio not found")
+
+    return FileResponse(path, media_type="audio/mpeg", headers=headers)
@@ -1,12 +1,18 @@
+import asyncio
 import logging
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Body
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Body, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
-from app.database import get_db, async_session
+from sqlalchemy import String, any_, bindparam, select, update, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import load_only
+from app.config import get_settings
+from app.database import get_db, get_read_db, mark_read_primary, async_session
 from app.models.lesson import Lesson
 from app.models.audio_cache import AudioCache
 from app.schemas.lesson import (
+    LessonCatalogPage,
     LessonResponse, 
     LessonPreviewRequest, 
     LessonUpdateRequest, 
@@ -14,15 +20,75 @@ from app.schemas.lesson import (
     LessonUpdateRequest, 
     WordEntry,
     LessonGenerateRequest,
-    SingleAudioRequest
+    SingleAudioRequest,
+    VocabularyLookupRequest
 )
 from app.services.ai_service import get_ai_service
-from app.services.storage_service import get_storage_service
+from app.services.metrics import get_audio_cache_stats
+from app.models.user import User
+from app.services.bundle_service import (
+    bundle_etag,
+    bundle_key,
+    bundle_prefix,
+    stream_lesson_bundle
+)
+from app.services.lesson_transfer import export_lessons, import_lessons, split_lines
+from app.services.preview_pool import get_preview_pool
+from app.services.storage_service import UploadItem, get_storage_service
 from app.services.tts_service import generate_tts_audio
+from app.services.vocabulary_index import get_vocabulary_index
+from app.utils.cursors import InvalidCursor, decode_cursor, encode_cursor
+from app.utils.security import get_current_admin
 
+settings = get_settings()
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/lessons", tags=["Lessons"])
 
+# Words of one lesson section (only that slice of the content array is returned).
+# Their audio is looked up separately by hash (StorageService.generate_text_hash),
+# so text canonicalization lives in Python only.
+_SECTION_WORDS_SQL = text("""
+    SELECT
+        jsonb_array_length(l.content::jsonb) AS total_words,
+        e.ord,
+        e.elem->>'word' AS word
+    FROM lessons l
+    LEFT JOIN LATERAL (
+        SELECT x.elem, x.ord
+        FROM jsonb_array_elements(l.content::jsonb) WITH ORDINALITY AS x(elem, ord)
+        WHERE x.ord > :start AND x.ord <= :end
+    ) e ON true
+    WHERE l.day_id = :day_id
+    ORDER BY e.ord
+""")
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check: "*" or any listed tag, compared weakly (W/ prefix ignored)."""
+    for candidate in (if_none_match or "").split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+def _section_bounds(section_id: int) -> tuple[int, Optional[int]]:
+    """
+    Word index range (start, end) of a lesson section; end None means "to the end".
+    Section 1: words 1-15, Section 2: words 16-30, Section 3: words 31-end.
+    """
+    if section_id == 1:
+        return 0, 15
+    if section_id == 2:
+        return 15, 30
+    if section_id == 3:
+        return 30, None
+    raise HTTPException(status_code=400, detail="Invalid section_id. Use 1, 2, or 3")
+
 
 @router.post("/generate-audio-single")
 async def generate_single_audio(
@@ -37,21 +103,17 @@ async def generate_single_audio(
     word = request.word
     lang = request.lang
     
-    # 1. Check/Delete broken cache (Self-Healing)
+    # 1. Check cache (rows pointing at missing objects are removed by the
+    #    storage reconciliation job, see app/services/storage_maintenance.py)
     text_hash = storage.generate_text_hash(word, lang)
     result = await db.execute(
         select(AudioCache).where(AudioCache.text_hash == text_hash)
     )
     existing_cache = result.scalar_one_or_none()
     
+    get_audio_cache_stats().record(hit=existing_cache is not None)
     if existing_cache:
-        if storage.object_exists(existing_cache.minio_key):
-             # Already exists and healthy
-             return {"status": "skipped", "key": existing_cache.minio_key}
-        else:
-            logger.warning(f"Self-Healing: Removing stale cache for '{word}'")
-            await db.delete(existing_cache)
-            await db.commit()  # Commit delete before inserting new entry
+        return {"status": "skipped", "key": existing_cache.minio_key}
 
     # 2. Generate Audio
     audio_data = await generate_tts_audio(word, lang)
@@ -86,67 +148,79 @@ async def generate_lesson_audios_task(content: List[dict], category: str, level:
     """
     Background task to generate audios for all words in the lesson.
     Generates MP3 using gTTS, uploads to MinIO, and caches in DB.
+    
+    Works per batch rather than per word: one DB query for existing cache rows,
+    one bulk existence check in MinIO for the rest, parallel synthesis and one bulk upload.
     """
     try:
         storage = get_storage_service()
         
-        count = 0
         async with async_session() as session:
+            # 1. Check which words already have audio in DB (one query for the whole lesson)
+            # One word per canonical hash: "Run" and "run " share a cache entry
+            keys = {}
+            words = []
+            seen_hashes = set()
             for entry in content:
-                try:
-                    word = entry.get("word")
-                    if not word:
-                        continue
-                        
-                    # 1. Check if audio exists in DB
-                    text_hash = storage.generate_text_hash(word, lang)
-                    result = await session.execute(
-                        select(AudioCache).where(AudioCache.text_hash == text_hash)
-                    )
-                    existing_cache = result.scalar_one_or_none()
-                    
-                    # SELF-HEALING LOGIC:
-                    should_generate = True
-                    if existing_cache:
-                        if storage.object_exists(existing_cache.minio_key):
-                            should_generate = False
-                        else:
-                            logger.warning(f"Self-Healing: Audio for '{word}' found in DB but missing in MinIO. Regenerating...")
-                            await session.delete(existing_cache)
-                    
-                    if not should_generate:
-                        continue 
-
-                    # 2. Generate Audio (gTTS)
-                    audio_data = await generate_tts_audio(word, lang)
-                    if not audio_data:
-                        logger.error(f"Failed to generate TTS for word: {word}")
-                        continue
-                    
-                    # 3. Upload to MinIO
-                    minio_key = await storage.upload_audio(
-                        audio_data, 
-                        word, 
-                        lang,
-                        type="word",
-                        category=category,
-                        level=level
-                    )
-                    
-                    # 4. Save to Cache DB
-                    cache_entry = AudioCache(
-                        text_hash=text_hash,
-                        text_content=word,
-                        language=lang,
-                        provider="gtts", 
-                        minio_key=minio_key,
-                        file_size=len(audio_data)
-                    )
-                    session.add(cache_entry)
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error processing word '{word}': {e}")
+                word = entry.get("word")
+                if not word or word in keys:
                     continue
+                keys[word] = storage.audio_key(word, lang, type="word", category=category, level=level)
+                if keys[word][0] not in seen_hashes:
+                    seen_hashes.add(keys[word][0])
+                    words.append(word)
+            result = await session.execute(
+                select(AudioCache).where(AudioCache.text_hash.in_([h for h, _ in keys.values()]))
+            )
+            cached_by_hash = {row.text_hash: row for row in result.scalars().all()}
+            
+            # Cached rows are trusted; dangling ones are cleaned up by the reconciliation job
+            pending = [word for word in words if keys[word][0] not in cached_by_hash]
+            get_audio_cache_stats().record(hit=True, count=len(words) - len(pending))
+            get_audio_cache_stats().record(hit=False, count=len(pending))
+            
+            # 2. One bulk existence check for the keys we are about to write
+            exists = await storage.exists_many([keys[word][1] for word in pending])
+            
+            # 3. Generate Audio (gTTS) for words that need it; keys are derived from the
+            #    text, so an existing object is the same audio and is reused
+            to_generate = [w for w in pending if not exists.get(keys[w][1])]
+            semaphore = asyncio.Semaphore(settings.STORAGE_BATCH_CONCURRENCY)
+            
+            async def synthesize(word: str):
+                async with semaphore:
+                    return await generate_tts_audio(word, lang)
+            
+            audio = dict(zip(to_generate, await asyncio.gather(*(synthesize(w) for w in to_generate))))
+            for word, data in audio.items():
+                if not data:
+                    logger.error(f"Failed to generate TTS for word: {word}")
+            
+            # 4. Upload to MinIO in one bulk call
+            metadata = storage.audio_metadata("word", category, level)
+            uploads = [
+                UploadItem(key=keys[w][1], data=data, metadata=metadata)
+                for w, data in audio.items() if data
+            ]
+            uploaded = {r.key for r in await storage.upload_many(uploads) if r.ok}
+            
+            # 5. Save to Cache DB
+            count = 0
+            for word in pending:
+                text_hash, key = keys[word]
+                data = audio.get(word)
+                reused = word not in audio  # Existing object, nothing synthesized
+                if not reused and key not in uploaded:
+                    continue
+                session.add(AudioCache(
+                    text_hash=text_hash,
+                    text_content=word,
+                    language=lang,
+                    provider="gtts", 
+                    minio_key=key,
+                    file_size=len(data) if data else None
+                ))
+                count += 1
             
             await session.commit()
             
@@ -156,33 +230,182 @@ async def generate_lesson_audios_task(content: List[dict], category: str, level:
         logger.error(f"Error in background audio generation: {e}")
 
 
+async def generate_audio_for_lessons(day_ids: List[int], lang: str = "en-US"):
+    """
+    Background task for bulk imports: word audio of many lessons, one lesson at a
+    time (its content loaded only while it is processed).
+    """
+    for day_id in day_ids:
+        async with async_session() as session:
+            result = await session.execute(
+                select(Lesson.content, Lesson.category).where(Lesson.day_id == day_id)
+            )
+            row = result.one_or_none()
+        if row is None:
+            continue
+        await generate_lesson_audios_task(row.content, row.category, day_id, lang)
+    logger.info(f"Bulk audio generation finished for {len(day_ids)} lessons.")
+
+
 @router.post("/preview", response_model=List[WordEntry])
 async def preview_lesson(
-    request: LessonPreviewRequest
+    request: LessonPreviewRequest,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate a preview of the lesson content using AI without saving to DB.
     Frontend calls this to get data, reviewer edits it, then calls PUT to save.
+    Popular combinations are served from the pre-generated preview pool.
+    
+    - exclude_existing: ask the AI to avoid words already used in other lessons
+    - reuse_existing: swap generated words that already exist for their saved entry
     """
-    ai_service = get_ai_service()
+    index = get_vocabulary_index()
+    content = None
     
-    try:
-        content = await ai_service.generate_lesson(
-            topic=request.topic,
-            # word_count is handled as 'count' in generate_lesson
-            count=request.word_count, 
-            category=request.category
+    # Pooled previews were generated without an exclusion list, so exclude_existing
+    # requests neither use the pool nor count toward which combinations it keeps warm
+    if settings.PREVIEW_POOL_ENABLED and not request.exclude_existing:
+        content = get_preview_pool().pop(
+            request.topic,
+            request.category,
+            request.word_count
         )
-        return content
-    except Exception as e:
-        logger.error(f"Error generating preview: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    if content is None:
+        ai_service = get_ai_service()
+        try:
+            exclude_words = None
+            if request.exclude_existing:
+                # Every category: a word taught anywhere must not come back
+                exclude_words = await index.known_words(db, limit=settings.VOCAB_EXCLUDE_MAX_WORDS)
+            content = await ai_service.generate_lesson(
+                topic=request.topic,
+                # word_count is handled as 'count' in generate_lesson
+                count=request.word_count, 
+                category=request.category,
+                exclude_words=exclude_words
+            )
+        except Exception as e:
+            logger.error(f"Error generating preview: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    if request.reuse_existing and content:
+        known = await index.lookup(db, [w["word"] for w in content])
+        content = [
+            known[w["word"]].entry if w["word"] in known and known[w["word"]].entry else w
+            for w in content
+        ]
+    
+    return content
+
+
+@router.post("/vocabulary/lookup")
+async def lookup_vocabulary(
+    request: VocabularyLookupRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Check which words already exist in saved lessons and which have audio.
+    Lets the editor flag repeats before saving a new lesson.
+    """
+    known = await get_vocabulary_index().lookup(db, request.words, request.lang)
+    return {
+        "known": [k.to_dict() for k in known.values()],
+        "missing": [w for w in request.words if w not in known]
+    }
+
+
+@router.get("", response_model=LessonCatalogPage)
+async def list_lessons(
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=500),
+    day_from: Optional[int] = None,
+    day_to: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Lesson catalog: metadata only, ordered by day_id (content is never loaded).
+
+    Pass `next_cursor` as `cursor` for the next page; `content_version` changes
+    whenever a lesson's words change, so clients can tell which days to refetch.
+    """
+    query = select(Lesson).options(load_only(
+        Lesson.day_id, Lesson.topic, Lesson.category, Lesson.word_count,
+        Lesson.updated_at, Lesson.content_version
+    ))
+    if day_from is not None:
+        query = query.where(Lesson.day_id >= day_from)
+    if day_to is not None:
+        query = query.where(Lesson.day_id <= day_to)
+    if cursor:
+        try:
+            (after_day_id,) = decode_cursor(cursor, int)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(Lesson.day_id > after_day_id)
+    
+    result = await db.execute(query.order_by(Lesson.day_id).limit(limit + 1))
+    lessons = result.scalars().all()
+    next_cursor = encode_cursor(lessons[limit - 1].day_id) if len(lessons) > limit else None
+    return LessonCatalogPage(items=lessons[:limit], next_cursor=next_cursor)
+
+
+@router.get("/export")
+async def export_all_lessons(current_admin: User = Depends(get_current_admin)):
+    """Download every lesson as NDJSON (the format accepted by POST /import)."""
+    return StreamingResponse(
+        export_lessons(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="lessons.ndjson"'}
+    )
+
+
+@router.post("/import")
+async def import_all_lessons(
+    request: Request,
+    response: Response,
+    background_tasks: BackgroundTasks,
+    generate_audio: bool = True,
+    dry_run: bool = False,
+    current_admin: User = Depends(get_current_admin)
+):
+    """
+    Create or update lessons from an NDJSON body (one lesson per line, upserted by day_id).
+
+    The body is read and validated line by line and written in batches of
+    LESSON_IMPORT_BATCH_SIZE; invalid lines are reported, not fatal. Word audio
+    for new and changed lessons is generated in one background job afterwards.
+    """
+    report = await import_lessons(split_lines(request.stream()), dry_run=dry_run)
+    
+    written_day_ids = report.changed_day_ids + report.relabeled_day_ids
+    if written_day_ids and not dry_run:
+        mark_read_primary(response)  # Read-your-writes: replicas may not have the import yet
+        # Index entries and bundled lesson.json carry the category too
+        get_vocabulary_index().invalidate()
+        storage = get_storage_service()
+        for day_id in written_day_ids:
+            await storage.delete_prefix(bundle_prefix(day_id))
+        if generate_audio and report.changed_day_ids:
+            background_tasks.add_task(generate_audio_for_lessons, report.changed_day_ids)
+    
+    return {
+        "dry_run": report.dry_run,
+        "lines": report.lines,
+        "created": report.created,
+        "updated": report.updated,
+        "relabeled": report.relabeled,
+        "unchanged": report.unchanged,
+        "invalid": report.invalid,
+        "errors": report.errors
+    }
 
 
 @router.get("/{day_id}", response_model=LessonResponse)
 async def get_lesson(
     day_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get lesson by day_id."""
     try:
@@ -204,7 +427,7 @@ async def get_lesson(
 async def get_lesson_section(
     day_id: int,
     section_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get a section of the lesson for optimized memory usage.
@@ -222,15 +445,10 @@ async def get_lesson_section(
         content = lesson.content or []
         total_words = len(content)
         
-        # Define section boundaries
-        if section_id == 1:
-            start, end = 0, 15
-        elif section_id == 2:
-            start, end = 15, 30
-        elif section_id == 3:
-            start, end = 30, total_words  # From 30 to end (adapts to any length)
-        else:
-            raise HTTPException(status_code=400, detail="Invalid section_id. Use 1, 2, or 3")
+        # Define section boundaries (section 3 adapts to any length)
+        start, end = _section_bounds(section_id)
+        if end is None:
+            end = total_words
         
         # Slice content
         section_content = content[start:end]
@@ -251,10 +469,116 @@ async def get_lesson_section(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/{day_id}/section/{section_id}/audio-manifest")
+async def get_section_audio_manifest(
+    day_id: int,
+    section_id: int,
+    lang: str = "en-US",
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Audio URL, byte size and duration for every word of a lesson section, in one response.
+    Lets the Player prefetch the whole section while the learner reads the first card.
+    Words without cached audio are returned with url=None (client falls back to TTS).
+    """
+    start, end = _section_bounds(section_id)
+    result = await db.execute(
+        _SECTION_WORDS_SQL,
+        {"day_id": day_id, "start": start, "end": end if end is not None else 2**31 - 1}
+    )
+    rows = result.mappings().all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    
+    storage = get_storage_service()
+    # Lesson exists but the section is empty -> single row with ord None
+    rows_with_words = [row for row in rows if row["ord"] is not None]
+    hashes = {row["ord"]: storage.generate_text_hash(row["word"] or "", lang) for row in rows_with_words}
+    audio = {}
+    if hashes:
+        audio_result = await db.execute(
+            select(AudioCache.text_hash, AudioCache.minio_key, AudioCache.file_size, AudioCache.duration_seconds)
+            .where(AudioCache.text_hash == any_(bindparam("hashes", list(set(hashes.values())), type_=ARRAY(String))))
+        )
+        audio = {row.text_hash: row for row in audio_result.all()}
+    
+    keys = list({row.minio_key for row in audio.values()})
+    urls = dict(zip(keys, await asyncio.gather(*(storage.get_audio_url(k) for k in keys))))
+    items = []
+    for row in rows_with_words:
+        cached = audio.get(hashes[row["ord"]])
+        items.append({
+            "index": row["ord"] - 1,
+            "word": row["word"],
+            "key": cached.minio_key if cached else None,
+            "url": urls.get(cached.minio_key) if cached else None,
+            "size": (cached.file_size or None) if cached else None,
+            "duration_seconds": cached.duration_seconds if cached else None
+        })
+    
+    return {
+        "day_id": day_id,
+        "section_id": section_id,
+        "lang": lang,
+        "total_words": rows[0]["total_words"],
+        "items": items,
+        "missing": sum(1 for item in items if item["url"] is None)
+    }
+
+
+@router.get("/{day_id}/bundle")
+async def get_lesson_bundle(
+    day_id: int,
+    request: Request,
+    lang: str = "en-US",
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    Download a whole day for offline use: one ZIP with lesson.json and every word's MP3.
+    
+    Served with an ETag; the built archive is cached in MinIO under bundles/day_{day_id}/
+    and rebuilt when the lesson content or its available audio changes.
+    """
+    result = await db.execute(select(Lesson).where(Lesson.day_id == day_id))
+    lesson = result.scalar_one_or_none()
+    if not lesson:
+        raise HTTPException(status_code=404, detail="Lesson not found")
+    
+    storage = get_storage_service()
+    words = [entry.get("word") for entry in lesson.content or [] if entry.get("word")]
+    hashes = {word: storage.generate_text_hash(word, lang) for word in words}
+    audio_result = await db.execute(
+        select(AudioCache.text_hash, AudioCache.minio_key)
+        .where(AudioCache.text_hash.in_(set(hashes.values())))
+    )
+    key_by_hash = dict(audio_result.all())
+    audio_keys = {word: key_by_hash[h] for word, h in hashes.items() if h in key_by_hash}
+    
+    etag = bundle_etag(lesson, audio_keys)
+    headers = {
+        "ETag": f'"{etag}"',
+        "Cache-Control": "no-cache",
+        "Content-Disposition": f'attachment; filename="day_{day_id}.zip"'
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    
+    key = bundle_key(day_id, etag)
+    if await storage.object_exists(key):
+        return StreamingResponse(storage.stream_object(key), media_type="application/zip", headers=headers)
+    
+    return StreamingResponse(
+        stream_lesson_bundle(lesson, audio_keys, cache_key=key),
+        media_type="application/zip",
+        headers=headers
+    )
+
+
 @router.put("/{day_id}", response_model=LessonResponse)
 async def update_lesson(
     day_id: int, 
     request: LessonUpdateRequest,
+    response: Response,
     generate_audio: bool = True,
     db: AsyncSession = Depends(get_db),
     background_tasks: BackgroundTasks = BackgroundTasks()
@@ -271,9 +595,13 @@ async def update_lesson(
         # Serialize content
         content_json = [w.dict() for w in request.content]
         
+        content_changed = True
         if lesson:
+            content_changed = lesson.content != content_json
             # Update existing
             lesson.content = content_json
+            if content_changed:
+                lesson.content_version = Lesson.content_version + 1  # Atomic in SQL
             if request.topic:
                 lesson.topic = request.topic
             if request.category:
@@ -295,6 +623,10 @@ async def update_lesson(
         
         await db.commit()
         await db.refresh(lesson)
+        mark_read_primary(response)  # Read-your-writes: replicas may not have the update yet
+        get_vocabulary_index().invalidate()
+        if content_changed:
+            await get_storage_service().delete_prefix(bundle_prefix(day_id))
         
         # Trigger Background Task ONLY if requested
         if generate_audio:
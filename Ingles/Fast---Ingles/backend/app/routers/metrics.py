@@ -0,0 +1,32 @@
+"""
+Metrics Router for Fast-Ingles.
+Exposes in-process operational metrics to admins.
+"""
+
+from fastapi import APIRouter, Depends
+
+from app.database import get_read_replicas, pool_status
+from app.models.user import User
+from app.services.audio_disk_cache import get_audio_disk_cache
+from app.services.metrics import get_llm_metrics
+from app.services.preview_pool import get_preview_pool
+from app.services.progress_buffer import get_progress_buffer
+from app.services.storage_maintenance import get_audio_cache_evictor
+from app.utils.security import get_current_admin
+
+router = APIRouter(prefix="/api/admin/metrics", tags=["Admin - Metrics"])
+
+
+@router.get("")
+async def get_metrics(current_admin: User = Depends(get_current_admin)):
+    """Get rolling metrics for this API worker (admin only)."""
+    disk_cache = get_audio_disk_cache()
+    return {
+        "llm": get_llm_metrics().snapshot(),
+        "preview_pool": get_preview_pool().stats(),
+        "audio_cache": get_audio_cache_evictor().snapshot(),
+        "audio_disk_cache": disk_cache.snapshot() if disk_cache else None,
+        "db_pool": pool_status(),
+        "read_replicas": get_read_replicas().snapshot(),
+        "progress_buffer": get_progress_buffer().snapshot()
+    }
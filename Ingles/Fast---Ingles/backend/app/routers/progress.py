@@ -0,0 +1,276 @@
+"""
+Progress Router for Fast-Ingles.
+Learner position and completion per lesson day, written through the
+write-behind buffer in app/services/progress_buffer.py.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import func, literal_column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.database import estimate_count, get_db, get_read_db
+from app.models.progress import Progress
+from app.models.progress_stats import DayProgressStats, UserProgressStats
+from app.models.user import User
+from app.schemas.lesson import ProgressUpdate, UserProgressResponse
+from app.services.progress_buffer import PendingProgress, get_progress_buffer
+from app.utils.cursors import InvalidCursor, decode_cursor, encode_cursor
+from app.utils.security import get_current_user
+
+settings = get_settings()
+router = APIRouter(prefix="/api/progress", tags=["Progress"])
+
+
+# Column order of the rows in a /changes response
+CHANGES_FIELDS = ["day_id", "current_index", "completed", "score", "updated_at"]
+
+
+class ProgressChanges(BaseModel):
+    """Rows changed after a cursor, as arrays in CHANGES_FIELDS order."""
+    fields: List[str]
+    rows: List[list]
+    cursor: Optional[str]
+    has_more: bool
+
+
+class ProgressStatsResponse(BaseModel):
+    """Dashboard summary of the current learner."""
+    days_completed: int
+    current_streak: int
+    longest_streak: int
+    last_completed_on: Optional[date]
+    rank: Optional[int]  # None until the first completed day
+    learners: int  # Estimated number of ranked learners
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    name: Optional[str]
+    photo_url: Optional[str]
+    days_completed: int
+    current_streak: int
+    longest_streak: int
+
+
+class DayStatsResponse(BaseModel):
+    day_id: int
+    learners_started: int
+    learners_completed: int
+
+
+class ProgressAccepted(BaseModel):
+    """Acknowledgement of a buffered progress update."""
+    day_id: int
+    current_index: int
+    completed: bool
+    updated_at: datetime
+
+
+def _live_streak(stats: UserProgressStats) -> int:
+    """Stored streak, or 0 once a whole UTC day has passed without a completion."""
+    today = datetime.now(timezone.utc).date()
+    if stats.last_completed_on is None or stats.last_completed_on < today - timedelta(days=1):
+        return 0
+    return stats.current_streak
+
+
+def _merge(row: Optional[Progress], pending: Optional[PendingProgress]) -> dict:
+    """Stored row overlaid with this worker's unflushed update."""
+    merged = {"day_id": (pending or row).day_id, "current_index": 0, "completed": False, "score": 0, "updated_at": None}
+    if row:
+        merged.update(
+            current_index=row.current_index or 0,
+            completed=bool(row.completed),
+            score=row.score or 0,
+            updated_at=row.updated_at
+        )
+    if pending:
+        merged.update(
+            current_index=pending.current_index,
+            completed=merged["completed"] or pending.completed,
+            updated_at=pending.updated_at
+        )
+    return merged
+
+
+@router.get("", response_model=List[UserProgressResponse])
+async def get_my_progress(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Progress of the current user for every day they have started."""
+    result = await db.execute(
+        select(Progress).where(Progress.user_id == current_user.id).order_by(Progress.day_id)
+    )
+    rows = {row.day_id: row for row in result.scalars().all()}
+    pending = get_progress_buffer().pending_for(current_user.id)
+    return [_merge(rows.get(day_id), pending.get(day_id)) for day_id in sorted(rows.keys() | pending.keys())]
+
+
+@router.get("/changes", response_model=ProgressChanges)
+async def get_progress_changes(
+    since: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Progress rows of the current user modified after `since` (delta sync across devices).
+
+    Pass the returned `cursor` as `since` on the next call (omit it for a full sync);
+    an unchanged device gets an empty `rows` list and the same cursor back. Rows are
+    ordered by (updated_at, id), served by idx_progress_user_updated. Updates still
+    in a worker's write-behind buffer appear once flushed.
+
+    Rows written in the last PROGRESS_SYNC_SETTLE_SECONDS are returned but not
+    passed by the cursor: a concurrent transaction may still commit an older
+    updated_at, so they are sent again on the next call (clients upsert by day_id).
+    """
+    query = select(
+        Progress,
+        (Progress.updated_at > literal_column(
+            f"now() - interval '{int(settings.PROGRESS_SYNC_SETTLE_SECONDS)} seconds'"
+        )).label("settling")
+    ).where(Progress.user_id == current_user.id)
+    if since:
+        try:
+            since_at, since_id = decode_cursor(since, datetime, int)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(tuple_(Progress.updated_at, Progress.id) > tuple_(since_at, since_id))
+    result = await db.execute(query.order_by(Progress.updated_at, Progress.id).limit(limit + 1))
+    page = result.all()
+    has_more = len(page) > limit
+    page = page[:limit]
+    
+    cursor = since
+    for row, settling in page:
+        if settling:
+            has_more = False  # Everything after is settling too; next sync picks it up
+            break
+        cursor = encode_cursor(row.updated_at, row.id)
+    return ProgressChanges(
+        fields=CHANGES_FIELDS,
+        rows=[
+            [row.day_id, row.current_index or 0, bool(row.completed), row.score or 0, row.updated_at]
+            for row, _ in page
+        ],
+        cursor=cursor,
+        has_more=has_more
+    )
+
+
+@router.get("/stats", response_model=ProgressStatsResponse)
+async def get_progress_stats(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Days completed, streaks and leaderboard rank of the current user (precomputed)."""
+    stats = await db.get(UserProgressStats, current_user.id)
+    rank = None
+    if stats and stats.days_completed > 0:
+        # Competition ranking: 1 + learners strictly ahead (idx_user_progress_stats_rank)
+        ahead = await db.scalar(
+            select(func.count()).where(UserProgressStats.days_completed > stats.days_completed)
+        )
+        rank = ahead + 1
+    return ProgressStatsResponse(
+        days_completed=stats.days_completed if stats else 0,
+        current_streak=_live_streak(stats) if stats else 0,
+        longest_streak=stats.longest_streak if stats else 0,
+        last_completed_on=stats.last_completed_on if stats else None,
+        rank=rank,
+        learners=await estimate_count(db, "user_progress_stats")
+    )
+
+
+@router.get("/leaderboard", response_model=List[LeaderboardEntry])
+async def get_leaderboard(
+    limit: int = Query(10, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Top learners by days completed (index scan over user_progress_stats)."""
+    result = await db.execute(
+        select(UserProgressStats, User.name, User.photo_url)
+        .join(User, User.id == UserProgressStats.user_id)
+        .where(UserProgressStats.days_completed > 0)
+        .order_by(UserProgressStats.days_completed.desc(), UserProgressStats.user_id)
+        .limit(limit)
+    )
+    entries = []
+    for position, (stats, name, photo_url) in enumerate(result.all(), start=1):
+        tied = entries and entries[-1].days_completed == stats.days_completed
+        entries.append(LeaderboardEntry(
+            rank=entries[-1].rank if tied else position,
+            name=name,
+            photo_url=photo_url,
+            days_completed=stats.days_completed,
+            current_streak=_live_streak(stats),
+            longest_streak=stats.longest_streak
+        ))
+    return entries
+
+
+@router.get("/days", response_model=List[DayStatsResponse])
+async def get_day_stats(
+    day_from: Optional[int] = None,
+    day_to: Optional[int] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Learners who started and completed each day (precomputed per day)."""
+    query = select(DayProgressStats).order_by(DayProgressStats.day_id)
+    if day_from is not None:
+        query = query.where(DayProgressStats.day_id >= day_from)
+    if day_to is not None:
+        query = query.where(DayProgressStats.day_id <= day_to)
+    result = await db.execute(query)
+    return result.scalars().all()
+
+
+@router.get("/{day_id}", response_model=UserProgressResponse)
+async def get_day_progress(
+    day_id: int,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Progress of the current user for one day."""
+    pending = get_progress_buffer().pending_for(current_user.id).get(day_id)
+    result = await db.execute(
+        select(Progress).where(Progress.user_id == current_user.id, Progress.day_id == day_id)
+    )
+    row = result.scalar_one_or_none()
+    if row is None and pending is None:
+        raise HTTPException(status_code=404, detail="No progress for this day")
+    return _merge(row, pending)
+
+
+@router.put("/{day_id}", response_model=ProgressAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def update_day_progress(
+    day_id: int,
+    update: ProgressUpdate,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Report the learner's position in a day (called on every card flip).
+
+    The update is buffered and written with the next flush; `completed=true`
+    is written immediately.
+    """
+    if update.current_index < 0:
+        raise HTTPException(status_code=400, detail="current_index must be >= 0")
+    entry = await get_progress_buffer().update(
+        current_user.id, day_id, update.current_index, update.completed
+    )
+    return ProgressAccepted(
+        day_id=day_id,
+        current_index=entry.current_index,
+        completed=entry.completed,
+        updated_at=entry.updated_at
+    )
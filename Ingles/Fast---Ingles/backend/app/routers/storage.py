@@ -0,0 +1,42 @@
+"""
+Storage Router for Fast-Ingles.
+Serves objects of the local storage backend through signed, expiring URLs.
+"""
+
+import mimetypes
+import time
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse
+
+from app.config import get_settings
+from app.services.storage_backends import LOCAL_STORAGE_ROUTE
+from app.services.storage_service import PUBLIC_DICTIONARY_PREFIX, get_storage_service
+from app.utils.url_signing import verify
+
+settings = get_settings()
+router = APIRouter(prefix=LOCAL_STORAGE_ROUTE, tags=["Storage"])
+
+
+@router.get("/{key:path}")
+async def get_object(key: str, expires: Optional[int] = None, sig: Optional[str] = None):
+    """
+    Download an object stored on this node (STORAGE_BACKEND=local).
+    URLs come from StorageService.get_presigned_url and expire like MinIO presigned URLs;
+    with PUBLIC_DICTIONARY_ENABLED, dictionary words are public and need no signature.
+    """
+    public = settings.PUBLIC_DICTIONARY_ENABLED and key.startswith(PUBLIC_DICTIONARY_PREFIX)
+    if public:
+        cache_control = settings.PUBLIC_AUDIO_CACHE_CONTROL
+    elif expires is None or sig is None or not verify(LOCAL_STORAGE_ROUTE, key, expires, sig):
+        raise HTTPException(status_code=403, detail="Invalid or expired signature")
+    else:
+        cache_control = f"private, max-age={max(0, expires - int(time.time()))}"
+    
+    path = get_storage_service().local_path(key)
+    if not path:
+        raise HTTPException(status_code=404, detail="Object not found")
+    
+    media_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+    return FileResponse(path, media_type=media_type, headers={"Cache-Control": cache_control})
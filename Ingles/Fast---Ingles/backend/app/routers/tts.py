@@ -10,9 +10,10 @@ from pydantic import BaseModel
 from typing import Optional
 import logging
 
-from app.database import get_db
+from app.database import get_db, get_direct_db, get_read_db
 from app.models.audio_cache import AudioCache
 from app.services.storage_service import get_storage_service, StorageService
+from app.services.metrics import get_audio_cache_stats
 from app.config import get_settings
 
 settings = get_settings()
@@ -38,7 +39,8 @@ class TTSResponse(BaseModel):
 @router.post("/speak", response_model=TTSResponse)
 async def generate_speech(
     request: TTSRequest,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db),
+    read_db: AsyncSession = Depends(get_direct_db)
 ):
     """
     Generate or retrieve cached TTS audio.
@@ -49,14 +51,17 @@ async def generate_speech(
     storage = get_storage_service()
     text_hash = storage.generate_text_hash(request.text, request.language)
     
-    # Check cache in database
-    result = await db.execute(
+    # Check cache in database (hot read path, see get_direct_db)
+    result = await read_db.execute(
         select(AudioCache).where(AudioCache.text_hash == text_hash)
     )
     cached = result.scalar_one_or_none()
+    await read_db.close()  # Release the read connection before writing through db
+    cache_stats = get_audio_cache_stats()
     
     if cached:
-        # Update access stats
+        cache_stats.record(hit=True)
+        # Update access stats (recency/frequency drive cache eviction)
         await db.execute(
             update(AudioCache)
             .where(AudioCache.id == cached.id)
@@ -65,7 +70,7 @@ async def generate_speech(
         await db.commit()
         
         # Return cached audio URL
-        url = storage.get_presigned_url(cached.minio_key)
+        url = await storage.get_audio_url(cached.minio_key)
         return TTSResponse(
             url=url,
             cached=True,
@@ -78,10 +83,11 @@ async def generate_speech(
         # Try to find pre-generated audio in global dictionary
         potential_key = storage.derive_global_key(request.text, request.language)
         
-        if potential_key and storage.object_exists(potential_key):
+        if potential_key and await storage.object_exists(potential_key):
             # Found audio in MinIO, return presigned URL
             logger.info(f"TTS: Found existing audio in MinIO for '{request.text}' -> {potential_key}")
-            url = storage.get_presigned_url(potential_key)
+            cache_stats.record(hit=True)
+            url = await storage.get_audio_url(potential_key)
             
             # Optionally update/create cache entry for future lookups
             try:
@@ -106,6 +112,7 @@ async def generate_speech(
             )
         
         # No audio found in MinIO, fallback to browser TTS
+        cache_stats.record(hit=False)
         logger.info(f"TTS: No audio found for '{request.text}', falling back to browser TTS")
         return TTSResponse(
             url=f"BROWSER_TTS::{request.text}::{request.language}",
@@ -115,6 +122,7 @@ async def generate_speech(
         )
     
     # Generate with AI (Gemini TTS)
+    cache_stats.record(hit=False)
     try:
         # TODO: Implement Gemini TTS generation
         # For now, return placeholder
@@ -140,7 +148,7 @@ async def generate_speech(
             db.add(cache_entry)
             await db.commit()
             
-            url = storage.get_presigned_url(minio_key)
+            url = await storage.get_audio_url(minio_key)
             return TTSResponse(
                 url=url,
                 cached=False,
@@ -166,7 +174,7 @@ async def generate_speech(
 @router.get("/status/{text_hash}")
 async def get_audio_status(
     text_hash: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Check if audio exists in cache."""
     result = await db.execute(
@@ -178,7 +186,7 @@ async def get_audio_status(
         storage = get_storage_service()
         return {
             "exists": True,
-            "url": storage.get_presigned_url(cached.minio_key),
+            "url": await storage.get_audio_url(cached.minio_key),
             "language": cached.language,
             "provider": cached.provider,
             "access_count": cached.access_count
@@ -36,6 +36,14 @@ class LessonPreviewRequest(BaseModel):
     word_count: int = 50
     provider: Optional[str] = None
     model: Optional[str] = None
+    exclude_existing: bool = False  # Ask the AI to avoid words already in other lessons
+    reuse_existing: bool = False  # Replace generated words that already exist with the saved entry
+
+
+class VocabularyLookupRequest(BaseModel):
+    """Schema for checking which words already exist in lessons / audio cache."""
+    words: List[str]
+    lang: str = "en-US"
 
 
 class LessonUpdateRequest(BaseModel):
@@ -65,11 +73,31 @@ class LessonResponse(BaseModel):
     ai_model: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    content_version: Optional[int] = None
     
     class Config:
         from_attributes = True
 
 
+class LessonCatalogEntry(BaseModel):
+    """Lesson metadata without its content (GET /api/lessons)."""
+    day_id: int
+    topic: str
+    category: Optional[str] = None
+    word_count: int
+    updated_at: Optional[datetime] = None
+    content_version: int
+    
+    class Config:
+        from_attributes = True
+
+
+class LessonCatalogPage(BaseModel):
+    """One keyset page of the lesson catalog."""
+    items: List[LessonCatalogEntry]
+    next_cursor: Optional[str] = None
+
+
 class UserProgressResponse(BaseModel):
     day_id: int
     current_index: int
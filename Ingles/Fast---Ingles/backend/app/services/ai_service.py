@@ -6,7 +6,15 @@ Supports: Google Gemini, Anthropic Claude, OpenAI ChatGPT, DeepSeek
 from typing import Literal, Optional
 from dataclasses import dataclass
 import json
+import logging
 import re
+import time
+
+from app.config import get_settings
+from app.services.metrics import LLMCallMetric, estimate_cost, get_llm_metrics
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -28,6 +36,16 @@ class WordEntry:
         }
 
 
+@dataclass
+class LLMResponse:
+    """Raw provider output plus usage information."""
+    text: str
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    time_to_first_token: Optional[float] = None
+    truncated: bool = False  # Output stopped at the token limit
+
+
 class AIService:
     """Multi-provider AI service for content generation."""
     
@@ -48,6 +66,11 @@ Ensure:
 2. Exactly 5 sentences per word.
 3. Mnemonic must be in Spanish.
 4. Sentences should be simple and use the target word clearly.
+"""
+
+    EXCLUDE_TEMPLATE = """
+5. Do NOT use any of these words (they are already taught in other lessons):
+{words}
 """
 
     def __init__(
@@ -65,9 +88,17 @@ Ensure:
         self,
         topic: str,
         category: str,
-        count: int = 50
+        count: int = 50,
+        exclude_words: Optional[list[str]] = None
     ) -> list[dict]:
-        """Generate vocabulary lesson using the configured AI provider."""
+        """
+        Generate vocabulary lesson using the configured AI provider.
+        
+        Args:
+            exclude_words: Words the model must not return (e.g. already in other lessons).
+                Truncated to VOCAB_EXCLUDE_MAX_WORDS to keep the prompt small, so pass
+                the most relevant words first.
+        """
         import random
         # Inject random seed to avoid deterministic repetition
         seed = random.randint(1000, 9999)
@@ -77,28 +108,73 @@ Ensure:
             category=category,
             topic=f"{topic} (Variant {seed})"
         )
+        if exclude_words:
+            prompt += self.EXCLUDE_TEMPLATE.format(
+                words=", ".join(exclude_words[:settings.VOCAB_EXCLUDE_MAX_WORDS])
+            )
         
+        started = time.perf_counter()
+        response: Optional[LLMResponse] = None
         try:
             if self.provider == "gemini":
-                response = await self._generate_gemini(prompt)
+                response = await self._generate_gemini(prompt, started)
             elif self.provider == "claude":
-                response = await self._generate_claude(prompt)
+                response = await self._generate_claude(prompt, started)
             elif self.provider == "chatgpt":
-                response = await self._generate_openai(prompt)
+                response = await self._generate_openai(prompt, started)
             elif self.provider == "deepseek":
-                response = await self._generate_deepseek(prompt)
+                response = await self._generate_deepseek(prompt, started)
             else:
                 raise ValueError(f"Unknown provider: {self.provider}")
             
             # Parse and convert to dictionaries for JSON serialization
-            entries = self._parse_response(response)
+            entries = self._parse_response(response.text)
+            self._record_metric(started, count, response, rows_parsed=len(entries))
             return [entry.to_dict() for entry in entries]
         except Exception as e:
-            print(f"AI Generation Error ({self.provider}): {e}")
+            logger.error(f"AI Generation Error ({self.provider}/{self.model}): {e}")
+            self._record_metric(started, count, response, error=e)
             raise
     
-    async def _generate_gemini(self, prompt: str) -> str:
-        """Generate content using Google Gemini."""
+    def _record_metric(
+        self,
+        started: float,
+        rows_requested: int,
+        response: Optional[LLMResponse],
+        rows_parsed: int = 0,
+        error: Optional[Exception] = None
+    ):
+        """Record latency, usage and parse results for one generation call."""
+        prompt_tokens = response.prompt_tokens if response else None
+        completion_tokens = response.completion_tokens if response else None
+        metric = LLMCallMetric(
+            provider=self.provider,
+            model=self.model,
+            success=error is None,
+            latency_seconds=round(time.perf_counter() - started, 4),
+            time_to_first_token_seconds=(
+                round(response.time_to_first_token, 4)
+                if response and response.time_to_first_token is not None else None
+            ),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            rows_requested=rows_requested,
+            rows_parsed=rows_parsed,
+            truncated=bool(response and response.truncated),
+            estimated_cost_usd=estimate_cost(self.model, prompt_tokens, completion_tokens),
+            error=f"{type(error).__name__}: {error}" if error else None
+        )
+        get_llm_metrics().record(metric)
+        logger.info(
+            f"LLM call provider={metric.provider} model={metric.model} ok={metric.success} "
+            f"latency={metric.latency_seconds}s ttft={metric.time_to_first_token_seconds}s "
+            f"tokens={metric.prompt_tokens}/{metric.completion_tokens} "
+            f"rows={metric.rows_parsed}/{metric.rows_requested}"
+            + (" TRUNCATED at token limit" if metric.truncated else "")
+        )
+    
+    async def _generate_gemini(self, prompt: str, started: float) -> LLMResponse:
+        """Generate content using Google Gemini (streamed to measure time-to-first-token)."""
         import google.generativeai as genai
         
         genai.configure(api_key=self.api_key)
@@ -108,40 +184,67 @@ Ensure:
             temperature=1.0, # High temp = more randomness
             top_p=0.95,
             top_k=40,
+            max_output_tokens=settings.GEMINI_MAX_OUTPUT_TOKENS,
         )
         
         model = genai.GenerativeModel(
             self.model,
             generation_config=generation_config
         )
-        response = await model.generate_content_async(prompt)
-        return response.text
+        response = await model.generate_content_async(prompt, stream=True)
+        
+        result = LLMResponse(text="")
+        chunks = []
+        async for chunk in response:
+            # chunk.text raises on chunks without a text part (finish-only, safety ratings)
+            candidate = chunk.candidates[0] if chunk.candidates else None
+            parts = candidate.content.parts if candidate and candidate.content else None
+            text = "".join(part.text for part in parts or [] if getattr(part, "text", None))
+            if text:
+                if result.time_to_first_token is None:
+                    result.time_to_first_token = time.perf_counter() - started
+                chunks.append(text)
+            if candidate and getattr(candidate.finish_reason, "name", None) == "MAX_TOKENS":
+                result.truncated = True
+            usage = getattr(chunk, "usage_metadata", None)
+            if usage:
+                result.prompt_tokens = usage.prompt_token_count
+                result.completion_tokens = usage.candidates_token_count
+        result.text = "".join(chunks)
+        return result
     
-    async def _generate_claude(self, prompt: str) -> str:
-        """Generate content using Anthropic Claude."""
+    async def _generate_claude(self, prompt: str, started: float) -> LLMResponse:
+        """Generate content using Anthropic Claude (streamed to measure time-to-first-token)."""
         import anthropic
         
         client = anthropic.AsyncAnthropic(api_key=self.api_key)
-        response = await client.messages.create(
+        result = LLMResponse(text="")
+        chunks = []
+        async with client.messages.stream(
             model=self.model,
-            max_tokens=8000,
+            max_tokens=settings.LLM_MAX_TOKENS,
             messages=[{"role": "user", "content": prompt}]
-        )
-        return response.content[0].text
+        ) as stream:
+            async for text in stream.text_stream:
+                if result.time_to_first_token is None:
+                    result.time_to_first_token = time.perf_counter() - started
+                chunks.append(text)
+            message = await stream.get_final_message()
+        
+        result.text = "".join(chunks)
+        result.prompt_tokens = message.usage.input_tokens
+        result.completion_tokens = message.usage.output_tokens
+        result.truncated = message.stop_reason == "max_tokens"
+        return result
     
-    async def _generate_openai(self, prompt: str) -> str:
+    async def _generate_openai(self, prompt: str, started: float) -> LLMResponse:
         """Generate content using OpenAI ChatGPT."""
         from openai import AsyncOpenAI
         
         client = AsyncOpenAI(api_key=self.api_key)
-        response = await client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=8000
-        )
-        return response.choices[0].message.content
+        return await self._stream_chat_completion(client, prompt, started)
     
-    async def _generate_deepseek(self, prompt: str) -> str:
+    async def _generate_deepseek(self, prompt: str, started: float) -> LLMResponse:
         """Generate content using DeepSeek (OpenAI-compatible API)."""
         from openai import AsyncOpenAI
         
@@ -149,12 +252,32 @@ Ensure:
             api_key=self.api_key,
             base_url="https://api.deepseek.com/v1"
         )
-        response = await client.chat.completions.create(
+        return await self._stream_chat_completion(client, prompt, started)
+    
+    async def _stream_chat_completion(self, client, prompt: str, started: float) -> LLMResponse:
+        """Stream an OpenAI-compatible chat completion, collecting usage from the final chunk."""
+        stream = await client.chat.completions.create(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=8000
+            max_tokens=settings.LLM_MAX_TOKENS,
+            stream=True,
+            stream_options={"include_usage": True}
         )
-        return response.choices[0].message.content
+        
+        result = LLMResponse(text="")
+        chunks = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                if result.time_to_first_token is None:
+                    result.time_to_first_token = time.perf_counter() - started
+                chunks.append(chunk.choices[0].delta.content)
+            if chunk.choices and chunk.choices[0].finish_reason == "length":
+                result.truncated = True
+            if chunk.usage:
+                result.prompt_tokens = chunk.usage.prompt_tokens
+                result.completion_tokens = chunk.usage.completion_tokens
+        result.text = "".join(chunks)
+        return result
     
     def _parse_response(self, text: str) -> list[WordEntry]:
         """Parse AI response into WordEntry list."""
@@ -186,8 +309,6 @@ Ensure:
         return entries
 
 
-from app.config import get_settings
-
 def get_ai_service(
     provider: Optional[str] = None,
     api_key: Optional[str] = None,
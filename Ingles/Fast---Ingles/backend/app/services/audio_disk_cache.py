@@ -0,0 +1,196 @@
+"""
+Audio Disk Cache for Fast-Ingles.
+Bounded, node-local LRU copy of audio objects so hot words are read from disk
+instead of being fetched from MinIO on every play.
+"""
+
+import asyncio
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from app.config import get_settings
+from app.services.metrics import CacheStats
+
+settings = get_settings()
+
+_TEMP_PREFIX = ".tmp-"
+
+
+class DiskLRUCache:
+    """
+    Read-through LRU cache of object bytes on local disk, keyed by object key.
+
+    Files are named by the hash of the key and written atomically (temp file +
+    rename), so readers never see partial data. Workers on the same node share the
+    directory: each keeps its own LRU index (rebuilt from the directory on startup,
+    and adopting files written by other workers on first read), and a file evicted
+    by another worker is simply a miss.
+    """
+
+    def __init__(
+        self,
+        root: str = settings.AUDIO_DISK_CACHE_DIR,
+        max_bytes: int = settings.AUDIO_DISK_CACHE_MAX_BYTES
+    ):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self.evictions = 0
+        # File path -> size, least recently used first
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._loading: dict[str, asyncio.Future] = {}
+        os.makedirs(root, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self):
+        """Index files left by earlier runs, oldest access first."""
+        files = []
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                if name.startswith(_TEMP_PREFIX):
+                    os.unlink(path)  # Interrupted write
+                    continue
+                files.append((stat.st_atime, path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._track(path, size)
+        self._unlink(self._pick_victims())
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.root, name[:2], name)
+
+    def _track(self, path: str, size: int):
+        self._size += size - self._entries.pop(path, 0)
+        self._entries[path] = size
+
+    def _forget(self, path: str):
+        self._size -= self._entries.pop(path, 0)
+
+    def _pick_victims(self) -> list[str]:
+        """Drop least recently used entries over the budget from the index (event loop only)."""
+        victims = []
+        while self._size > self.max_bytes and self._entries:
+            path, size = self._entries.popitem(last=False)
+            self._size -= size
+            self.evictions += 1
+            victims.append(path)
+        return victims
+
+    @staticmethod
+    def _unlink(paths: list[str]):
+        for path in paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+    def _write(self, key: str, data: bytes) -> str:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return path
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of the cached file (marks it most recently used), or None."""
+        path = self._path(key)
+        try:
+            size = os.stat(path).st_size
+        except FileNotFoundError:
+            self._forget(path)  # Never cached, or removed by another worker
+            return None
+        if path in self._entries:
+            self._entries.move_to_end(path)
+        else:
+            self._track(path, size)  # Written by another worker
+        return path
+
+    async def put(self, key: str, data: bytes) -> str:
+        """Store bytes for a key, evicting least recently used entries over the budget."""
+        path = await asyncio.to_thread(self._write, key, data)
+        self._track(path, len(data))
+        if self._size > self.max_bytes:
+            # The index is only touched on the event loop; the thread just deletes files
+            await asyncio.to_thread(self._unlink, self._pick_victims())
+        return path
+
+    async def fetch(self, key: str, loader: Callable[[str], Awaitable[Optional[bytes]]]) -> Optional[str]:
+        """
+        Path of the cached file, loading it with `loader` on a miss.
+
+        Concurrent misses for the same key share one load. Returns None when the
+        loader finds nothing (object missing upstream).
+        """
+        path = self.get(key)
+        if path:
+            self.stats.record(hit=True)
+            return path
+        self.stats.record(hit=False)
+
+        if key in self._loading:
+            return await asyncio.shield(self._loading[key])
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            data = await loader(key)
+            path = await self.put(key, data) if data is not None else None
+            future.set_result(path)
+            return path
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            del self._loading[key]
+
+    def invalidate(self, key: str):
+        """Drop a key (called when the object is overwritten or deleted)."""
+        path = self._path(key)
+        self._forget(path)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats.snapshot(),
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions
+        }
+
+
+# Singleton instance
+_audio_disk_cache: Optional[DiskLRUCache] = None
+
+
+def get_audio_disk_cache() -> Optional[DiskLRUCache]:
+    """
+    Get or create the audio disk cache. None when disabled, and unless
+    AUDIO_URL_MODE="app": presigned URLs never reach /api/audio, so nothing reads it.
+    """
+    global _audio_disk_cache
+    if _audio_disk_cache is None and settings.AUDIO_URL_MODE == "app" and settings.AUDIO_DISK_CACHE_MAX_BYTES > 0:
+        _audio_disk_cache = DiskLRUCache()
+    return _audio_disk_cache
@@ -0,0 +1,138 @@
+"""
+Lesson Bundle Service for Fast-Ingles.
+Builds a single ZIP (lesson JSON + every word's MP3) so the PWA can preload a whole day
+with one request. Bundles are streamed while being built and cached in MinIO afterwards.
+"""
+
+import io
+import json
+import hashlib
+import logging
+import tempfile
+import zipfile
+from typing import AsyncIterator, Optional
+
+from app.models.lesson import Lesson
+from app.services.storage_service import StorageService, get_storage_service
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_PREFIX = "bundles"
+# Bundles larger than this spill from memory to a temp file before the MinIO upload
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink that collects written bytes until drained."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def bundle_prefix(day_id: int) -> str:
+    """MinIO prefix holding every cached bundle version of a day."""
+    return f"{BUNDLE_PREFIX}/day_{day_id}/"
+
+
+def bundle_etag(lesson: Lesson, audio_keys: dict[str, str]) -> str:
+    """
+    Version of a bundle: changes when lesson content or its available audio changes.
+
+    Args:
+        lesson: Lesson being bundled
+        audio_keys: word -> MinIO key for the words that have audio
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(lesson.content, sort_keys=True, ensure_ascii=False).encode())
+    digest.update(json.dumps(sorted(audio_keys.items())).encode())
+    return digest.hexdigest()[:32]
+
+
+def bundle_key(day_id: int, etag: str) -> str:
+    return f"{bundle_prefix(day_id)}{etag}.zip"
+
+
+def _audio_filename(index: int, word: str) -> str:
+    slug = StorageService._slugify(word) or "word"
+    return f"audio/{index:03d}_{slug}.mp3"
+
+
+async def stream_lesson_bundle(
+    lesson: Lesson,
+    audio_keys: dict[str, str],
+    cache_key: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    Stream a ZIP with `lesson.json` and the MP3 of every word that has audio.
+
+    MP3s are already compressed so entries are STORED; only one MP3 is held in
+    memory at a time. When the stream completes, the bundle is uploaded to
+    `cache_key` so later requests are served straight from MinIO.
+    """
+    storage = get_storage_service()
+    sink = _ChunkSink()
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) if cache_key else None
+
+    def emit() -> bytes:
+        data = sink.drain()
+        if spool is not None:
+            spool.write(data)
+        return data
+
+    try:
+        audio_files: dict[str, str] = {}
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as zf:
+            for index, entry in enumerate(lesson.content or []):
+                word = entry.get("word")
+                key = audio_keys.get(word)
+                if not key:
+                    continue
+                data = await storage.download_object(key)
+                if data is None:
+                    continue
+                name = _audio_filename(index, word)
+                zf.writestr(name, data)
+                audio_files[word] = name
+                yield emit()
+
+            manifest = {
+                "day_id": lesson.day_id,
+                "topic": lesson.topic,
+                "category": lesson.category,
+                "word_count": lesson.word_count,
+                "content": lesson.content,
+                "audio": audio_files
+            }
+            zf.writestr(
+                "lesson.json",
+                json.dumps(manifest, ensure_ascii=False),
+                compress_type=zipfile.ZIP_DEFLATED
+            )
+        yield emit()
+
+        if spool is not None:
+            length = spool.tell()
+            spool.seek(0)
+            try:
+                await storage.upload_object(cache_key, spool, length, content_type="application/zip")
+            except Exception as e:
+                # The client already has the bundle; next request simply rebuilds it
+                logger.warning(f"Could not cache bundle {cache_key}: {e}")
+    except Exception as e:
+        logger.error(f"Error building bundle for day {lesson.day_id}: {e}")
+        raise
+    finally:
+        if spool is not None:
+            spool.close()
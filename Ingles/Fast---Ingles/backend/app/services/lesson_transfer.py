@@ -0,0 +1,251 @@
+"""
+Lesson Import/Export for Fast-Ingles.
+Moves the whole lesson catalog between environments as NDJSON (one lesson per
+line). Both directions work a bounded batch at a time, so memory does not grow
+with the number of lessons.
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import case, cast, func, or_, select
+from sqlalchemy.dialects.postgresql import JSONB, insert
+
+from app.config import get_settings
+from app.database import async_session
+from app.models.lesson import Lesson
+from app.schemas.lesson import WordEntry
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+EXPORT_FIELDS = ["day_id", "topic", "category", "ai_provider", "ai_model", "content_version", "content"]
+# Lessons per export page (each carries its full word list)
+_EXPORT_PAGE_SIZE = 50
+# Longest accepted NDJSON line; guards the line buffer against input without newlines
+MAX_LINE_BYTES = 10 * 1024 * 1024
+# Errors kept in the report; the rest are only counted
+_MAX_REPORTED_ERRORS = 100
+
+
+class LessonRecord(BaseModel):
+    """One line of a lesson import file (the export format; extra fields are ignored)."""
+    day_id: int
+    topic: str
+    category: Optional[str] = "mixed"
+    content: List[WordEntry]
+    ai_provider: Optional[str] = "import"
+    ai_model: Optional[str] = "import"
+
+
+@dataclass
+class LessonImportReport:
+    """Summary of a lesson import."""
+    dry_run: bool
+    lines: int = 0
+    created: int = 0
+    updated: int = 0  # Content changed (content_version bumped)
+    relabeled: int = 0  # Only topic/category changed (no new audio, but cached bundles are stale)
+    unchanged: int = 0
+    invalid: int = 0
+    errors: list[dict] = field(default_factory=list)
+    changed_day_ids: list[int] = field(default_factory=list)  # Created or content changed
+    relabeled_day_ids: list[int] = field(default_factory=list)
+
+    def error(self, line: int, message: str):
+        self.invalid += 1
+        if len(self.errors) < _MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def summary(self) -> str:
+        mode = "DRY RUN" if self.dry_run else "APPLIED"
+        return (
+            f"[{mode}] {self.lines} lines: {self.created} created, {self.updated} updated, "
+            f"{self.relabeled} relabeled, {self.unchanged} unchanged, {self.invalid} invalid"
+        )
+
+
+async def split_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[Optional[bytes]]:
+    """
+    Lines of a byte stream as they arrive (e.g. request.stream()).
+
+    A line longer than MAX_LINE_BYTES is yielded as None and the rest of it is
+    discarded up to the next newline, so the buffer stays bounded and the import
+    goes on with the following line.
+    """
+    buffer = b""
+    skipping = False
+    async for chunk in chunks:
+        if skipping:
+            newline = chunk.find(b"\n")
+            if newline < 0:
+                continue
+            chunk, skipping = chunk[newline + 1:], False
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line if len(line) <= MAX_LINE_BYTES else None
+        if len(buffer) > MAX_LINE_BYTES:
+            yield None
+            buffer, skipping = b"", True
+    if buffer:
+        yield buffer
+
+
+def _parse_line(line: bytes | str) -> LessonRecord:
+    """Validate one NDJSON line; raises ValueError with a readable message."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+    if not isinstance(record, dict):
+        raise ValueError("Expected a JSON object")
+    try:
+        return LessonRecord(**record)
+    except ValidationError as e:
+        raise ValueError("; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()))
+
+
+async def _preview_batch(session, batch: list[LessonRecord], report: LessonImportReport):
+    """Dry run: classify the batch against the stored lessons without writing."""
+    result = await session.execute(
+        select(Lesson.day_id, Lesson.topic, Lesson.category, Lesson.content)
+        .where(Lesson.day_id.in_([r.day_id for r in batch]))
+    )
+    stored = {row.day_id: row for row in result.all()}
+    for r in batch:
+        row = stored.get(r.day_id)
+        if row is None:
+            report.created += 1
+            report.changed_day_ids.append(r.day_id)
+        elif row.content != [w.model_dump() for w in r.content]:
+            report.updated += 1
+            report.changed_day_ids.append(r.day_id)
+        elif (row.topic, row.category) != (r.topic, r.category):
+            report.relabeled += 1
+            report.relabeled_day_ids.append(r.day_id)
+        else:
+            report.unchanged += 1
+
+
+async def _upsert_batch(batch: list[LessonRecord], report: LessonImportReport):
+    """
+    One INSERT ... ON CONFLICT (day_id) DO UPDATE for the batch. Identical rows
+    are not rewritten, and content_version only moves when the words changed.
+    """
+    async with async_session() as session:
+        if report.dry_run:
+            await _preview_batch(session, batch, report)
+            return
+        # Versions before the upsert tell content changes from topic/category edits
+        result = await session.execute(
+            select(Lesson.day_id, Lesson.content_version).where(Lesson.day_id.in_([r.day_id for r in batch]))
+        )
+        previous = dict(result.all())
+
+        stmt = insert(Lesson).values([
+            {
+                "day_id": r.day_id,
+                "topic": r.topic,
+                "category": r.category,
+                "content": [w.model_dump() for w in r.content],
+                "word_count": len(r.content),
+                "ai_provider": r.ai_provider,
+                "ai_model": r.ai_model
+            }
+            for r in batch
+        ])
+        content_changed = cast(Lesson.content, JSONB) != cast(stmt.excluded.content, JSONB)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Lesson.day_id],
+            set_={
+                "topic": stmt.excluded.topic,
+                "category": stmt.excluded.category,
+                "content": stmt.excluded.content,
+                "word_count": stmt.excluded.word_count,
+                "content_version": case(
+                    (content_changed, Lesson.content_version + 1),
+                    else_=Lesson.content_version
+                ),
+                "updated_at": func.now()
+            },
+            where=or_(
+                content_changed,
+                Lesson.topic.is_distinct_from(stmt.excluded.topic),
+                Lesson.category.is_distinct_from(stmt.excluded.category)
+            )
+        ).returning(Lesson.day_id, Lesson.content_version)
+        written = dict((await session.execute(stmt)).all())
+        await session.commit()
+
+    for r in batch:
+        if r.day_id not in written:
+            report.unchanged += 1
+        elif r.day_id not in previous:
+            report.created += 1
+            report.changed_day_ids.append(r.day_id)
+        elif written[r.day_id] != previous[r.day_id]:
+            report.updated += 1
+            report.changed_day_ids.append(r.day_id)
+        else:
+            report.relabeled += 1
+            report.relabeled_day_ids.append(r.day_id)
+
+
+async def import_lessons(
+    lines: AsyncIterator[Union[bytes, str, None]],
+    dry_run: bool = False,
+    batch_size: int = settings.LESSON_IMPORT_BATCH_SIZE
+) -> LessonImportReport:
+    """
+    Validate NDJSON lessons line by line and upsert them by day_id, one batch per
+    transaction. Invalid lines are reported and skipped; a day_id repeated in the
+    file keeps its last line; None stands for a line too long to read (see
+    split_lines). Audio is left to the caller (see changed_day_ids).
+    """
+    report = LessonImportReport(dry_run=dry_run)
+    batch: dict[int, LessonRecord] = {}
+    async for line in lines:
+        report.lines += 1
+        if line is None:
+            report.error(report.lines, f"Line longer than {MAX_LINE_BYTES} bytes")
+            continue
+        if not line.strip():
+            continue
+        try:
+            record = _parse_line(line)
+        except ValueError as e:
+            report.error(report.lines, str(e))
+            continue
+        batch.pop(record.day_id, None)
+        batch[record.day_id] = record
+        if len(batch) >= batch_size:
+            await _upsert_batch(list(batch.values()), report)
+            batch = {}
+    if batch:
+        await _upsert_batch(list(batch.values()), report)
+    logger.info(f"Lesson import finished: {report.summary()}")
+    return report
+
+
+async def export_lessons() -> AsyncIterator[str]:
+    """Stream every lesson as NDJSON in day_id order, one keyset page at a time."""
+    columns = [getattr(Lesson, name) for name in EXPORT_FIELDS]
+    after = None
+    while True:
+        query = select(*columns).order_by(Lesson.day_id).limit(_EXPORT_PAGE_SIZE)
+        if after is not None:
+            query = query.where(Lesson.day_id > after)
+        # Short session per page: no transaction stays open while the client reads
+        async with async_session() as session:
+            page = (await session.execute(query)).all()
+        if not page:
+            return
+        yield "".join(
+            json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n"
+            for row in page
+        )
+        after = page[-1].day_id
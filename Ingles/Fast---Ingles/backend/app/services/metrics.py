@@ -0,0 +1,260 @@
+"""
+In-process Metrics for Fast-Ingles.
+Rolling histograms and per-call records exposed through the admin metrics endpoint.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, asdict, field
+from typing import Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+
+# Default bucket upper bounds (seconds) for latency histograms
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+TOKEN_BUCKETS = (250, 500, 1000, 2000, 4000, 8000, 16000)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30)
+
+# USD per 1M tokens (input, output), matched by model name prefix
+MODEL_PRICES_PER_MTOK: dict[str, tuple[float, float]] = {
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-1.5-flash": (0.075, 0.30),
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-opus": (15.00, 75.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "deepseek-chat": (0.27, 1.10),
+}
+
+
+def estimate_cost(model: str, prompt_tokens: Optional[int], completion_tokens: Optional[int]) -> Optional[float]:
+    """Estimate the USD cost of a call, or None if the model or usage is unknown."""
+    if prompt_tokens is None or completion_tokens is None:
+        return None
+    # Longest prefix wins so "gpt-4o-mini" is not priced as "gpt-4o"
+    for prefix in sorted(MODEL_PRICES_PER_MTOK, key=len, reverse=True):
+        if model.startswith(prefix):
+            input_price, output_price = MODEL_PRICES_PER_MTOK[prefix]
+            return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    return None
+
+
+class RollingHistogram:
+    """Fixed-bucket histogram over a sliding time window."""
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        window_seconds: int = settings.METRICS_WINDOW_SECONDS,
+        max_samples: int = 10_000
+    ):
+        self.buckets = buckets
+        self.window_seconds = window_seconds
+        self._samples: deque[tuple[float, float]] = deque(maxlen=max_samples)
+
+    def observe(self, value: Optional[float]):
+        """Record a sample; None values are ignored."""
+        if value is not None:
+            self._samples.append((time.monotonic(), float(value)))
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.window_seconds
+        while self._samples and self._samples[0][0] < cutoff:
+            self._samples.popleft()
+
+    def snapshot(self) -> dict:
+        """Count, sum, percentiles and cumulative bucket counts for the window."""
+        self._expire()
+        values = sorted(v for _, v in self._samples)
+        count = len(values)
+        if not count:
+            return {"count": 0}
+
+        def percentile(p: float) -> float:
+            return values[min(count - 1, int(p * count))]
+
+        return {
+            "count": count,
+            "sum": round(sum(values), 6),
+            "avg": round(sum(values) / count, 6),
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "max": values[-1],
+            "buckets": {
+                **{f"le_{b}": sum(1 for v in values if v <= b) for b in self.buckets},
+                "le_inf": count
+            }
+        }
+
+
+@dataclass
+class LLMCallMetric:
+    """Metrics for a single lesson generation call."""
+    provider: str
+    model: str
+    success: bool
+    latency_seconds: float
+    time_to_first_token_seconds: Optional[float] = None
+    prompt_tokens: Optional[int] = None
+    completion_tokens: Optional[int] = None
+    rows_requested: int = 0
+    rows_parsed: int = 0
+    truncated: bool = False  # Stopped at the output token limit
+    estimated_cost_usd: Optional[float] = None
+    error: Optional[str] = None
+    timestamp: float = field(default_factory=time.time)
+
+
+class _ProviderStats:
+    """Aggregates for one (provider, model) pair."""
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.truncated = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+        self.latency = RollingHistogram(LATENCY_BUCKETS)
+        self.ttft = RollingHistogram(LATENCY_BUCKETS)
+        self.completion_token_hist = RollingHistogram(TOKEN_BUCKETS)
+        self.parse_ratio = RollingHistogram((0.5, 0.8, 0.9, 0.95, 1.0))
+
+    def record(self, metric: LLMCallMetric):
+        self.calls += 1
+        if not metric.success:
+            self.failures += 1
+        if metric.truncated:
+            self.truncated += 1
+        self.prompt_tokens += metric.prompt_tokens or 0
+        self.completion_tokens += metric.completion_tokens or 0
+        self.cost_usd += metric.estimated_cost_usd or 0.0
+        self.latency.observe(metric.latency_seconds)
+        self.ttft.observe(metric.time_to_first_token_seconds)
+        self.completion_token_hist.observe(metric.completion_tokens)
+        if metric.success and metric.rows_requested:
+            self.parse_ratio.observe(metric.rows_parsed / metric.rows_requested)
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "truncated": self.truncated,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "estimated_cost_usd": round(self.cost_usd, 6),
+            "latency_seconds": self.latency.snapshot(),
+            "time_to_first_token_seconds": self.ttft.snapshot(),
+            "completion_tokens_hist": self.completion_token_hist.snapshot(),
+            "rows_parsed_ratio": self.parse_ratio.snapshot()
+        }
+
+
+class LLMMetrics:
+    """Collector for per-provider LLM call metrics."""
+
+    def __init__(self, recent_calls: int = 100):
+        self._stats: dict[tuple[str, str], _ProviderStats] = {}
+        self._recent: deque[LLMCallMetric] = deque(maxlen=recent_calls)
+
+    def record(self, metric: LLMCallMetric):
+        """Record a finished call."""
+        key = (metric.provider, metric.model)
+        if key not in self._stats:
+            self._stats[key] = _ProviderStats()
+        self._stats[key].record(metric)
+        self._recent.append(metric)
+
+    def snapshot(self) -> dict:
+        """Aggregates per provider/model plus the most recent calls."""
+        return {
+            "providers": [
+                {"provider": provider, "model": model, **stats.snapshot()}
+                for (provider, model), stats in self._stats.items()
+            ],
+            "recent_calls": [asdict(m) for m in reversed(self._recent)]
+        }
+
+
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool, count: int = 1):
+        if hit:
+            self.hits += count
+        else:
+            self.misses += count
+
+    @staticmethod
+    def ratio(hits: int, misses: int) -> Optional[float]:
+        total = hits + misses
+        return round(hits / total, 4) if total else None
+
+    def snapshot(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.ratio(self.hits, self.misses)
+        }
+
+
+class PoolStats:
+    """Checkout and connect metrics for one database connection pool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.connect_failures = 0
+        # Time spent in checkout, including opening a new connection when needed
+        self.checkout_wait = RollingHistogram(POOL_WAIT_BUCKETS)
+        self.connect_latency = RollingHistogram(POOL_WAIT_BUCKETS)
+
+    def snapshot(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "connects": self.connects,
+            "connect_failures": self.connect_failures,
+            "checkout_wait_seconds": self.checkout_wait.snapshot(),
+            "connect_latency_seconds": self.connect_latency.snapshot()
+        }
+
+
+# Singleton instances
+_llm_metrics: Optional[LLMMetrics] = None
+_audio_cache_stats: Optional[CacheStats] = None
+_pool_stats: dict[str, PoolStats] = {}
+
+
+def get_llm_metrics() -> LLMMetrics:
+    """Get or create LLM metrics collector."""
+    global _llm_metrics
+    if _llm_metrics is None:
+        _llm_metrics = LLMMetrics()
+    return _llm_metrics
+
+
+def get_audio_cache_stats() -> CacheStats:
+    """Get or create the TTS audio cache hit/miss counters."""
+    global _audio_cache_stats
+    if _audio_cache_stats is None:
+        _audio_cache_stats = CacheStats()
+    return _audio_cache_stats
+
+
+def get_pool_stats(name: str) -> PoolStats:
+    """Get or create the metrics of a named database pool."""
+    if name not in _pool_stats:
+        _pool_stats[name] = PoolStats()
+    return _pool_stats[name]
@@ -0,0 +1,200 @@
+"""
+Preview Pool for Fast-Ingles.
+Keeps a small stock of ready-made lesson previews per (topic, category, word_count)
+so the admin preview endpoint can answer without waiting on the LLM.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, str, int]
+
+
+@dataclass
+class PooledPreview:
+    """A generated preview waiting to be handed out."""
+    content: list[dict]
+    created_at: float
+
+
+class PreviewPool:
+    """
+    Background producer of lesson previews.
+
+    Every preview is consumed at most once, so reviewers still see a fresh
+    variant each time; the pool only moves the LLM latency off the request path.
+    Only the most requested combinations are kept warm.
+    """
+
+    def __init__(
+        self,
+        size: int = settings.PREVIEW_POOL_SIZE,
+        max_age_seconds: int = settings.PREVIEW_POOL_MAX_AGE_SECONDS,
+        max_combos: int = settings.PREVIEW_POOL_MAX_COMBOS,
+        refill_interval_seconds: int = settings.PREVIEW_POOL_REFILL_INTERVAL_SECONDS,
+        idle_seconds: int = settings.PREVIEW_POOL_IDLE_SECONDS,
+        concurrency: int = settings.PREVIEW_POOL_CONCURRENCY
+    ):
+        self.size = size
+        self.max_age_seconds = max_age_seconds
+        self.max_combos = max_combos
+        self.refill_interval_seconds = refill_interval_seconds
+        self.idle_seconds = idle_seconds
+
+        self._pools: dict[PoolKey, deque[PooledPreview]] = {}
+        self._demand: Counter[PoolKey] = Counter()
+        self._last_requested: dict[PoolKey, float] = {}
+        self._topics: dict[PoolKey, str] = {}
+        self._refilling: dict[PoolKey, asyncio.Task] = {}
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._producer: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def make_key(topic: str, category: str, word_count: int) -> PoolKey:
+        """Normalize request parameters into a pool key."""
+        return (" ".join(topic.split()).lower(), category.strip().lower(), word_count)
+
+    def _is_stale(self, item: PooledPreview) -> bool:
+        return time.monotonic() - item.created_at > self.max_age_seconds
+
+    def _popular_keys(self) -> list[PoolKey]:
+        """Keys with the highest demand, limited to max_combos."""
+        return [key for key, _ in self._demand.most_common(self.max_combos)]
+
+    def pop(self, topic: str, category: str, word_count: int) -> Optional[list[dict]]:
+        """
+        Take a ready preview for the combination, if any, and record the demand.
+
+        A hit starts a refill to replace what was taken. A miss only counts the
+        request: the caller is already generating this combination inline, so the
+        producer warms it on its next pass instead of paying for a second call now.
+
+        Returns:
+            Lesson content, or None when the pool is empty (caller generates inline)
+        """
+        key = self.make_key(topic, category, word_count)
+        self._demand[key] += 1
+        self._last_requested[key] = time.monotonic()
+        self._topics.setdefault(key, topic)
+
+        item = None
+        pool = self._pools.get(key)
+        while pool:
+            candidate = pool.popleft()
+            if not self._is_stale(candidate):
+                item = candidate
+                break
+
+        if item is None:
+            return None
+        self.schedule_refill(key)
+        return item.content
+
+    def schedule_refill(self, key: PoolKey):
+        """Start filling the pool for a key unless it is already being filled."""
+        if self.size <= 0 or key in self._refilling:
+            return
+        if key not in self._popular_keys():
+            return
+        self._refilling[key] = asyncio.create_task(self._refill(key))
+
+    async def _refill(self, key: PoolKey):
+        """Generate previews until the pool for key holds `size` fresh items."""
+        from app.services.ai_service import get_ai_service
+
+        topic, category, word_count = self._topics[key], key[1], key[2]
+        try:
+            while True:
+                pool = self._pools.setdefault(key, deque())
+                if len(pool) >= self.size:
+                    break
+                async with self._semaphore:
+                    content = await get_ai_service().generate_lesson(
+                        topic=topic,
+                        category=category,
+                        count=word_count
+                    )
+                if not content:
+                    logger.warning(f"Preview pool: empty generation for {key}, stopping refill")
+                    break
+                pool.append(PooledPreview(content=content, created_at=time.monotonic()))
+                logger.info(f"Preview pool: stocked {key} ({len(pool)}/{self.size})")
+        except Exception as e:
+            logger.error(f"Preview pool: refill failed for {key}: {e}")
+        finally:
+            self._refilling.pop(key, None)
+
+    def _prune(self):
+        """Drop stale previews and forget combinations nobody asks for anymore."""
+        now = time.monotonic()
+        for key, last in list(self._last_requested.items()):
+            if now - last > self.idle_seconds:
+                self._demand.pop(key, None)
+                self._last_requested.pop(key, None)
+                self._topics.pop(key, None)
+
+        popular = set(self._popular_keys())
+        for key in list(self._pools):
+            if key not in popular:
+                del self._pools[key]
+                continue
+            self._pools[key] = deque(p for p in self._pools[key] if not self._is_stale(p))
+
+    async def _produce(self):
+        """Periodically prune and top up the popular combinations."""
+        while True:
+            try:
+                self._prune()
+                for key in self._popular_keys():
+                    self.schedule_refill(key)
+            except Exception as e:
+                logger.error(f"Preview pool: producer error: {e}")
+            await asyncio.sleep(self.refill_interval_seconds)
+
+    def start(self):
+        """Start the background producer."""
+        if self._producer is None:
+            self._producer = asyncio.create_task(self._produce())
+            logger.info("Preview pool producer started")
+
+    async def stop(self):
+        """Cancel the producer and any in-flight refills."""
+        tasks = list(self._refilling.values())
+        if self._producer is not None:
+            tasks.append(self._producer)
+            self._producer = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refilling.clear()
+
+    def stats(self) -> dict:
+        """Pool sizes per combination, for diagnostics."""
+        return {
+            f"{topic}|{category}|{count}": {
+                "ready": len(self._pools.get((topic, category, count), ())),
+                "requests": self._demand[(topic, category, count)]
+            }
+            for topic, category, count in self._popular_keys()
+        }
+
+
+# Singleton instance
+_preview_pool: Optional[PreviewPool] = None
+
+
+def get_preview_pool() -> PreviewPool:
+    """Get or create preview pool instance."""
+    global _preview_pool
+    if _preview_pool is None:
+        _preview_pool = PreviewPool()
+    return _preview_pool
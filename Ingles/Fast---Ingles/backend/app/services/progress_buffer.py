@@ -0,0 +1,214 @@
+"""
+Progress Buffer for Fast-Ingles.
+Write-behind buffer for learner progress: the Player reports its position on every
+card flip, so updates are coalesced in memory per (user, day) and written in one
+bulk upsert per flush instead of one transaction per swipe.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+
+from app.config import get_settings
+from app.database import async_session
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement
+_UPSERT_CHUNK_SIZE = 1000
+
+# Bulk upsert from parallel arrays. The join skips entries whose user was deleted
+# while buffered (FOR KEY SHARE holds the remaining users until commit), so one
+# stale entry cannot fail the FK check for the whole batch.
+_UPSERT_SQL = text("""
+    INSERT INTO progress (user_id, day_id, current_index, completed)
+    SELECT e.user_id, e.day_id, e.current_index, e.completed
+    FROM unnest(
+        CAST(:user_ids AS uuid[]),
+        CAST(:day_ids AS integer[]),
+        CAST(:current_indexes AS integer[]),
+        CAST(:completed AS boolean[])
+    ) AS e(user_id, day_id, current_index, completed)
+    JOIN users u ON u.id = e.user_id
+    FOR KEY SHARE OF u
+    ON CONFLICT (user_id, day_id) DO UPDATE SET
+        current_index = EXCLUDED.current_index,
+        completed = COALESCE(progress.completed, false) OR EXCLUDED.completed,
+        updated_at = now()
+    RETURNING user_id, day_id
+""")
+# Failed flushes an entry survives before it is dropped (e.g. database unreachable)
+_MAX_ATTEMPTS = 3
+
+
+@dataclass
+class PendingProgress:
+    """Latest progress for a (user, day) not yet written to the database."""
+    user_id: uuid.UUID
+    day_id: int
+    current_index: int
+    completed: bool
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    attempts: int = 0
+
+
+class ProgressBuffer:
+    """
+    Coalesces progress updates per (user, day) and flushes them periodically.
+
+    A flush is one INSERT ... ON CONFLICT (user_id, day_id) DO UPDATE per chunk of
+    pending rows; entries of users deleted meanwhile are skipped and dropped. Completing a day flushes immediately, and stop() flushes what is
+    left on shutdown. Each API worker has its own buffer; when updates for the same
+    day reach different workers, the last flush wins for current_index while
+    `completed` is never reset.
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = settings.PROGRESS_FLUSH_INTERVAL_SECONDS,
+        max_entries: int = settings.PROGRESS_BUFFER_MAX_ENTRIES
+    ):
+        self.interval_seconds = interval_seconds
+        self.max_entries = max_entries
+        self._pending: dict[tuple[uuid.UUID, int], PendingProgress] = {}
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.updates = 0
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+
+    async def update(self, user_id: uuid.UUID, day_id: int, current_index: int, completed: bool) -> PendingProgress:
+        """
+        Record the learner's position; returns the coalesced pending entry.
+
+        Flushes right away when the day becomes completed or the buffer is full.
+        """
+        key = (user_id, day_id)
+        previous = self._pending.get(key)
+        newly_completed = completed and not (previous and previous.completed)
+        entry = PendingProgress(
+            user_id=user_id,
+            day_id=day_id,
+            current_index=current_index,
+            completed=completed or bool(previous and previous.completed)
+        )
+        self._pending[key] = entry
+        self.updates += 1
+
+        if newly_completed or len(self._pending) >= self.max_entries:
+            try:
+                await self.flush()
+            except Exception as e:
+                # Entries stay pending; the periodic flush retries them
+                logger.error(f"Progress flush failed: {e}")
+        return entry
+
+    def pending_for(self, user_id: uuid.UUID) -> dict[int, PendingProgress]:
+        """Unflushed entries of a user by day_id (overlaid on database reads)."""
+        return {day_id: entry for (uid, day_id), entry in self._pending.items() if uid == user_id}
+
+    async def _upsert(self, entries: list[PendingProgress]) -> int:
+        """Write entries; returns how many were skipped because their user no longer exists."""
+        written = 0
+        async with async_session() as session:
+            for i in range(0, len(entries), _UPSERT_CHUNK_SIZE):
+                chunk = entries[i:i + _UPSERT_CHUNK_SIZE]
+                result = await session.execute(_UPSERT_SQL, {
+                    "user_ids": [e.user_id for e in chunk],
+                    "day_ids": [e.day_id for e in chunk],
+                    "current_indexes": [e.current_index for e in chunk],
+                    "completed": [e.completed for e in chunk]
+                })
+                written += len(result.all())
+            await session.commit()
+        return len(entries) - written
+
+    def _requeue(self, batch: dict[tuple[uuid.UUID, int], PendingProgress]):
+        """Put back a failed batch; updates that arrived meanwhile are newer and win."""
+        for key, entry in batch.items():
+            newer = self._pending.get(key)
+            if newer is not None:
+                newer.completed = newer.completed or entry.completed
+            elif entry.attempts + 1 < _MAX_ATTEMPTS:
+                entry.attempts += 1
+                self._pending[key] = entry
+            else:
+                self.dropped += 1
+                logger.warning(f"Dropping progress for user {entry.user_id} day {entry.day_id} after {_MAX_ATTEMPTS} failed flushes")
+
+    async def flush(self) -> int:
+        """Write all pending entries; returns the number of rows upserted."""
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            try:
+                # Day order keeps the stats trigger's day_progress_stats row locks
+                # consistent across concurrent flushes
+                skipped = await self._upsert(sorted(batch.values(), key=lambda e: (e.day_id, str(e.user_id))))
+            except BaseException:
+                self.failed_flushes += 1
+                self._requeue(batch)
+                raise
+            if skipped:
+                self.dropped += skipped
+                logger.warning(f"Dropped progress of {skipped} deleted user(s)")
+            self.flushes += 1
+            self.rows_flushed += len(batch) - skipped
+            return len(batch) - skipped
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Progress flush failed: {e}")
+
+    def start(self):
+        """Start the periodic flush task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """Stop the periodic task and flush what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final progress flush failed, {len(self._pending)} updates lost: {e}")
+
+    def snapshot(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "updates": self.updates,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped
+        }
+
+
+# Singleton instance
+_progress_buffer: Optional[ProgressBuffer] = None
+
+
+def get_progress_buffer() -> ProgressBuffer:
+    """Get or create the progress write-behind buffer."""
+    global _progress_buffer
+    if _progress_buffer is None:
+        _progress_buffer = ProgressBuffer()
+    return _progress_buffer
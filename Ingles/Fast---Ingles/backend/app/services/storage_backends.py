@@ -0,0 +1,382 @@
+"""
+Storage Backends for Fast-Ingles.
+Blocking object-store primitives behind StorageService, selected with STORAGE_BACKEND:
+
+- "minio": MinIO / S3 bucket (default)
+- "local": a directory on this node, served through signed /api/storage URLs
+
+StorageService runs every backend call on its bounded thread pool, so backends are
+plain synchronous code.
+"""
+
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Iterator, Optional
+from urllib.parse import quote, urlsplit
+
+import certifi
+import urllib3
+from minio import Minio
+from minio.commonconfig import REPLACE, CopySource
+from minio.deleteobjects import DeleteObject
+from minio.error import S3Error
+
+from app.config import get_settings
+from app.utils.url_signing import signed_url
+
+settings = get_settings()
+
+
+class InvalidObjectKey(ValueError):
+    """Key that cannot be mapped to a path (absolute, "..", empty segments)."""
+
+
+# Errors a backend raises for a failed operation on an object
+STORAGE_ERRORS = (S3Error, OSError, InvalidObjectKey)
+
+# App route serving objects of the local backend (see app/routers/storage.py)
+LOCAL_STORAGE_ROUTE = "/api/storage"
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ObjectInfo:
+    """Listing entry returned by iter_objects."""
+    key: str
+    size: int
+    last_modified: Optional[datetime] = None
+
+
+class StorageBackend(ABC):
+    """Interface implemented by every storage backend (all methods block)."""
+
+    @abstractmethod
+    def ensure_bucket(self):
+        ...
+
+    @abstractmethod
+    def put(
+        self,
+        key: str,
+        data: BinaryIO,
+        length: int,
+        content_type: str,
+        metadata: Optional[dict[str, str]] = None
+    ):
+        ...
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Readable stream of an object's content; the caller closes it."""
+        ...
+
+    @abstractmethod
+    def list_objects(self, prefix: str, start_after: Optional[str] = None, recursive: bool = True) -> Iterator[ObjectInfo]:
+        """Objects under prefix in byte order of their keys."""
+        ...
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def remove(self, key: str):
+        ...
+
+    @abstractmethod
+    def remove_many(self, keys: list[str]) -> dict[str, str]:
+        """Delete keys; returns key -> error message for failures."""
+        ...
+
+    @abstractmethod
+    def copy(self, source_key: str, dest_key: str, metadata: Optional[dict[str, str]] = None):
+        ...
+
+    @abstractmethod
+    def presigned_url(self, key: str, expires: timedelta) -> str:
+        ...
+
+    @abstractmethod
+    def public_url(self, key: str) -> str:
+        ...
+
+    def local_path(self, key: str) -> Optional[str]:
+        """Filesystem path of an object when it lives on this node, else None."""
+        return None
+
+    @abstractmethod
+    def internal_redirect(self, key: str) -> str:
+        """X-Accel-Redirect target letting nginx serve the object (see nginx.conf)."""
+        ...
+
+    @abstractmethod
+    def make_public(self, prefix: str):
+        """Allow anonymous reads of every object under prefix."""
+        ...
+
+    def close(self):
+        pass
+
+
+class _MinioStream:
+    """File-like wrapper returning the HTTP connection to the pool on close."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def read(self, size: int = -1) -> bytes:
+        return self._response.read(None if size < 0 else size)
+
+    def close(self):
+        self._response.close()
+        self._response.release_conn()
+
+
+class MinioBackend(StorageBackend):
+    """MinIO / S3 bucket with a bounded, timeout-aware HTTP connection pool."""
+
+    def __init__(self):
+        self._http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=settings.STORAGE_POOL_SIZE,
+            block=True,  # Wait for a free connection instead of opening unbounded extras
+            timeout=urllib3.Timeout(
+                connect=settings.STORAGE_CONNECT_TIMEOUT_SECONDS,
+                read=settings.STORAGE_READ_TIMEOUT_SECONDS
+            ),
+            retries=urllib3.Retry(
+                total=settings.STORAGE_MAX_RETRIES,
+                backoff_factor=0.2,
+                status_forcelist=[500, 502, 503, 504]
+            ),
+            cert_reqs="CERT_REQUIRED",
+            ca_certs=certifi.where()
+        )
+        self.client = Minio(
+            settings.MINIO_ENDPOINT,
+            access_key=settings.MINIO_ACCESS_KEY,
+            secret_key=settings.MINIO_SECRET_KEY,
+            secure=settings.MINIO_SECURE,
+            region=settings.MINIO_REGION or None,
+            http_client=self._http
+        )
+        self.bucket = settings.MINIO_BUCKET
+
+    def ensure_bucket(self):
+        if not self.client.bucket_exists(self.bucket):
+            self.client.make_bucket(self.bucket)
+
+    def make_public(self, prefix):
+        # Merge into the existing policy: other statements (set by ops) are kept
+        sid = f"PublicRead-{prefix.strip('/').replace('/', '-')}"
+        try:
+            policy = json.loads(self.client.get_bucket_policy(self.bucket))
+        except S3Error as e:
+            if e.code != "NoSuchBucketPolicy":
+                raise
+            policy = {"Version": "2012-10-17", "Statement": []}
+        statements = [s for s in policy.get("Statement", []) if s.get("Sid") != sid]
+        statements.append({
+            "Sid": sid,
+            "Effect": "Allow",
+            "Principal": {"AWS": ["*"]},
+            "Action": ["s3:GetObject"],
+            "Resource": [f"arn:aws:s3:::{self.bucket}/{prefix}*"]
+        })
+        policy["Statement"] = statements
+        self.client.set_bucket_policy(self.bucket, json.dumps(policy))
+
+    def put(self, key, data, length, content_type, metadata=None):
+        self.client.put_object(
+            self.bucket, key, data, length=length, content_type=content_type, metadata=metadata
+        )
+
+    def open(self, key):
+        return _MinioStream(self.client.get_object(self.bucket, key))
+
+    def list_objects(self, prefix, start_after=None, recursive=True):
+        for obj in self.client.list_objects(
+            self.bucket, prefix=prefix, recursive=recursive, start_after=start_after
+        ):
+            yield ObjectInfo(obj.object_name, obj.size or 0, obj.last_modified)
+
+    def exists(self, key):
+        try:
+            self.client.stat_object(self.bucket, key)
+            return True
+        except S3Error:
+            return False
+
+    def remove(self, key):
+        self.client.remove_object(self.bucket, key)
+
+    def remove_many(self, keys):
+        errors = self.client.remove_objects(self.bucket, [DeleteObject(k) for k in keys])
+        # remove_objects is lazy: iterating performs the request
+        return {error.name: error.message or error.code for error in errors}
+
+    def copy(self, source_key, dest_key, metadata=None):
+        self.client.copy_object(
+            self.bucket,
+            dest_key,
+            CopySource(self.bucket, source_key),
+            metadata=metadata,
+            metadata_directive=REPLACE if metadata else None
+        )
+
+    def presigned_url(self, key, expires):
+        return self.client.presigned_get_object(self.bucket, key, expires=expires)
+
+    def public_url(self, key):
+        protocol = "https" if settings.MINIO_SECURE else "http"
+        return f"{protocol}://{settings.MINIO_ENDPOINT}/{self.bucket}/{key}"
+
+    def internal_redirect(self, key):
+        # nginx fetches a short-lived presigned URL; only the client-facing URL is stable
+        url = urlsplit(self.presigned_url(key, timedelta(seconds=settings.AUDIO_ACCEL_PRESIGN_SECONDS)))
+        return f"{settings.AUDIO_ACCEL_MINIO_LOCATION}{url.scheme}/{url.netloc}{url.path}?{url.query}"
+
+    def close(self):
+        self._http.clear()
+
+
+class LocalDiskBackend(StorageBackend):
+    """
+    Objects stored as files under STORAGE_LOCAL_ROOT (key "a/b.mp3" -> ROOT/a/b.mp3).
+
+    Writes go to a temp file in the target directory and are renamed into place, so
+    readers never see partial objects. Object metadata is not persisted; the content
+    type served is derived from the extension.
+    """
+
+    _TEMP_PREFIX = ".tmp-"
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = os.path.realpath(root or settings.STORAGE_LOCAL_ROOT)
+
+    def _path(self, key: str) -> str:
+        parts = key.split("/")
+        if not key or key.startswith("/") or "\\" in key or any(p in ("", ".", "..") for p in parts):
+            raise InvalidObjectKey(f"Invalid object key: {key!r}")
+        return os.path.join(self.root, *parts)
+
+    def _key(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    def _write(self, path: str, source: BinaryIO, length: Optional[int]):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=self._TEMP_PREFIX, dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                remaining = length
+                while remaining is None or remaining > 0:
+                    chunk = source.read(_COPY_CHUNK_SIZE if remaining is None else min(_COPY_CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    tmp.write(chunk)
+                    if remaining is not None:
+                        remaining -= len(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _prune_dirs(self, path: str):
+        """Remove directories left empty by a delete, up to the root."""
+        directory = os.path.dirname(path)
+        while directory != self.root and directory.startswith(self.root):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                return
+            directory = os.path.dirname(directory)
+
+    def ensure_bucket(self):
+        os.makedirs(self.root, exist_ok=True)
+
+    def make_public(self, prefix):
+        pass  # /api/storage serves PUBLIC_DICTIONARY_PREFIX without a signature
+
+    def put(self, key, data, length, content_type, metadata=None):
+        self._write(self._path(key), data, length)
+
+    def open(self, key):
+        return open(self._path(key), "rb")
+
+    def list_objects(self, prefix, start_after=None, recursive=True):
+        # Walk the deepest directory covering the prefix, then sort: S3 listings are in
+        # byte order of the full key, which a directory walk does not guarantee
+        base = prefix.rsplit("/", 1)[0] if "/" in prefix else ""
+        top = os.path.join(self.root, *base.split("/")) if base else self.root
+        entries = []
+        for directory, dirs, files in os.walk(top):
+            if not recursive:
+                dirs.clear()
+            for name in files:
+                if name.startswith(self._TEMP_PREFIX):
+                    continue
+                key = self._key(os.path.join(directory, name))
+                if key.startswith(prefix) and (start_after is None or key > start_after):
+                    entries.append(key)
+        for key in sorted(entries):
+            try:
+                stat = os.stat(self._path(key))
+            except FileNotFoundError:
+                continue  # Deleted while listing
+            yield ObjectInfo(key, stat.st_size, datetime.fromtimestamp(stat.st_mtime, timezone.utc))
+
+    def exists(self, key):
+        return os.path.isfile(self._path(key))
+
+    def remove(self, key):
+        path = self._path(key)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return  # S3 semantics: deleting a missing key succeeds
+        self._prune_dirs(path)
+
+    def remove_many(self, keys):
+        errors = {}
+        for key in keys:
+            try:
+                self.remove(key)
+            except (OSError, InvalidObjectKey) as e:
+                errors[key] = str(e)
+        return errors
+
+    def copy(self, source_key, dest_key, metadata=None):
+        with open(self._path(source_key), "rb") as source:
+            self._write(self._path(dest_key), source, None)
+
+    def presigned_url(self, key, expires):
+        return signed_url(LOCAL_STORAGE_ROUTE, key, int(expires.total_seconds()))
+
+    def public_url(self, key):
+        return f"{settings.STORAGE_LOCAL_BASE_URL}{LOCAL_STORAGE_ROUTE}/{quote(key)}"
+
+    def internal_redirect(self, key):
+        self._path(key)  # Validate
+        return f"{settings.AUDIO_ACCEL_STORAGE_LOCATION}{quote(key)}"
+
+    def local_path(self, key):
+        try:
+            path = self._path(key)
+        except InvalidObjectKey:
+            return None
+        return path if os.path.isfile(path) else None
+
+
+def create_storage_backend() -> StorageBackend:
+    """Backend configured by STORAGE_BACKEND."""
+    if settings.STORAGE_BACKEND == "local":
+        return LocalDiskBackend()
+    if settings.STORAGE_BACKEND == "minio":
+        return MinioBackend()
+    raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND!r}")
@@ -0,0 +1,685 @@
+"""
+Storage Maintenance for Fast-Ingles.
+Reconciles the audio_cache table with the objects actually stored in MinIO and
+keeps the audio cache within its storage budget.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import delete, func, select, text, update
+
+from app.config import get_settings
+from app.database import async_session
+from app.models.audio_cache import AudioCache
+from app.services.metrics import CacheStats, get_audio_cache_stats
+from app.services.storage_service import (
+    AUDIO_PREFIXES,
+    CONTENT_AUDIO_PREFIX,
+    IMMUTABLE_AUDIO_PREFIXES,
+    LEGACY_CONTENT_PREFIX,
+    ObjectInfo,
+    StorageService,
+    get_storage_service
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Keys listed per category in the report
+_SAMPLE_SIZE = 20
+# text_content is stored truncated to this many characters (see routers/tts.py)
+_TEXT_CONTENT_MAX_LENGTH = 500
+# Pre-generated dictionary audio: served without audio_cache rows, so it is never
+# evicted nor deleted as orphaned
+PROTECTED_PREFIX = "global/dictionary/"
+
+
+@dataclass
+class ReconcileReport:
+    """Summary of a reconciliation run."""
+    dry_run: bool
+    objects_scanned: int = 0
+    rows_scanned: int = 0
+    dangling_rows: int = 0  # Row points to a missing object
+    orphaned_objects: int = 0  # Object no row points to
+    orphaned_bytes: int = 0
+    protected_objects: int = 0  # Row-less objects under PROTECTED_PREFIX (reported, never deleted)
+    zero_size_objects: int = 0  # Empty object (rows and object are removed)
+    rows_missing_size: int = 0  # file_size NULL/0 while the object has content
+    rows_deleted: int = 0
+    objects_deleted: int = 0
+    rows_updated: int = 0
+    samples: dict[str, list[str]] = field(default_factory=dict)
+
+    def sample(self, kind: str, key: str):
+        keys = self.samples.setdefault(kind, [])
+        if len(keys) < _SAMPLE_SIZE:
+            keys.append(key)
+
+    def summary(self) -> str:
+        mode = "DRY RUN" if self.dry_run else "APPLIED"
+        return (
+            f"[{mode}] scanned {self.objects_scanned} objects / {self.rows_scanned} rows: "
+            f"{self.dangling_rows} dangling rows, "
+            f"{self.orphaned_objects} orphaned objects ({self.orphaned_bytes} bytes), "
+            f"{self.protected_objects} protected objects without row, "
+            f"{self.zero_size_objects} zero-size objects, "
+            f"{self.rows_missing_size} rows missing size | "
+            f"deleted {self.rows_deleted} rows, {self.objects_deleted} objects; "
+            f"updated {self.rows_updated} rows"
+        )
+
+
+class _Fixer:
+    """Buffers fixes and applies them in batches (no-op in dry-run)."""
+
+    def __init__(self, report: ReconcileReport, batch_size: int):
+        self.report = report
+        self.batch_size = batch_size
+        self.row_ids: list[int] = []
+        self.object_keys: list[str] = []
+        self.sizes: list[dict] = []
+
+    async def delete_rows(self, ids: list[int]):
+        self.row_ids.extend(ids)
+        if len(self.row_ids) >= self.batch_size:
+            await self._flush_rows()
+
+    async def delete_object(self, key: str):
+        self.object_keys.append(key)
+        if len(self.object_keys) >= self.batch_size:
+            await self._flush_objects()
+
+    async def set_size(self, row_id: int, size: int):
+        self.sizes.append({"id": row_id, "file_size": size})
+        if len(self.sizes) >= self.batch_size:
+            await self._flush_sizes()
+
+    async def _flush_rows(self):
+        ids, self.row_ids = self.row_ids, []
+        if not ids or self.report.dry_run:
+            return
+        async with async_session() as session:
+            await session.execute(delete(AudioCache).where(AudioCache.id.in_(ids)))
+            await session.commit()
+        self.report.rows_deleted += len(ids)
+
+    async def _flush_objects(self):
+        keys, self.object_keys = self.object_keys, []
+        if not keys or self.report.dry_run:
+            return
+        results = await get_storage_service().delete_many(keys)
+        self.report.objects_deleted += sum(1 for r in results if r.ok)
+
+    async def _flush_sizes(self):
+        sizes, self.sizes = self.sizes, []
+        if not sizes or self.report.dry_run:
+            return
+        async with async_session() as session:
+            await session.execute(update(AudioCache), sizes)
+            await session.commit()
+        self.report.rows_updated += len(sizes)
+
+    async def flush(self):
+        await self._flush_rows()
+        await self._flush_objects()
+        await self._flush_sizes()
+
+
+async def _next(iterator: AsyncIterator):
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+async def _iter_audio_objects() -> AsyncIterator[ObjectInfo]:
+    """All audio objects in key order (prefixes are disjoint and listed in sorted order)."""
+    storage = get_storage_service()
+    for prefix in sorted(AUDIO_PREFIXES):
+        async for info in storage.iter_objects(prefix):
+            yield info
+
+
+async def reconcile_audio_storage(
+    dry_run: bool = True,
+    fix_dangling: bool = True,
+    fix_orphans: bool = True,
+    fix_sizes: bool = True,
+    grace_seconds: Optional[int] = None
+) -> ReconcileReport:
+    """
+    Merge-join MinIO listings with audio_cache rows (both streamed in key order).
+
+    Args:
+        dry_run: Only report; change nothing
+        fix_dangling: Delete rows whose object is missing
+        fix_orphans: Delete audio objects no row references (never under PROTECTED_PREFIX)
+        fix_sizes: Fill file_size for rows stored with NULL/0; drop empty objects and their rows
+        grace_seconds: Objects modified more recently than this are never treated as
+            orphans (an upload may be waiting for its row to be committed)
+    """
+    report = ReconcileReport(dry_run=dry_run)
+    fixer = _Fixer(report, settings.STORAGE_RECONCILE_BATCH_SIZE)
+    grace = grace_seconds if grace_seconds is not None else settings.STORAGE_RECONCILE_GRACE_SECONDS
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=grace)
+
+    objects = _iter_audio_objects()
+    async with async_session() as session:
+        # "C" collation = byte order, which is how MinIO sorts keys
+        result = await session.stream(
+            select(AudioCache.id, AudioCache.minio_key, AudioCache.file_size)
+            .order_by(AudioCache.minio_key.collate("C"), AudioCache.id)
+            .execution_options(yield_per=settings.STORAGE_RECONCILE_BATCH_SIZE)
+        )
+        rows = result.__aiter__()
+
+        obj = await _next(objects)
+        row = await _next(rows)
+        while obj is not None or row is not None:
+            if row is None or (obj is not None and obj.key < row.minio_key):
+                # Object without row
+                report.objects_scanned += 1
+                recent = obj.last_modified is not None and obj.last_modified > cutoff
+                if obj.key.startswith(PROTECTED_PREFIX):
+                    # Dictionary audio is looked up by key (derive_global_key), not through rows
+                    report.protected_objects += 1
+                    report.sample("protected_objects", obj.key)
+                elif not recent:
+                    report.orphaned_objects += 1
+                    report.orphaned_bytes += obj.size
+                    report.sample("orphaned_objects", obj.key)
+                    if fix_orphans:
+                        await fixer.delete_object(obj.key)
+                obj = await _next(objects)
+                continue
+
+            if obj is None or row.minio_key < obj.key:
+                # Row without object
+                report.rows_scanned += 1
+                report.dangling_rows += 1
+                report.sample("dangling_rows", row.minio_key)
+                if fix_dangling:
+                    await fixer.delete_rows([row.id])
+                row = await _next(rows)
+                continue
+
+            # Same key: gather every row pointing at this object
+            report.objects_scanned += 1
+            matched = []
+            while row is not None and row.minio_key == obj.key:
+                report.rows_scanned += 1
+                matched.append(row)
+                row = await _next(rows)
+
+            if obj.size == 0:
+                report.zero_size_objects += 1
+                report.sample("zero_size_objects", obj.key)
+                if fix_sizes:
+                    await fixer.delete_rows([r.id for r in matched])
+                    await fixer.delete_object(obj.key)
+            else:
+                for r in matched:
+                    if not r.file_size:
+                        report.rows_missing_size += 1
+                        if fix_sizes:
+                            await fixer.set_size(r.id, obj.size)
+            obj = await _next(objects)
+
+    await fixer.flush()
+    logger.info(report.summary())
+    return report
+
+
+@dataclass
+class KeyMigrationReport:
+    """Summary of a move of legacy content/ audio to content-addressed keys."""
+    dry_run: bool
+    rows_scanned: int = 0
+    rows_moved: int = 0
+    objects_copied: int = 0
+    objects_reused: int = 0  # Target already stored (duplicate text across categories/levels)
+    objects_deleted: int = 0
+    copy_failures: int = 0
+    samples: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        mode = "DRY RUN" if self.dry_run else "APPLIED"
+        return (
+            f"[{mode}] {self.rows_scanned} legacy rows: moved {self.rows_moved} "
+            f"({self.objects_copied} copied, {self.objects_reused} reused, "
+            f"{self.copy_failures} failed), deleted {self.objects_deleted} legacy objects"
+        )
+
+
+def _legacy_metadata(key: str) -> Optional[dict[str, str]]:
+    """Recover type/category/level from content/{category}/level_{n}/{type}/{file}."""
+    parts = key.split("/")
+    if len(parts) != 5 or not parts[2].startswith("level_"):
+        return None
+    return StorageService.audio_metadata(parts[3], parts[1], parts[2][len("level_"):])
+
+
+async def migrate_content_audio_keys(dry_run: bool = True, batch_size: Optional[int] = None) -> KeyMigrationReport:
+    """
+    Move audio_cache rows still under the legacy content/ layout to content-addressed keys.
+
+    Per batch: server-side copy to the new key (skipped when it already exists),
+    repoint the rows, commit, then delete legacy objects no row references any more.
+    Safe to re-run; rows whose copy fails keep their legacy key.
+    """
+    report = KeyMigrationReport(dry_run=dry_run)
+    batch_size = batch_size or settings.STORAGE_RECONCILE_BATCH_SIZE
+    storage = get_storage_service()
+    last_id = 0
+
+    while True:
+        async with async_session() as session:
+            result = await session.execute(
+                select(AudioCache.id, AudioCache.text_hash, AudioCache.minio_key)
+                .where(AudioCache.minio_key.like(f"{LEGACY_CONTENT_PREFIX}%"), AudioCache.id > last_id)
+                .order_by(AudioCache.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+        report.rows_scanned += len(rows)
+
+        targets = {row.id: storage.content_audio_key(row.text_hash) for row in rows}
+        exists = await storage.exists_many(targets.values())
+        for row in rows[:_SAMPLE_SIZE - len(report.samples)]:
+            report.samples.append(f"{row.minio_key} -> {targets[row.id]}")
+
+        if dry_run:
+            report.objects_reused += sum(1 for key in set(targets.values()) if exists[key])
+            report.rows_moved += len(rows)
+            continue
+
+        moved = []
+        for row in rows:
+            target = targets[row.id]
+            if not exists[target]:
+                try:
+                    await storage.copy_object(row.minio_key, target, _legacy_metadata(row.minio_key))
+                    exists[target] = True
+                    report.objects_copied += 1
+                except Exception:
+                    report.copy_failures += 1
+                    continue
+            else:
+                report.objects_reused += 1
+            moved.append(row)
+        if not moved:
+            continue
+
+        legacy_keys = {row.minio_key for row in moved}
+        async with async_session() as session:
+            await session.execute(
+                update(AudioCache),
+                [{"id": row.id, "minio_key": targets[row.id]} for row in moved]
+            )
+            result = await session.execute(
+                select(AudioCache.minio_key).where(AudioCache.minio_key.in_(legacy_keys)).distinct()
+            )
+            still_referenced = set(result.scalars().all())
+            await session.commit()
+        report.rows_moved += len(moved)
+
+        results = await storage.delete_many(sorted(legacy_keys - still_referenced))
+        report.objects_deleted += sum(1 for r in results if r.ok)
+
+    logger.info(report.summary())
+    return report
+
+@dataclass
+class RekeyReport:
+    """Summary of re-hashing audio_cache rows with the canonical text/lang form."""
+    dry_run: bool
+    rows_scanned: int = 0
+    rows_skipped: int = 0  # text_content was truncated, the original text is unknown
+    rows_rekeyed: int = 0
+    duplicates_merged: int = 0
+    objects_copied: int = 0
+    objects_deleted: int = 0
+    samples: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        mode = "DRY RUN" if self.dry_run else "APPLIED"
+        return (
+            f"[{mode}] scanned {self.rows_scanned} rows ({self.rows_skipped} skipped): "
+            f"rekeyed {self.rows_rekeyed}, merged {self.duplicates_merged} duplicates, "
+            f"copied {self.objects_copied} objects, deleted {self.objects_deleted} objects"
+        )
+
+
+async def _apply_rekey(groups: list[tuple[str, list]], report: RekeyReport):
+    """Merge each group into one row under its canonical hash (and content key)."""
+    storage = get_storage_service()
+    updates, loser_ids, old_keys = [], [], set()
+    for text_hash, rows in groups:
+        # Keep the row already under the canonical hash, else the most used one
+        keeper = max(rows, key=lambda r: (r.text_hash == text_hash, r.access_count or 0, -r.id))
+        key = keeper.minio_key
+        if key.startswith(CONTENT_AUDIO_PREFIX):
+            target = storage.content_audio_key(text_hash)
+            if key != target and not any(r.minio_key == target for r in rows):
+                try:
+                    await storage.copy_object(key, target)
+                    report.objects_copied += 1
+                except Exception:
+                    continue
+            key = target
+        updates.append({
+            "id": keeper.id,
+            "text_hash": text_hash,
+            "minio_key": key,
+            "access_count": sum(r.access_count or 0 for r in rows)
+        })
+        loser_ids.extend(r.id for r in rows if r is not keeper)
+        old_keys.update(r.minio_key for r in rows if r.minio_key != key)
+
+    async with async_session() as session:
+        # Losers first: the keeper takes over a text_hash that must stay unique
+        if loser_ids:
+            await session.execute(delete(AudioCache).where(AudioCache.id.in_(loser_ids)))
+        if updates:
+            await session.execute(update(AudioCache), updates)
+        result = await session.execute(
+            select(AudioCache.minio_key).where(AudioCache.minio_key.in_(old_keys)).distinct()
+        )
+        still_referenced = set(result.scalars().all())
+        await session.commit()
+    report.rows_rekeyed += len(updates)
+    report.duplicates_merged += len(loser_ids)
+
+    results = await storage.delete_many(sorted(old_keys - still_referenced))
+    report.objects_deleted += sum(1 for r in results if r.ok)
+
+
+async def rekey_audio_cache(dry_run: bool = True, batch_size: Optional[int] = None) -> RekeyReport:
+    """
+    Re-hash every audio_cache row with canonicalize_text/canonicalize_lang and merge
+    rows that now collide ("Run"/"run "/"run" in en vs en-US) into a single entry.
+
+    The surviving row sums the access counts; content-addressed objects move to the
+    key of the canonical hash, and objects left unreferenced are deleted. No audio
+    is synthesized.
+    """
+    report = RekeyReport(dry_run=dry_run)
+    batch_size = batch_size or settings.STORAGE_RECONCILE_BATCH_SIZE
+    storage = get_storage_service()
+
+    groups: dict[str, list] = {}
+    async with async_session() as session:
+        result = await session.stream(
+            select(
+                AudioCache.id, AudioCache.text_hash, AudioCache.text_content,
+                AudioCache.language, AudioCache.minio_key, AudioCache.access_count
+            )
+            .order_by(AudioCache.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            report.rows_scanned += 1
+            if len(row.text_content) >= _TEXT_CONTENT_MAX_LENGTH:
+                report.rows_skipped += 1
+                continue
+            groups.setdefault(storage.generate_text_hash(row.text_content, row.language), []).append(row)
+
+    changed = [
+        (text_hash, rows) for text_hash, rows in groups.items()
+        if len(rows) > 1 or rows[0].text_hash != text_hash
+    ]
+    for text_hash, rows in changed[:_SAMPLE_SIZE]:
+        report.samples.append(f"{text_hash[:12]} <- " + ", ".join(repr(r.text_content) for r in rows))
+
+    if dry_run:
+        report.rows_rekeyed = len(changed)
+        report.duplicates_merged = sum(len(rows) - 1 for _, rows in changed)
+    else:
+        for start in range(0, len(changed), batch_size):
+            await _apply_rekey(changed[start:start + batch_size], report)
+
+    logger.info(report.summary())
+    return report
+
+async def apply_cache_headers(dry_run: bool = True) -> int:
+    """
+    Rewrite the metadata of immutable audio objects uploaded before Cache-Control was
+    set (in-place server-side copy). Returns the number of objects (to be) updated.
+    """
+    storage = get_storage_service()
+    count = 0
+    for prefix in IMMUTABLE_AUDIO_PREFIXES:
+        async for info in storage.iter_objects(prefix):
+            count += 1
+            if not dry_run:
+                await storage.copy_object(
+                    info.key, info.key, storage.object_headers(info.key, {"Content-Type": "audio/mpeg"})
+                )
+    logger.info(f"{'Would update' if dry_run else 'Updated'} Cache-Control on {count} objects")
+    return count
+
+
+# Arbitrary constant identifying the eviction job for pg_try_advisory_xact_lock
+_EVICTION_LOCK_ID = 0x46490341
+
+# Recency-weighted frequency: every access counts 1, halved every half-life since last use.
+# Candidates are taken lowest score first until the running size covers the excess.
+_EVICTION_CANDIDATES_SQL = text("""
+    SELECT id, minio_key, size FROM (
+        SELECT id, minio_key, COALESCE(file_size, 0) AS size,
+               SUM(COALESCE(file_size, 0)) OVER (ORDER BY score, id) AS running
+        FROM (
+            SELECT id, minio_key, file_size,
+                   (1 + COALESCE(access_count, 0)) * power(
+                       0.5,
+                       EXTRACT(EPOCH FROM (now() - COALESCE(last_accessed, created_at, now())))
+                       / CAST(:half_life_seconds AS float8)
+                   ) AS score
+            FROM audio_cache
+            WHERE minio_key NOT LIKE :protected
+        ) scored
+    ) ranked
+    WHERE running - size < :excess
+    ORDER BY running
+""")
+
+
+@dataclass
+class EvictionReport:
+    """Summary of an eviction run."""
+    dry_run: bool
+    started_at: float = field(default_factory=time.time)
+    budget_bytes: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    rows_evicted: int = 0
+    objects_deleted: int = 0
+    bytes_freed: int = 0
+    # Hit ratio since the previous run; hit_ratio_after is filled in by the next run
+    hit_ratio_before: Optional[float] = None
+    hit_ratio_after: Optional[float] = None
+    skipped: Optional[str] = None
+    samples: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        mode = "DRY RUN" if self.dry_run else "APPLIED"
+        if self.skipped:
+            return f"[{mode}] eviction skipped: {self.skipped}"
+        return (
+            f"[{mode}] audio cache {self.bytes_before} -> {self.bytes_after} bytes "
+            f"(budget {self.budget_bytes}): evicted {self.rows_evicted} rows, "
+            f"deleted {self.objects_deleted} objects, freed {self.bytes_freed} bytes"
+        )
+
+
+async def _evict_batch(batch: list, report: EvictionReport):
+    """Delete a batch of rows, then the objects no remaining row references."""
+    ids = [row.id for row in batch]
+    keys = {row.minio_key for row in batch}
+    async with async_session() as session:
+        await session.execute(delete(AudioCache).where(AudioCache.id.in_(ids)))
+        result = await session.execute(
+            select(AudioCache.minio_key).where(AudioCache.minio_key.in_(keys)).distinct()
+        )
+        # Another row (e.g. same audio under another hash) still points at the object
+        still_referenced = set(result.scalars().all())
+        await session.commit()
+    report.rows_evicted += len(ids)
+    report.bytes_freed += sum(row.size for row in batch)
+
+    orphaned = sorted(keys - still_referenced)
+    if orphaned:
+        results = await get_storage_service().delete_many(orphaned)
+        report.objects_deleted += sum(1 for r in results if r.ok)
+
+
+async def evict_audio_cache(
+    dry_run: bool = True,
+    budget_bytes: Optional[int] = None,
+    half_life_hours: Optional[float] = None
+) -> EvictionReport:
+    """
+    Shrink the evictable part of the audio cache to its byte budget.
+
+    Entries are scored by recency and frequency (see _EVICTION_CANDIDATES_SQL) and
+    evicted lowest score first, in batches, until usage drops to
+    AUDIO_EVICTION_TARGET_RATIO of the budget. Keys under PROTECTED_PREFIX neither
+    count towards the budget nor get evicted. Concurrent runs (several API
+    workers) are serialized with a transaction-scoped advisory lock.
+
+    Args:
+        dry_run: Only report what would be evicted
+        budget_bytes: Override AUDIO_CACHE_BYTE_BUDGET
+        half_life_hours: Override AUDIO_EVICTION_HALF_LIFE_HOURS
+    """
+    budget = budget_bytes if budget_bytes is not None else settings.AUDIO_CACHE_BYTE_BUDGET
+    half_life = half_life_hours if half_life_hours is not None else settings.AUDIO_EVICTION_HALF_LIFE_HOURS
+    report = EvictionReport(dry_run=dry_run, budget_bytes=budget)
+
+    # The lock lives as long as this transaction; batches commit on their own sessions
+    async with async_session() as lock_session:
+        locked = await lock_session.scalar(
+            text("SELECT pg_try_advisory_xact_lock(:id)"), {"id": _EVICTION_LOCK_ID}
+        )
+        if not locked:
+            report.skipped = "another eviction is running"
+            return report
+
+        report.bytes_before = await lock_session.scalar(
+            select(func.coalesce(func.sum(AudioCache.file_size), 0))
+            .where(AudioCache.minio_key.not_like(f"{PROTECTED_PREFIX}%"))
+        )
+        report.bytes_after = report.bytes_before
+        if report.bytes_before <= budget:
+            report.skipped = "within budget"
+            return report
+
+        excess = report.bytes_before - int(budget * settings.AUDIO_EVICTION_TARGET_RATIO)
+        result = await lock_session.execute(_EVICTION_CANDIDATES_SQL, {
+            "half_life_seconds": max(half_life, 0.001) * 3600,
+            "protected": f"{PROTECTED_PREFIX}%",
+            "excess": excess
+        })
+        candidates = result.all()
+        report.samples = [row.minio_key for row in candidates[:_SAMPLE_SIZE]]
+
+        if dry_run:
+            report.rows_evicted = len(candidates)
+            report.bytes_freed = sum(row.size for row in candidates)
+        else:
+            batch_size = settings.AUDIO_EVICTION_BATCH_SIZE
+            for start in range(0, len(candidates), batch_size):
+                await _evict_batch(candidates[start:start + batch_size], report)
+        report.bytes_after = report.bytes_before - report.bytes_freed
+        await lock_session.rollback()
+
+    logger.info(report.summary())
+    return report
+
+
+class AudioCacheEvictor:
+    """Runs evict_audio_cache periodically and keeps a short history of runs."""
+
+    def __init__(
+        self,
+        interval_seconds: int = settings.AUDIO_EVICTION_INTERVAL_SECONDS,
+        stats: Optional[CacheStats] = None,
+        history_size: int = 20
+    ):
+        self.interval_seconds = interval_seconds
+        self.stats = stats or get_audio_cache_stats()
+        self.history: deque[EvictionReport] = deque(maxlen=history_size)
+        self._counts_at_last_run = (0, 0)
+        self._task: Optional[asyncio.Task] = None
+
+    def _ratio_since_last_run(self) -> Optional[float]:
+        hits, misses = self._counts_at_last_run
+        return CacheStats.ratio(self.stats.hits - hits, self.stats.misses - misses)
+
+    async def run(self, dry_run: bool = False) -> EvictionReport:
+        """Evict once, recording the hit ratio on both sides of the run (dry runs are not kept)."""
+        ratio = self._ratio_since_last_run()
+        if dry_run:
+            report = await evict_audio_cache(dry_run=True)
+            report.hit_ratio_before = ratio
+            return report
+        if self.history:
+            self.history[-1].hit_ratio_after = ratio
+        report = await evict_audio_cache(dry_run=dry_run)
+        report.hit_ratio_before = ratio
+        self._counts_at_last_run = (self.stats.hits, self.stats.misses)
+        self.history.append(report)
+        return report
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Audio cache eviction failed: {e}")
+
+    def start(self):
+        """Start the periodic eviction task (no-op when the interval is 0)."""
+        if self._task is None and self.interval_seconds > 0:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(f"Audio cache eviction scheduled every {self.interval_seconds}s")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def snapshot(self) -> dict:
+        """Hit/miss counters plus the recent eviction runs."""
+        return {
+            **self.stats.snapshot(),
+            "hit_ratio_since_last_eviction": self._ratio_since_last_run(),
+            "budget_bytes": settings.AUDIO_CACHE_BYTE_BUDGET,
+            "evictions": [asdict(r) for r in reversed(self.history)]
+        }
+
+
+# Singleton instance
+_audio_cache_evictor: Optional[AudioCacheEvictor] = None
+
+
+def get_audio_cache_evictor() -> AudioCacheEvictor:
+    """Get or create the audio cache evictor."""
+    global _audio_cache_evictor
+    if _audio_cache_evictor is None:
+        _audio_cache_evictor = AudioCacheEvictor()
+    return _audio_cache_evictor
@@ -1,45 +1,144 @@
 """
 MinIO Storage Service for Fast-Ingles.
 Handles upload, download, and URL signing for audio files and images.
+
+Objects live in a pluggable backend (MinIO or local disk, see storage_backends.py).
+Backends are synchronous, so every call runs on a dedicated, bounded thread pool
+and is awaited from async code. A slow MinIO node can therefore only exhaust
+storage workers, never the event loop.
 """
 
-from minio import Minio
-from minio.error import S3Error
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
 import unicodedata
 import re
 import hashlib
+from dataclasses import dataclass
+from urllib.parse import quote
 from datetime import timedelta
-from typing import Optional
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable, Iterable, Optional, TypeVar
 import logging
 
 from app.config import get_settings
+from app.services.audio_disk_cache import get_audio_disk_cache
+from app.services.storage_backends import (
+    STORAGE_ERRORS,
+    ObjectInfo,
+    StorageBackend,
+    create_storage_backend
+)
+from app.utils.url_signing import signed_url
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Prefixes holding TTS audio tracked by the audio_cache table
+# ("content/" is the legacy per-category layout, see scripts/migrate_audio_keys.py)
+AUDIO_PREFIXES = ("audio/", "content/", "global/")
+CONTENT_AUDIO_PREFIX = "audio/"
+LEGACY_CONTENT_PREFIX = "content/"
+
+# App route serving audio (see app/routers/audio.py)
+AUDIO_ROUTE = "/api/audio"
+# Pre-generated word pronunciations (public-read when PUBLIC_DICTIONARY_ENABLED)
+PUBLIC_DICTIONARY_PREFIX = "global/dictionary/"
+# Keys derived from the content itself: the bytes behind them never change
+IMMUTABLE_AUDIO_PREFIXES = (CONTENT_AUDIO_PREFIX, PUBLIC_DICTIONARY_PREFIX)
+
+# S3 limit for a single multi-object delete request
+_DELETE_BATCH_SIZE = 1000
+
+
+def canonicalize_text(text: str) -> str:
+    """
+    Canonical form of a TTS text, shared by every cache hash and key.
+    
+    NFC-normalized, whitespace trimmed and collapsed to single spaces, and
+    lower-cased unless TTS_CASE_POLICY is "preserve".
+    """
+    text = " ".join(unicodedata.normalize("NFC", str(text)).split())
+    if settings.TTS_CASE_POLICY != "preserve":
+        text = text.lower()
+    return text
+
+
+def canonicalize_lang(lang: Optional[str]) -> str:
+    """
+    Canonical language tag: the lower-cased primary subtag ("en-US", "en_gb", "EN" -> "en").
+    gTTS only uses the primary subtag, so regional variants produce the same audio.
+    """
+    primary = re.split(r"[-_]", (lang or "").strip(), maxsplit=1)[0].lower()
+    return primary or "en"
+
+
+@dataclass
+class UploadItem:
+    """One object for upload_many."""
+    key: str
+    data: bytes
+    content_type: str = "audio/mpeg"
+    metadata: Optional[dict[str, str]] = None
+
+
+@dataclass
+class StorageResult:
+    """Per-item outcome of a bulk storage operation."""
+    key: str
+    ok: bool
+    error: Optional[str] = None
+
+
 class StorageService:
-    """Service for interacting with MinIO object storage."""
-    
-    def __init__(self):
-        self.client = Minio(
-            settings.MINIO_ENDPOINT,
-            access_key=settings.MINIO_ACCESS_KEY,
-            secret_key=settings.MINIO_SECRET_KEY,
-            secure=settings.MINIO_SECURE
+    """Service for interacting with object storage (MinIO or local disk)."""
+    
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        self.backend = backend or create_storage_backend()
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.STORAGE_MAX_WORKERS,
+            thread_name_prefix="storage"
+        )
+    
+    async def _run(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking backend call on the storage thread pool."""
+        loop = asyncio.get_running_loop()
+        return await asyncio.wait_for(
+            loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs)),
+            timeout=settings.STORAGE_OPERATION_TIMEOUT_SECONDS
         )
-        self.bucket = settings.MINIO_BUCKET
-        self._ensure_bucket()
     
-    def _ensure_bucket(self):
+    async def ensure_bucket(self):
         """Ensure the bucket exists."""
         try:
-            if not self.client.bucket_exists(self.bucket):
-                self.client.make_bucket(self.bucket)
-                logger.info(f"Created bucket: {self.bucket}")
-        except S3Error as e:
+            await self._run(self.backend.ensure_bucket)
+            if settings.PUBLIC_DICTIONARY_ENABLED:
+                await self._run(self.backend.make_public, PUBLIC_DICTIONARY_PREFIX)
+        except Exception as e:
             logger.error(f"Error checking/creating bucket: {e}")
     
+    @staticmethod
+    def object_headers(key: str, metadata: Optional[dict[str, str]] = None) -> Optional[dict[str, str]]:
+        """Metadata to store with an object: immutable keys get a long-lived Cache-Control."""
+        if key.startswith(IMMUTABLE_AUDIO_PREFIXES):
+            return {**(metadata or {}), "Cache-Control": settings.PUBLIC_AUDIO_CACHE_CONTROL}
+        return metadata
+    
+    @staticmethod
+    def _invalidate_cached(keys: Iterable[str]):
+        """Drop node-local copies of objects that are being overwritten or deleted."""
+        cache = get_audio_disk_cache()
+        if cache is not None:
+            for key in keys:
+                cache.invalidate(key)
+    
+    def close(self):
+        """Release worker threads and pooled connections."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.backend.close()
+    
     @staticmethod
     def _slugify(text: str) -> str:
         """Create a clean filename slug."""
@@ -59,26 +158,35 @@ class StorageService:
     ) -> str:
         """
         Determine the storage path based on content type for Deduplication/Organization.
-        """
-        slug = self._slugify(text)
         
+        Category and level do not affect the key (they are stored as object metadata),
+        so the same text is stored and synthesized once across the whole catalog.
+        """
         # 1. GLOBAL DICTIONARY (Single words only)
         # Avoid duplicating same words across levels
-        if type == "word" and len(text.split()) == 1:
-            initial = slug[0] if slug else "0"
-            return f"global/dictionary/{initial}/{slug}.mp3"
+        if type == "word":
+            global_key = self.derive_global_key(text)
+            if global_key:
+                return global_key
             
-        # 2. CONTEXTUAL CONTENT (Sentences, Mnemonics)
-        # Organize by Level > Type
-        # Filename uses slug (short) + hash (unique)
-        clean_cat = self._slugify(category or "general")
-        short_slug = slug[:30] # Truncate for sanity
-        return f"content/{clean_cat}/level_{level}/{type}/{short_slug}_{text_hash[:8]}.mp3"
+        # 2. CONTEXTUAL CONTENT (Sentences, Mnemonics, multi-word entries)
+        # Content-addressed by text hash; 2-char fan-out keeps listings small
+        return self.content_audio_key(text_hash)
+    
+    @staticmethod
+    def content_audio_key(text_hash: str) -> str:
+        """Content-addressed key for contextual audio."""
+        return f"{CONTENT_AUDIO_PREFIX}{text_hash[:2]}/{text_hash}.mp3"
+    
+    @staticmethod
+    def audio_metadata(type: str, category: str, level: int) -> dict[str, str]:
+        """Object metadata recording where the audio was first generated for."""
+        return {"type": type, "category": category or "general", "level": str(level)}
 
     @staticmethod
     def generate_text_hash(text: str, lang: str) -> str:
-        """Generate SHA256 hash for text + language."""
-        content = f"{text}_{lang}"
+        """Generate SHA256 hash for canonical text + language (see canonicalize_text)."""
+        content = f"{canonicalize_text(text)}_{canonicalize_lang(lang)}"
         return hashlib.sha256(content.encode()).hexdigest()
     
     def derive_global_key(self, text: str, lang: str = "en") -> str:
@@ -86,6 +194,7 @@ class StorageService:
         Derive the expected MinIO key for a global word.
         Returns the path where the audio would be stored.
         """
+        text = canonicalize_text(text)
         slug = self._slugify(text)
         # Only single words go to global dictionary
         if len(text.split()) == 1:
@@ -93,6 +202,23 @@ class StorageService:
             return f"global/dictionary/{initial}/{slug}.mp3"
         return None
     
+    def audio_key(
+        self,
+        text: str,
+        lang: str,
+        type: str = "word",
+        category: str = "verbs",
+        level: int = 1
+    ) -> tuple[str, str]:
+        """
+        Compute where upload_audio would store this text, without uploading.
+        
+        Returns:
+            (text_hash, object key)
+        """
+        text_hash = self.generate_text_hash(text, lang)
+        return text_hash, self._get_storage_path(text, text_hash, type, category, level)
+    
     async def upload_audio(
         self, 
         audio_data: bytes, 
@@ -106,31 +232,29 @@ class StorageService:
     ) -> str:
         """
         Upload audio to MinIO and return the object key.
-        Handles deduplication for 'word' type.
+        Every audio key is derived from the text, so an existing object is reused as is.
         """
-        text_hash = self.generate_text_hash(text, lang)
-        
         # Determine Smart Path
-        key = self._get_storage_path(text, text_hash, type, category, level)
+        text_hash, key = self.audio_key(text, lang, type, category, level)
         
-        # DEDUPLICATION CHECK (Only for Global Dictionary words)
-        # If it's a global word and already exists, DO NOT upload. Return existing key.
-        if type == "word" and key.startswith("global/"):
-            if self.object_exists(key):
-                logger.info(f"Deduplication: Using existing global audio for '{text}' -> {key}")
-                return key
+        # DEDUPLICATION CHECK: same text already stored (any category/level)
+        if await self.object_exists(key):
+            logger.info(f"Deduplication: Using existing audio for '{text}' -> {key}")
+            return key
         
         try:
-            self.client.put_object(
-                self.bucket,
+            await self._run(
+                self.backend.put,
                 key,
                 BytesIO(audio_data),
-                length=len(audio_data),
-                content_type=content_type
+                len(audio_data),
+                content_type,
+                self.object_headers(key, self.audio_metadata(type, category, level))
             )
+            self._invalidate_cached([key])
             logger.info(f"Uploaded audio: {key} ({len(audio_data)} bytes)")
             return key
-        except S3Error as e:
+        except STORAGE_ERRORS as e:
             logger.error(f"Error uploading audio: {e}")
             raise
     
@@ -156,20 +280,278 @@ class StorageService:
         key = f"{folder}/{filename}"
         
         try:
-            self.client.put_object(
-                self.bucket,
-                key,
-                BytesIO(image_data),
-                length=len(image_data),
-                content_type=content_type
-            )
+            await self._run(self.backend.put, key, BytesIO(image_data), len(image_data), content_type)
+            self._invalidate_cached([key])
             logger.info(f"Uploaded image: {key}")
             return key
-        except S3Error as e:
+        except STORAGE_ERRORS as e:
             logger.error(f"Error uploading image: {e}")
             raise
     
-    def get_presigned_url(
+    async def upload_object(
+        self,
+        key: str,
+        data: BinaryIO,
+        length: int,
+        content_type: str = "application/octet-stream"
+    ) -> str:
+        """
+        Upload an arbitrary file-like object under an explicit key.
+        
+        Args:
+            key: Object key in MinIO
+            data: Readable binary stream positioned at the start
+            length: Number of bytes to read from data
+            content_type: MIME type of the object
+            
+        Returns:
+            Object key in MinIO
+        """
+        try:
+            await self._run(self.backend.put, key, data, length, content_type)
+            self._invalidate_cached([key])
+            logger.info(f"Uploaded object: {key} ({length} bytes)")
+            return key
+        except STORAGE_ERRORS as e:
+            logger.error(f"Error uploading object: {e}")
+            raise
+    
+    def _read_object(self, key: str) -> bytes:
+        stream = self.backend.open(key)
+        try:
+            return stream.read()
+        finally:
+            stream.close()
+    
+    async def download_object(self, key: str) -> Optional[bytes]:
+        """
+        Download an object's content.
+        
+        Args:
+            key: Object key in MinIO
+            
+        Returns:
+            Object bytes, or None if it does not exist
+        """
+        try:
+            return await self._run(self._read_object, key)
+        except STORAGE_ERRORS as e:
+            logger.error(f"Error downloading object {key}: {e}")
+            return None
+    
+    async def stream_object(self, key: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """
+        Iterate over an object's content in chunks (for StreamingResponse).
+        
+        Args:
+            key: Object key in MinIO
+            chunk_size: Bytes per chunk
+        """
+        stream = await self._run(self.backend.open, key)
+        try:
+            while True:
+                chunk = await self._run(stream.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            stream.close()
+    
+    def _list_keys(self, prefix: str) -> list[str]:
+        return [info.key for info in self.backend.list_objects(prefix)]
+    
+    async def delete_prefix(self, prefix: str) -> int:
+        """
+        Delete every object under a prefix.
+        
+        Args:
+            prefix: Key prefix (e.g. "bundles/day_1/")
+            
+        Returns:
+            Number of objects deleted
+        """
+        try:
+            keys = await self._run(self._list_keys, prefix)
+        except STORAGE_ERRORS as e:
+            logger.error(f"Error listing prefix {prefix}: {e}")
+            return 0
+        results = await self.delete_many(keys)
+        count = sum(1 for r in results if r.ok)
+        if count:
+            logger.info(f"Deleted {count} objects under {prefix}")
+        return count
+    
+    async def iter_objects(
+        self,
+        prefix: str = "",
+        page_size: int = 1000
+    ) -> AsyncIterator[ObjectInfo]:
+        """
+        Stream every object under a prefix in key order, one page per executor call.
+        
+        Args:
+            prefix: Key prefix to list (recursive)
+            page_size: Objects fetched per blocking call
+        """
+        listing = iter(self.backend.list_objects(prefix))
+        
+        def next_page() -> list[ObjectInfo]:
+            page = []
+            for info in listing:
+                page.append(info)
+                if len(page) >= page_size:
+                    break
+            return page
+        
+        while True:
+            page = await self._run(next_page)
+            if not page:
+                return
+            for info in page:
+                yield info
+    
+    # ========== BULK OPERATIONS ==========
+    
+    async def _bounded(
+        self,
+        calls: Iterable[Callable[[], Awaitable[T]]],
+        concurrency: Optional[int]
+    ) -> list[T]:
+        """Await calls with at most `concurrency` in flight, preserving order."""
+        semaphore = asyncio.Semaphore(concurrency or settings.STORAGE_BATCH_CONCURRENCY)
+        
+        async def run(call):
+            async with semaphore:
+                return await call()
+        
+        return await asyncio.gather(*(run(call) for call in calls))
+    
+    async def upload_many(
+        self,
+        items: list[UploadItem],
+        concurrency: Optional[int] = None
+    ) -> list[StorageResult]:
+        """
+        Upload several objects in parallel.
+        
+        Args:
+            items: Objects to upload (explicit keys, see audio_key())
+            concurrency: Max uploads in flight (default STORAGE_BATCH_CONCURRENCY)
+            
+        Returns:
+            One StorageResult per item, in input order
+        """
+        async def upload(item: UploadItem) -> StorageResult:
+            try:
+                await self._run(
+                    self.backend.put,
+                    item.key,
+                    BytesIO(item.data),
+                    len(item.data),
+                    item.content_type,
+                    self.object_headers(item.key, item.metadata)
+                )
+                self._invalidate_cached([item.key])
+                return StorageResult(key=item.key, ok=True)
+            except Exception as e:
+                logger.error(f"Error uploading {item.key}: {e}")
+                return StorageResult(key=item.key, ok=False, error=str(e))
+        
+        results = await self._bounded([functools.partial(upload, i) for i in items], concurrency)
+        logger.info(f"Bulk upload: {sum(r.ok for r in results)}/{len(items)} objects")
+        return results
+    
+    def _list_range(self, prefix: str, first: str, last: str) -> set[str]:
+        """Keys directly under prefix that sort between first and last (inclusive)."""
+        found = set()
+        # start_after is exclusive; any string sorting just before `first` works
+        for info in self.backend.list_objects(prefix, start_after=first[:-1], recursive=False):
+            if info.key > last:
+                break
+            found.add(info.key)
+        return found
+    
+    async def exists_many(
+        self,
+        keys: Iterable[str],
+        concurrency: Optional[int] = None
+    ) -> dict[str, bool]:
+        """
+        Check existence of many objects using prefix listings instead of one stat per key.
+        
+        Keys are grouped by parent "folder"; each folder is listed once, only over the
+        key range requested, so the cost scales with folders rather than objects.
+        
+        Returns:
+            key -> exists
+        """
+        keys = list(dict.fromkeys(keys))
+        groups: dict[str, list[str]] = {}
+        for key in keys:
+            prefix = key.rsplit("/", 1)[0] + "/" if "/" in key else ""
+            groups.setdefault(prefix, []).append(key)
+        
+        async def check(prefix: str, group: list[str]) -> set[str]:
+            if len(group) == 1:
+                return set(group) if await self.object_exists(group[0]) else set()
+            group = sorted(group)
+            return await self._run(self._list_range, prefix, group[0], group[-1])
+        
+        listed = await self._bounded(
+            [functools.partial(check, prefix, group) for prefix, group in groups.items()],
+            concurrency
+        )
+        existing = set().union(*listed) if listed else set()
+        return {key: key in existing for key in keys}
+    
+    async def delete_many(
+        self,
+        keys: Iterable[str],
+        concurrency: Optional[int] = None
+    ) -> list[StorageResult]:
+        """
+        Delete many objects (MinIO multi-object delete, up to 1000 keys per request).
+        
+        Returns:
+            One StorageResult per key, in input order
+        """
+        keys = list(dict.fromkeys(keys))
+        batches = [keys[i:i + _DELETE_BATCH_SIZE] for i in range(0, len(keys), _DELETE_BATCH_SIZE)]
+        
+        async def delete(batch: list[str]) -> dict[str, str]:
+            try:
+                return await self._run(self.backend.remove_many, batch)
+            except Exception as e:
+                logger.error(f"Error deleting batch of {len(batch)} objects: {e}")
+                return {key: str(e) for key in batch}
+        
+        errors: dict[str, str] = {}
+        for batch_errors in await self._bounded(
+            [functools.partial(delete, b) for b in batches], concurrency
+        ):
+            errors.update(batch_errors)
+        self._invalidate_cached(keys)
+        
+        return [StorageResult(key=k, ok=k not in errors, error=errors.get(k)) for k in keys]
+    
+    async def get_audio_url(self, key: str, expires_seconds: int = 3600) -> str:
+        """
+        URL the client should play an audio object from.
+        
+        With PUBLIC_DICTIONARY_ENABLED, dictionary words get their public URL (no
+        signing at all). With AUDIO_URL_MODE="app" this is a signed /api/audio URL
+        (served from the node-local disk cache or by nginx, no MinIO round trip when
+        hot); URLs of immutable keys are stable so browsers and service workers can
+        cache them. Otherwise a presigned URL.
+        """
+        if settings.PUBLIC_DICTIONARY_ENABLED and key.startswith(PUBLIC_DICTIONARY_PREFIX):
+            return self.get_public_url(key)
+        if settings.AUDIO_URL_MODE == "app":
+            stable = key.startswith(IMMUTABLE_AUDIO_PREFIXES)
+            return signed_url(AUDIO_ROUTE, key, None if stable else expires_seconds)
+        return await self.get_presigned_url(key, expires_seconds)
+    
+    async def get_presigned_url(
         self, 
         key: str, 
         expires_seconds: int = 3600
@@ -185,13 +567,13 @@ class StorageService:
             Presigned URL
         """
         try:
-            url = self.client.presigned_get_object(
-                self.bucket,
+            url = await self._run(
+                self.backend.presigned_url,
                 key,
-                expires=timedelta(seconds=expires_seconds)
+                timedelta(seconds=expires_seconds)
             )
             return url
-        except S3Error as e:
+        except STORAGE_ERRORS as e:
             logger.error(f"Error generating presigned URL: {e}")
             raise
     
@@ -205,8 +587,34 @@ class StorageService:
         Returns:
             Public URL
         """
-        protocol = "https" if settings.MINIO_SECURE else "http"
-        return f"{protocol}://{settings.MINIO_ENDPOINT}/{self.bucket}/{key}"
+        if settings.STORAGE_PUBLIC_BASE_URL:
+            return f"{settings.STORAGE_PUBLIC_BASE_URL.rstrip('/')}/{quote(key)}"
+        return self.backend.public_url(key)
+    
+    async def copy_object(
+        self,
+        source_key: str,
+        dest_key: str,
+        metadata: Optional[dict[str, str]] = None
+    ) -> str:
+        """
+        Server-side copy of an object within the bucket (no data passes through the API).
+        
+        Args:
+            source_key: Existing object key
+            dest_key: Target object key
+            metadata: Replace the object metadata (default: copy it)
+            
+        Returns:
+            Target object key
+        """
+        try:
+            await self._run(self.backend.copy, source_key, dest_key, metadata)
+            self._invalidate_cached([dest_key])
+            return dest_key
+        except STORAGE_ERRORS as e:
+            logger.error(f"Error copying {source_key} -> {dest_key}: {e}")
+            raise
     
     async def delete_object(self, key: str) -> bool:
         """
@@ -219,14 +627,23 @@ class StorageService:
             True if successful
         """
         try:
-            self.client.remove_object(self.bucket, key)
+            await self._run(self.backend.remove, key)
+            self._invalidate_cached([key])
             logger.info(f"Deleted object: {key}")
             return True
-        except S3Error as e:
+        except STORAGE_ERRORS as e:
             logger.error(f"Error deleting object: {e}")
             return False
     
-    def object_exists(self, key: str) -> bool:
+    async def internal_redirect(self, key: str) -> str:
+        """nginx X-Accel-Redirect target for an object (see AUDIO_ACCEL_REDIRECT)."""
+        return await self._run(self.backend.internal_redirect, key)
+    
+    def local_path(self, key: str) -> Optional[str]:
+        """Filesystem path of an object stored on this node (local backend), else None."""
+        return self.backend.local_path(key)
+    
+    async def object_exists(self, key: str) -> bool:
         """
         Check if an object exists in MinIO.
         
@@ -237,9 +654,8 @@ class StorageService:
             True if exists
         """
         try:
-            self.client.stat_object(self.bucket, key)
-            return True
-        except S3Error:
+            return await self._run(self.backend.exists, key)
+        except STORAGE_ERRORS:
             return False
 
 
@@ -5,10 +5,25 @@ Simple implementation for MVP audio generation.
 
 from gtts import gTTS
 from io import BytesIO
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _synthesize(text: str, lang: str) -> bytes:
+    # Create memory buffer
+    mp3_fp = BytesIO()
+    
+    # Generate audio
+    tts = gTTS(text=text, lang=lang, slow=False)
+    tts.write_to_fp(mp3_fp)
+    
+    # Get bytes
+    mp3_fp.seek(0)
+    return mp3_fp.read()
+
+
 async def generate_tts_audio(text: str, lang: str = "en") -> bytes:
     """
     Generate MP3 audio bytes for the given text using gTTS.
@@ -25,16 +40,8 @@ async def generate_tts_audio(text: str, lang: str = "en") -> bytes:
         # gTTS uses 'en', 'es', etc.
         gtts_lang = lang.split('-')[0] if '-' in lang else lang
         
-        # Create memory buffer
-        mp3_fp = BytesIO()
-        
-        # Generate audio
-        tts = gTTS(text=text, lang=gtts_lang, slow=False)
-        tts.write_to_fp(mp3_fp)
-        
-        # Get bytes
-        mp3_fp.seek(0)
-        return mp3_fp.read()
+        # gTTS does blocking HTTP; keep it off the event loop
+        return await asyncio.to_thread(_synthesize, text, gtts_lang)
         
     except Exception as e:
         logger.error(f"Error generating TTS with gTTS: {e}")
@@ -0,0 +1,235 @@
+"""
+User Import/Export for Fast-Ingles.
+Bulk onboarding of whole classrooms from CSV or NDJSON, and streaming export of
+the user table. bcrypt hashing runs in a process pool so large imports neither
+block the event loop nor serialize on one core.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, Literal, Optional
+
+from pydantic import BaseModel, EmailStr, Field, ValidationError, field_validator
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import get_settings
+from app.database import async_session
+from app.models.user import User
+from app.utils.password_hashing import hash_passwords
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+EXPORT_FIELDS = ["id", "name", "email", "role", "status", "created_at"]
+_EXPORT_PAGE_SIZE = 1000
+
+
+class ImportRowError(ValueError):
+    """Row that could not be parsed at all (bad JSON, not an object)."""
+
+
+def normalize_email(value):
+    """Trimmed, lower-cased email ("A@x.com" and "a@x.com" are the same person)."""
+    return value.strip().lower() if isinstance(value, str) else value
+
+
+class BulkUserRow(BaseModel):
+    """One user of an import file (same fields as AdminUserCreate)."""
+    name: str = Field(min_length=1)
+    email: EmailStr
+    password: str = Field(min_length=6)
+    role: Literal["user", "admin"] = "user"
+
+    _normalize_email = field_validator("email", mode="before")(normalize_email)
+
+
+# Singleton instance
+_hash_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_password_hash_pool() -> ProcessPoolExecutor:
+    """Get or create the password hashing process pool."""
+    global _hash_pool
+    if _hash_pool is None:
+        # spawn, not fork: the API process runs threads (storage executor, DB pools)
+        # whose locks a forked child could inherit in a held state
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _hash_pool
+
+
+def close_password_hash_pool():
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash passwords across the process pool, preserving order."""
+    if not passwords:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = get_password_hash_pool()
+    chunk_size = -(-len(passwords) // settings.PASSWORD_HASH_WORKERS)  # One chunk per worker
+    chunks = await asyncio.gather(*(
+        loop.run_in_executor(pool, hash_passwords, passwords[i:i + chunk_size])
+        for i in range(0, len(passwords), chunk_size)
+    ))
+    return [hashed for chunk in chunks for hashed in chunk]
+
+
+async def read_upload(file) -> bytes:
+    """
+    Whole upload, refusing files over USER_IMPORT_MAX_BYTES without reading past the limit.
+
+    Raises:
+        ValueError: file too large
+    """
+    data = await file.read(settings.USER_IMPORT_MAX_BYTES + 1)
+    if len(data) > settings.USER_IMPORT_MAX_BYTES:
+        raise ValueError(f"Import files are limited to {settings.USER_IMPORT_MAX_BYTES} bytes")
+    return data
+
+
+def parse_import(data: bytes, fmt: ImportFormat) -> list[tuple[int, dict]]:
+    """
+    Rows of an import file as (line number, fields); unparseable rows carry an
+    ImportRowError under "_error". CSV needs a header row (name,email,password[,role]).
+    """
+    text = data.decode("utf-8-sig")
+    rows: list[tuple[int, dict]] = []
+    if fmt == "csv":
+        reader = csv.DictReader(io.StringIO(text))
+        for record in reader:
+            # Empty cells count as missing, so optional columns fall back to their defaults
+            rows.append((reader.line_num, {k.strip(): v.strip() for k, v in record.items() if k and v and v.strip()}))
+    else:
+        for line_no, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ImportRowError("Expected a JSON object")
+            except (ValueError, ImportRowError) as e:
+                record = {"_error": str(e)}
+            rows.append((line_no, record))
+    if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+        raise ValueError(f"Import is limited to {settings.USER_IMPORT_MAX_ROWS} rows")
+    return rows
+
+
+async def _import_batch(batch: list[tuple[int, dict]], seen: set[str]) -> list[dict]:
+    """Validate, hash and insert one batch; returns one result per row, in order."""
+    results: dict[int, dict] = {}
+    valid: dict[str, tuple[int, BulkUserRow]] = {}
+    for line, record in batch:
+        if "_error" in record:
+            results[line] = {"line": line, "status": "invalid", "error": record["_error"]}
+            continue
+        try:
+            row = BulkUserRow(**record)
+        except ValidationError as e:
+            errors = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+            results[line] = {"line": line, "email": record.get("email"), "status": "invalid", "error": errors}
+            continue
+        if row.email in seen:
+            results[line] = {"line": line, "email": row.email, "status": "duplicate"}
+            continue
+        seen.add(row.email)
+        valid[row.email] = (line, row)
+
+    if valid:
+        async with async_session() as session:
+            # Case-insensitive: older accounts may be stored with upper-case letters
+            existing = await session.execute(
+                select(func.lower(User.email)).where(func.lower(User.email).in_(list(valid)))
+            )
+            for email in set(existing.scalars()):
+                line, _ = valid.pop(email)
+                results[line] = {"line": line, "email": email, "status": "exists"}
+
+    if valid:
+        # Hash with no connection checked out: it is the slow part of the batch
+        rows = list(valid.values())
+        hashes = await hash_passwords([row.password for _, row in rows])
+        stmt = insert(User).values([
+            {"name": row.name, "email": row.email, "password_hash": hashed, "role": row.role, "status": "active"}
+            for (_, row), hashed in zip(rows, hashes)
+        ]).on_conflict_do_nothing(index_elements=[User.email]).returning(User.email, User.id)
+        async with async_session() as session:
+            created = dict((await session.execute(stmt)).all())
+            await session.commit()
+        for email, (line, _) in valid.items():
+            if email in created:
+                results[line] = {"line": line, "email": email, "status": "created", "id": str(created[email])}
+            else:  # Inserted concurrently since the existence check
+                results[line] = {"line": line, "email": email, "status": "exists"}
+
+    return [results[line] for line, _ in batch]
+
+
+async def import_users(rows: list[tuple[int, dict]]) -> AsyncIterator[dict]:
+    """
+    Import parsed rows in batches of USER_IMPORT_BATCH_SIZE, yielding a result per
+    row as each batch commits, then a summary. Existing emails are skipped, not updated.
+    """
+    seen: set[str] = set()
+    summary = {"created": 0, "exists": 0, "duplicate": 0, "invalid": 0}
+    for i in range(0, len(rows), settings.USER_IMPORT_BATCH_SIZE):
+        for result in await _import_batch(rows[i:i + settings.USER_IMPORT_BATCH_SIZE], seen):
+            summary[result["status"]] += 1
+            yield result
+    logger.info(f"User import finished: {summary}")
+    yield {"summary": summary}
+
+
+def _export_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value) if value is not None and not isinstance(value, (str, int)) else value
+
+
+async def export_users(fmt: ImportFormat) -> AsyncIterator[str]:
+    """Stream every user (no password hashes) as NDJSON or CSV, one keyset page at a time."""
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        yield buffer.getvalue()
+
+    columns = [getattr(User, field) for field in EXPORT_FIELDS]
+    after = None
+    while True:
+        query = select(*columns).order_by(User.created_at, User.id).limit(_EXPORT_PAGE_SIZE)
+        if after is not None:
+            query = query.where(tuple_(User.created_at, User.id) > after)
+        # Short session per page: no transaction stays open while the client reads
+        async with async_session() as session:
+            page = (await session.execute(query)).all()
+        if not page:
+            return
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerows([_export_value(v) for v in row] for row in page)
+            yield buffer.getvalue()
+        else:
+            yield "".join(
+                json.dumps(dict(zip(EXPORT_FIELDS, map(_export_value, row))), ensure_ascii=False) + "\n"
+                for row in page
+            )
+        last = page[-1]
+        after = tuple_(last.created_at, last.id)
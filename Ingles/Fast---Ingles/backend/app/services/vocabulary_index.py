@@ -0,0 +1,176 @@
+"""
+Vocabulary Index for Fast-Ingles.
+Knows which words already exist in saved lessons and which of them already have audio,
+so new lessons can avoid (or reuse) them instead of paying for generation twice.
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from sqlalchemy import select, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models.lesson import Lesson
+from app.models.audio_cache import AudioCache
+from app.services.storage_service import StorageService, get_storage_service
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class KnownWord:
+    """A word found in an existing lesson and/or the audio cache."""
+    word: str
+    entry: Optional[dict] = None  # WordEntry dict from the first lesson using it
+    day_id: Optional[int] = None
+    category: Optional[str] = None
+    audio_key: Optional[str] = None
+    lessons: int = 0  # Number of saved lessons using it
+    last_day_id: Optional[int] = None  # Most recent (highest) day using it
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_key is not None
+
+    def to_dict(self) -> dict:
+        return {
+            "word": self.word,
+            "day_id": self.day_id,
+            "category": self.category,
+            "has_audio": self.has_audio,
+            "audio_key": self.audio_key,
+            "entry": self.entry
+        }
+
+
+class VocabularyIndex:
+    """
+    In-memory index of the vocabulary in all saved lessons.
+
+    Lesson entries are cached for `ttl_seconds` (and invalidated on lesson save);
+    audio availability is always answered from a single fresh `audio_cache` query.
+    """
+
+    def __init__(self, ttl_seconds: int = settings.VOCAB_INDEX_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, KnownWord] = {}
+        self._built_at: Optional[float] = None
+
+    @staticmethod
+    def normalize(word: str) -> str:
+        """Key used to match words across lessons ("To Run" == "to run")."""
+        return StorageService._slugify(word)
+
+    def invalidate(self):
+        """Force a rebuild on next use (call after lessons change)."""
+        self._built_at = None
+
+    async def _ensure_fresh(self, db: AsyncSession):
+        if self._built_at is not None and time.monotonic() - self._built_at < self.ttl_seconds:
+            return
+
+        result = await db.execute(
+            select(Lesson.day_id, Lesson.category, Lesson.content).order_by(Lesson.day_id)
+        )
+        entries: dict[str, KnownWord] = {}
+        for day_id, category, content in result.all():
+            for entry in content or []:
+                word = (entry or {}).get("word")
+                if not word:
+                    continue
+                key = self.normalize(word)
+                if not key:
+                    continue
+                # First (lowest) day wins
+                if key not in entries:
+                    entries[key] = KnownWord(word=word, entry=entry, day_id=day_id, category=category)
+                known = entries[key]
+                if known.last_day_id != day_id:
+                    known.lessons += 1
+                    known.last_day_id = day_id
+
+        self._entries = entries
+        self._built_at = time.monotonic()
+        logger.info(f"Vocabulary index built: {len(entries)} distinct words")
+
+    async def known_words(self, db: AsyncSession, limit: Optional[int] = None) -> list[str]:
+        """
+        Distinct words of all saved lessons (every category), most used first and
+        then most recent, so a capped list keeps the words most likely to repeat.
+        """
+        await self._ensure_fresh(db)
+        ranked = sorted(
+            self._entries.values(),
+            key=lambda known: (known.lessons, known.last_day_id or 0),
+            reverse=True
+        )
+        return [known.word for known in ranked[:limit]]
+
+    async def lookup(
+        self,
+        db: AsyncSession,
+        words: Iterable[str],
+        lang: str = "en-US"
+    ) -> dict[str, KnownWord]:
+        """
+        Answer "which of these words do we already have, with audio" in one call.
+
+        Returns:
+            Mapping of each requested word that exists in a lesson or has cached audio
+        """
+        await self._ensure_fresh(db)
+        words = [w for w in dict.fromkeys(words) if w]
+        if not words:
+            return {}
+
+        storage = get_storage_service()
+        # Several spellings ("Run", "run ") can share one canonical hash
+        hashes: dict[str, list[str]] = {}
+        for w in words:
+            hashes.setdefault(storage.generate_text_hash(w, lang), []).append(w)
+        global_keys = {}
+        for w in words:
+            key = storage.derive_global_key(w, lang)
+            if key:
+                global_keys.setdefault(key, []).append(w)
+
+        conditions = [AudioCache.text_hash.in_(list(hashes))]
+        if global_keys:
+            conditions.append(AudioCache.minio_key.in_(list(global_keys)))
+        result = await db.execute(
+            select(AudioCache.text_hash, AudioCache.minio_key).where(or_(*conditions))
+        )
+        audio: dict[str, str] = {}
+        for text_hash, minio_key in result.all():
+            for word in hashes.get(text_hash) or global_keys.get(minio_key) or ():
+                audio.setdefault(word, minio_key)
+
+        found: dict[str, KnownWord] = {}
+        for w in words:
+            known = self._entries.get(self.normalize(w))
+            if known is None and w not in audio:
+                continue
+            found[w] = KnownWord(
+                word=w,
+                entry=known.entry if known else None,
+                day_id=known.day_id if known else None,
+                category=known.category if known else None,
+                audio_key=audio.get(w)
+            )
+        return found
+
+
+# Singleton instance
+_vocabulary_index: Optional[VocabularyIndex] = None
+
+
+def get_vocabulary_index() -> VocabularyIndex:
+    """Get or create vocabulary index instance."""
+    global _vocabulary_index
+    if _vocabulary_index is None:
+        _vocabulary_index = VocabularyIndex()
+    return _vocabulary_index
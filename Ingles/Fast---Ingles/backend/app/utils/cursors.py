@@ -0,0 +1,59 @@
+"""
+Keyset Cursors for Fast-Ingles.
+Opaque pagination cursors carrying the sort key of the last row returned, so the
+next page is a `(a, b) > (:a, :b)` index range scan instead of an OFFSET.
+"""
+
+import base64
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+
+class InvalidCursor(ValueError):
+    """Cursor that was not produced by encode_cursor (or does not match the types)."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _decode_value(t: type, value: Any) -> Any:
+    if t is datetime or t is uuid.UUID:
+        # Encoded as strings; anything else (numbers, lists) was not produced by encode_cursor
+        if not isinstance(value, str):
+            raise InvalidCursor(f"Invalid cursor: expected a {t.__name__} string")
+        return datetime.fromisoformat(value) if t is datetime else uuid.UUID(value)
+    # JSON already restores str/int; bool is an int subclass, so compare exact types
+    if type(value) is not t:
+        raise InvalidCursor(f"Invalid cursor: expected {t.__name__}")
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    """Opaque URL-safe cursor for a row's sort key (datetimes, UUIDs, str, int)."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """
+    Sort key of a cursor, each value converted to the matching type.
+
+    Raises:
+        InvalidCursor: malformed cursor or wrong number/types of values
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursor("Cursor does not match this listing")
+        return tuple(_decode_value(t, v) for t, v in zip(types, values))
+    except InvalidCursor:
+        raise
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {e}") from e
@@ -0,0 +1,15 @@
+"""
+Password Hashing for Fast-Ingles.
+The bcrypt context shared by login and bulk import. Imports nothing but passlib,
+so spawned hashing workers load it without pulling in Firebase, the database or
+the settings.
+"""
+
+from passlib.context import CryptContext
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """Hash a chunk of passwords (runs in a worker process of the import pool)."""
+    return [pwd_context.hash(p) for p in passwords]
@@ -4,18 +4,17 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from firebase_admin import auth
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from passlib.context import CryptContext
 import logging
 
 from app.firebase_admin_setup import initialize_firebase_admin
 from app.database import get_db
 from app.models.user import User
+from app.utils.password_hashing import pwd_context
 
 # Ensure app is initialized
 initialize_firebase_admin()
 
 security_scheme = HTTPBearer()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 logger = logging.getLogger(__name__)
 
 import os
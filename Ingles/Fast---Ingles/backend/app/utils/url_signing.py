@@ -0,0 +1,54 @@
+"""
+URL Signing for Fast-Ingles.
+HMAC-SHA256 links for objects served by the API instead of MinIO presigned URLs.
+Links expire, except stable ones issued for immutable (content-addressed) objects,
+which keep the same URL so browsers and CDNs can cache them.
+"""
+
+import base64
+import hashlib
+import hmac
+import time
+from typing import Optional
+from urllib.parse import quote
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def _signing_key() -> bytes:
+    return (settings.STORAGE_SIGNING_KEY or settings.SECRET_KEY).encode()
+
+
+def sign(route: str, key: str, expires: Optional[int]) -> str:
+    """
+    Signature of one object under one route until `expires` (unix time).
+
+    Args:
+        route: URL prefix serving the object (e.g. "/api/storage")
+        key: Object key (unquoted)
+        expires: Expiry as unix timestamp, or None for a stable (non-expiring) link
+    """
+    message = f"{route}/{key}\n{'never' if expires is None else expires}".encode()
+    digest = hmac.new(_signing_key(), message, hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def signed_url(route: str, key: str, expires_seconds: Optional[int]) -> str:
+    """
+    Relative (or STORAGE_LOCAL_BASE_URL-prefixed) URL valid for expires_seconds.
+    With expires_seconds=None the URL never expires and is identical on every call.
+    """
+    url = f"{settings.STORAGE_LOCAL_BASE_URL}{route}/{quote(key)}"
+    if expires_seconds is None:
+        return f"{url}?sig={sign(route, key, None)}"
+    expires = int(time.time()) + expires_seconds
+    return f"{url}?expires={expires}&sig={sign(route, key, expires)}"
+
+
+def verify(route: str, key: str, expires: Optional[int], signature: str) -> bool:
+    """True if the signature matches and has not expired."""
+    if expires is not None and expires < time.time():
+        return False
+    return hmac.compare_digest(sign(route, key, expires), signature)
@@ -45,6 +45,7 @@ CREATE TABLE IF NOT EXISTS lessons (
     word_count INTEGER NOT NULL,
     ai_provider VARCHAR(50),
     ai_model VARCHAR(100),
+    content_version INTEGER NOT NULL DEFAULT 1,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now()),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now())
 );
@@ -63,6 +64,7 @@ CREATE TABLE IF NOT EXISTS progress (
     UNIQUE(user_id, day_id)
 );
 CREATE INDEX IF NOT EXISTS idx_progress_user_id ON progress(user_id);
+CREATE INDEX IF NOT EXISTS idx_progress_user_updated ON progress(user_id, updated_at, id);
 
 -- 6. Audio Cache
 CREATE TABLE IF NOT EXISTS audio_cache (
@@ -79,6 +81,7 @@ CREATE TABLE IF NOT EXISTS audio_cache (
     access_count INTEGER DEFAULT 0
 );
 CREATE INDEX IF NOT EXISTS idx_audio_cache_text_hash ON audio_cache(text_hash);
+CREATE INDEX IF NOT EXISTS idx_audio_cache_minio_key ON audio_cache(minio_key);
 
 -- 7. User AI Config
 CREATE TABLE IF NOT EXISTS user_ai_config (
@@ -114,6 +117,70 @@ CREATE TRIGGER update_users_updated_at BEFORE UPDATE ON users FOR EACH ROW EXECU
 CREATE TRIGGER update_lessons_updated_at BEFORE UPDATE ON lessons FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 CREATE TRIGGER update_progress_updated_at BEFORE UPDATE ON progress FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+-- Progress aggregates, maintained from progress writes (see add_progress_stats.sql)
+CREATE TABLE IF NOT EXISTS user_progress_stats (
+    user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+    days_completed INTEGER NOT NULL DEFAULT 0,
+    current_streak INTEGER NOT NULL DEFAULT 0, -- Consecutive UTC dates with a completion, ending at last_completed_on
+    longest_streak INTEGER NOT NULL DEFAULT 0,
+    last_completed_on DATE,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT timezone('utc', now())
+);
+-- Top-N and "my rank" (count of learners ahead) are range scans on this index
+CREATE INDEX IF NOT EXISTS idx_user_progress_stats_rank ON user_progress_stats(days_completed DESC, user_id);
+
+CREATE TABLE IF NOT EXISTS day_progress_stats (
+    day_id INTEGER PRIMARY KEY,
+    learners_started INTEGER NOT NULL DEFAULT 0,
+    learners_completed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION apply_progress_stats()
+RETURNS TRIGGER AS $$
+DECLARE
+    was_completed BOOLEAN := TG_OP <> 'INSERT' AND COALESCE(OLD.completed, FALSE);
+    is_completed BOOLEAN := TG_OP <> 'DELETE' AND COALESCE(NEW.completed, FALSE);
+    today DATE := timezone('utc', now())::date;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO day_progress_stats (day_id, learners_started)
+        VALUES (NEW.day_id, 1)
+        ON CONFLICT (day_id) DO UPDATE SET learners_started = day_progress_stats.learners_started + 1;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE day_progress_stats SET learners_started = learners_started - 1 WHERE day_id = OLD.day_id;
+    END IF;
+
+    IF is_completed AND NOT was_completed THEN
+        UPDATE day_progress_stats SET learners_completed = learners_completed + 1 WHERE day_id = NEW.day_id;
+        INSERT INTO user_progress_stats (user_id, days_completed, current_streak, longest_streak, last_completed_on)
+        VALUES (NEW.user_id, 1, 1, 1, today)
+        ON CONFLICT (user_id) DO UPDATE SET
+            days_completed = user_progress_stats.days_completed + 1,
+            current_streak = CASE
+                WHEN user_progress_stats.last_completed_on = today THEN user_progress_stats.current_streak
+                WHEN user_progress_stats.last_completed_on = today - 1 THEN user_progress_stats.current_streak + 1
+                ELSE 1
+            END,
+            longest_streak = GREATEST(user_progress_stats.longest_streak, CASE
+                WHEN user_progress_stats.last_completed_on = today THEN user_progress_stats.current_streak
+                WHEN user_progress_stats.last_completed_on = today - 1 THEN user_progress_stats.current_streak + 1
+                ELSE 1
+            END),
+            last_completed_on = today,
+            updated_at = timezone('utc', now());
+    ELSIF was_completed AND NOT is_completed THEN
+        UPDATE day_progress_stats SET learners_completed = learners_completed - 1 WHERE day_id = OLD.day_id;
+        UPDATE user_progress_stats
+        SET days_completed = days_completed - 1, updated_at = timezone('utc', now())
+        WHERE user_id = OLD.user_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER apply_progress_stats AFTER INSERT OR DELETE OR UPDATE OF completed ON progress
+    FOR EACH ROW EXECUTE FUNCTION apply_progress_stats();
+
 -- KEY: Auto-create public user when auth user is created
 CREATE OR REPLACE FUNCTION public.handle_new_user()
 RETURNS trigger AS $$
@@ -25,18 +25,15 @@ async def cleanup_system():
 
     # 2. Clean MinIO Bucket
     logger.info("Cleaning MinIO Bucket...")
+    storage = get_storage_service()
     try:
-        storage = get_storage_service()
-        # List all objects
-        objects = storage.client.list_objects(storage.bucket_name)
-        count = 0
-        for obj in objects:
-            storage.client.remove_object(storage.bucket_name, obj.object_name)
-            count += 1
-        
+        # Batched multi-object deletes over the whole bucket
+        count = await storage.delete_prefix("")
         logger.info(f"✅ MinIO Bucket cleaned. Removed {count} objects.")
     except Exception as e:
         logger.error(f"❌ Error cleaning bucket: {e}")
+    finally:
+        storage.close()
 
 if __name__ == "__main__":
     asyncio.run(cleanup_system())
@@ -0,0 +1,48 @@
+"""
+Move contextual audio from the legacy per-category layout to content-addressed keys.
+
+content/{category}/level_{n}/{type}/{slug}_{hash8}.mp3  ->  audio/{hash[:2]}/{hash}.mp3
+
+Objects are copied server-side, audio_cache rows repointed, and legacy objects deleted
+once nothing references them. Dry run by default; pass --apply to migrate.
+
+Usage:
+    python scripts/migrate_audio_keys.py            # report only
+    python scripts/migrate_audio_keys.py --apply    # migrate
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.storage_maintenance import migrate_content_audio_keys
+from app.services.storage_service import get_storage_service
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main(args):
+    try:
+        report = await migrate_content_audio_keys(dry_run=not args.apply, batch_size=args.batch_size)
+    finally:
+        get_storage_service().close()
+
+    print(report.summary())
+    if args.verbose:
+        print(json.dumps(report.samples, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate legacy content/ audio keys")
+    parser.add_argument("--apply", action="store_true", help="Migrate (default: dry run)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Rows per batch")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print sample key moves")
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,56 @@
+"""
+Reconcile audio_cache with MinIO.
+
+Reports dangling rows (object missing), orphaned objects (no row), empty objects and
+rows stored without a size. Dry run by default; pass --apply to fix. Row-less
+dictionary audio (global/dictionary/) is only reported, never deleted.
+
+Usage:
+    python scripts/reconcile_storage.py            # report only
+    python scripts/reconcile_storage.py --apply    # fix everything found
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.storage_maintenance import reconcile_audio_storage
+from app.services.storage_service import get_storage_service
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main(args):
+    try:
+        report = await reconcile_audio_storage(
+            dry_run=not args.apply,
+            fix_dangling=not args.skip_dangling,
+            fix_orphans=not args.skip_orphans,
+            fix_sizes=not args.skip_sizes,
+            grace_seconds=args.grace_seconds
+        )
+    finally:
+        get_storage_service().close()
+
+    print(report.summary())
+    if args.verbose:
+        print(json.dumps(report.samples, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Reconcile audio_cache with MinIO")
+    parser.add_argument("--apply", action="store_true", help="Fix issues (default: dry run)")
+    parser.add_argument("--skip-dangling", action="store_true", help="Keep rows whose object is missing")
+    parser.add_argument("--skip-orphans", action="store_true", help="Keep objects without a row")
+    parser.add_argument("--skip-sizes", action="store_true", help="Do not fix zero/missing sizes")
+    parser.add_argument("--grace-seconds", type=int, default=None, help="Ignore objects newer than this")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print sample keys per issue")
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main(parser.parse_args()))
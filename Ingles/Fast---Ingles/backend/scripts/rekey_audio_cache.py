@@ -0,0 +1,47 @@
+"""
+Re-key audio_cache with canonical text/language hashes.
+
+Rows that differ only in case, whitespace, Unicode form or regional language tag
+("Run", "run ", "run" in en vs en-US) are merged into one entry, so they share a
+single cached audio file. No audio is generated. Dry run by default; pass --apply.
+
+Usage:
+    python scripts/rekey_audio_cache.py            # report only
+    python scripts/rekey_audio_cache.py --apply    # merge and re-key
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.storage_maintenance import rekey_audio_cache
+from app.services.storage_service import get_storage_service
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main(args):
+    try:
+        report = await rekey_audio_cache(dry_run=not args.apply, batch_size=args.batch_size)
+    finally:
+        get_storage_service().close()
+
+    print(report.summary())
+    if args.verbose:
+        print(json.dumps(report.samples, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-key audio_cache with canonical hashes")
+    parser.add_argument("--apply", action="store_true", help="Merge and re-key (default: dry run)")
+    parser.add_argument("--batch-size", type=int, default=None, help="Groups per batch")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print sample merges")
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,39 @@
+"""
+Backfill Cache-Control on immutable audio objects (audio/, global/dictionary/).
+
+Objects uploaded before PUBLIC_AUDIO_CACHE_CONTROL was stored with them are copied
+in place with the header, so public/CDN reads are cacheable. Dry run by default.
+
+Usage:
+    python scripts/set_audio_cache_headers.py            # count only
+    python scripts/set_audio_cache_headers.py --apply    # rewrite metadata
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services.storage_maintenance import apply_cache_headers
+from app.services.storage_service import get_storage_service
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def main(args):
+    try:
+        await apply_cache_headers(dry_run=not args.apply)
+    finally:
+        get_storage_service().close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Set Cache-Control on immutable audio objects")
+    parser.add_argument("--apply", action="store_true", help="Rewrite metadata (default: dry run)")
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main(parser.parse_args()))
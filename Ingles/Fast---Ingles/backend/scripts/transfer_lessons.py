@@ -0,0 +1,72 @@
+"""
+Export or import the lesson catalog as NDJSON (one lesson per line).
+
+Import validates every line, upserts lessons by day_id in batches of
+LESSON_IMPORT_BATCH_SIZE and then generates word audio for new and changed
+lessons. Same format and rules as GET/POST /api/lessons/export and /import.
+
+Usage:
+    python scripts/transfer_lessons.py export lessons.ndjson
+    python scripts/transfer_lessons.py import lessons.ndjson --dry-run
+    python scripts/transfer_lessons.py import lessons.ndjson [--no-audio]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.routers.lessons import generate_audio_for_lessons
+from app.services.bundle_service import bundle_prefix
+from app.services.lesson_transfer import export_lessons, import_lessons
+from app.services.storage_service import get_storage_service
+
+logging.basicConfig(level=logging.INFO)
+
+
+async def read_lines(path: str):
+    with open(path, "rb") as f:
+        for line in f:
+            yield line
+
+
+async def main(args):
+    if args.command == "export":
+        count = 0
+        with open(args.file, "w", encoding="utf-8") as f:
+            async for chunk in export_lessons():
+                f.write(chunk)
+                count += chunk.count("\n")
+        print(f"Exported {count} lessons to {args.file}")
+        return
+
+    storage = get_storage_service()
+    try:
+        report = await import_lessons(read_lines(args.file), dry_run=args.dry_run)
+        print(report.summary())
+        if report.errors:
+            print(json.dumps(report.errors, indent=2, ensure_ascii=False))
+        if report.dry_run:
+            return
+        for day_id in report.changed_day_ids + report.relabeled_day_ids:
+            await storage.delete_prefix(bundle_prefix(day_id))
+        if report.changed_day_ids and not args.no_audio:
+            await generate_audio_for_lessons(report.changed_day_ids)
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export or import lessons as NDJSON")
+    parser.add_argument("command", choices=["export", "import"])
+    parser.add_argument("file", help="NDJSON file to write (export) or read (import)")
+    parser.add_argument("--dry-run", action="store_true", help="Import: validate and report without writing")
+    parser.add_argument("--no-audio", action="store_true", help="Import: skip word audio generation")
+
+    if os.name == 'nt':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(main(parser.parse_args()))
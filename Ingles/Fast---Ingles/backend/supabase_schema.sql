@@ -29,6 +29,7 @@ CREATE TABLE IF NOT EXISTS lessons (
     word_count INTEGER NOT NULL,
     ai_provider VARCHAR(100),
     ai_model VARCHAR(100),
+    content_version INTEGER NOT NULL DEFAULT 1,
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW()
 );
@@ -72,6 +73,8 @@ CREATE TABLE IF NOT EXISTS audio_cache (
 
 CREATE INDEX IF NOT EXISTS idx_audio_cache_text_hash ON audio_cache(text_hash);
 CREATE INDEX IF NOT EXISTS idx_audio_cache_provider ON audio_cache(provider);
+CREATE INDEX IF NOT EXISTS idx_audio_cache_minio_key ON audio_cache(minio_key);
+CREATE INDEX IF NOT EXISTS idx_audio_cache_last_accessed ON audio_cache(last_accessed);
 
 -- =====================================================
 
@@ -93,5 +96,16 @@ CREATE TRIGGER update_lessons_updated_at BEFORE UPDATE ON lessons
 CREATE TRIGGER update_progress_updated_at BEFORE UPDATE ON progress
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
+CREATE OR REPLACE FUNCTION update_last_accessed_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Only reads bump recency; maintenance updates (e.g. file_size fixes) do not
+    IF NEW.access_count IS DISTINCT FROM OLD.access_count THEN
+        NEW.last_accessed = NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
 CREATE TRIGGER update_audio_cache_last_accessed BEFORE UPDATE ON audio_cache
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+    FOR EACH ROW EXECUTE FUNCTION update_last_accessed_column();
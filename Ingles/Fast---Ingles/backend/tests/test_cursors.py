@@ -0,0 +1,63 @@
+import base64
+import json
+import os
+import sys
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.cursors import InvalidCursor, decode_cursor, encode_cursor
+
+
+def _raw_cursor(values) -> str:
+    """Cursor built by hand, bypassing encode_cursor."""
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).rstrip(b"=").decode()
+
+
+def test_round_trip():
+    created_at = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+    user_id = uuid.uuid4()
+    cursor = encode_cursor(created_at, user_id)
+    assert decode_cursor(cursor, datetime, uuid.UUID) == (created_at, user_id)
+    assert decode_cursor(encode_cursor(42), int) == (42,)
+    assert decode_cursor(encode_cursor("abc", 7), str, int) == ("abc", 7)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", [
+    "",
+    "not-base64!!",
+    base64.urlsafe_b64encode(b"not json").decode(),
+    _raw_cursor({"a": 1}),
+])
+def test_rejects_malformed(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, int)
+
+
+def test_rejects_wrong_arity():
+    with pytest.raises(InvalidCursor):
+        decode_cursor(encode_cursor(1, 2), int)
+
+
+@pytest.mark.parametrize("values, types", [
+    ([123, 456], (datetime, uuid.UUID)),
+    (["2026-03-01T12:00:00", 5], (datetime, uuid.UUID)),
+    ([["x"], "2026-03-01T12:00:00"], (uuid.UUID, datetime)),
+    (["not a date"], (datetime,)),
+    (["not-a-uuid"], (uuid.UUID,)),
+    (["5"], (int,)),
+    ([True], (int,)),
+    ([1.5], (int,)),
+    ([5], (str,)),
+])
+def test_rejects_wrong_types(values, types):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(_raw_cursor(values), *types)
@@ -2,24 +2,22 @@
 import React, { useEffect, useState } from 'react';
 import { authService } from '../../services/authService';
 import { storageService } from '../../services/storageService';
-import { User } from '../../types';
 
 export const AdminStats: React.FC = () => {
-    const [users, setUsers] = useState<User[]>([]);
+    const [userCounts, setUserCounts] = useState({ total: 0, active: 0, admins: 0 });
     const [contentStats, setContentStats] = useState<any>(null);
 
     useEffect(() => {
         const loadStats = async () => {
-            const usersData = await authService.getAllUsers();
-            setUsers(usersData);
+            setUserCounts(await authService.getUserCounts());
             setContentStats(storageService.getAdminGlobalStats());
         };
         loadStats();
     }, []);
 
-    const totalUsers = users.length;
-    const activeUsers = users.filter(u => u.status === 'active').length;
-    const admins = users.filter(u => u.role === 'admin').length;
+    const totalUsers = userCounts.total;
+    const activeUsers = Math.min(userCounts.active, totalUsers);
+    const admins = userCounts.admins;
 
     // Calculate storage usage in KB
     const storageKB = contentStats ? (contentStats.storageUsage / 1024).toFixed(2) : "0";
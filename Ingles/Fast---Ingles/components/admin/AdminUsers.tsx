@@ -7,6 +7,9 @@ import { Button } from '../ui/Button';
 export const AdminUsers: React.FC = () => {
     const [users, setUsers] = useState<User[]>([]);
     const [loading, setLoading] = useState(true);
+    const [nextCursor, setNextCursor] = useState<string | null>(null);
+    const [totalUsers, setTotalUsers] = useState<number | null>(null);
+    const [loadingMore, setLoadingMore] = useState(false);
 
     // Modal State
     const [isModalOpen, setIsModalOpen] = useState(false);
@@ -25,8 +28,10 @@ export const AdminUsers: React.FC = () => {
     const loadUsers = async () => {
         setLoading(true);
         try {
-            const data = await authService.getAllUsers();
-            setUsers(data);
+            const page = await authService.getUsersPage();
+            setUsers(page.users);
+            setNextCursor(page.nextCursor);
+            setTotalUsers(page.total);
         } catch (error) {
             console.error('Error loading users:', error);
         } finally {
@@ -34,6 +39,20 @@ export const AdminUsers: React.FC = () => {
         }
     };
 
+    const loadMoreUsers = async () => {
+        if (!nextCursor) return;
+        setLoadingMore(true);
+        try {
+            const page = await authService.getUsersPage(nextCursor);
+            setUsers(prev => [...prev, ...page.users]);
+            setNextCursor(page.nextCursor);
+        } catch (error) {
+            console.error('Error loading users:', error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     useEffect(() => {
         loadUsers();
     }, []);
@@ -104,6 +123,11 @@ export const AdminUsers: React.FC = () => {
                 <div>
                     <h2 className="text-2xl font-bold text-slate-800">Gestión de Usuarios</h2>
                     <p className="text-slate-500 text-sm">Administra roles, accesos y crea nuevas cuentas.</p>
+                    {totalUsers !== null && (
+                        <p className="text-slate-400 text-xs mt-1">
+                            Mostrando {users.length} de ~{Math.max(totalUsers, users.length)} usuarios
+                        </p>
+                    )}
                 </div>
                 <Button onClick={handleOpenCreate}>
                     + Crear Usuario
@@ -179,6 +203,13 @@ export const AdminUsers: React.FC = () => {
                         ))}
                     </tbody>
                 </table>
+                {nextCursor && (
+                    <div className="p-4 border-t border-slate-100 flex justify-center">
+                        <Button variant="ghost" onClick={loadMoreUsers} disabled={loadingMore}>
+                            {loadingMore ? 'Cargando...' : 'Cargar más usuarios'}
+                        </Button>
+                    </div>
+                )}
             </div>
 
             {/* MODAL */}
@@ -122,6 +122,23 @@ export const apiService = {
         }
     },
 
+    /**
+     * Audio URLs for every word of a section, so the Player can prefetch them at once.
+     */
+    getSectionAudioManifest: async (dayId: number, sectionId: number, lang: string = 'en-US') => {
+        try {
+            const response = await api.get(`/lessons/${dayId}/section/${sectionId}/audio-manifest`, {
+                params: { lang }
+            });
+            return response.data;
+        } catch (error) {
+            if (axios.isAxiosError(error) && error.response?.status === 404) {
+                return null;
+            }
+            throw error;
+        }
+    },
+
     getTTSUrl: async (text: string, lang: string = 'en-US'): Promise<string> => {
         try {
             const response = await api.post('/tts/speak', {
@@ -138,9 +155,36 @@ export const apiService = {
 
     // ========== ADMIN USER MANAGEMENT API ==========
 
-    adminGetAllUsers: async () => {
-        const response = await api.get('/admin/users');
-        return response.data;
+    /**
+     * One page of the admin user list (newest first).
+     * nextCursor is null on the last page; total is the server's estimate.
+     */
+    adminGetUsersPage: async (
+        params: { cursor?: string, limit?: number, role?: string, status?: string, q?: string } = {}
+    ): Promise<{ users: any[], nextCursor: string | null, total: number | null }> => {
+        const response = await api.get('/admin/users', { params });
+        const total = response.headers['x-total-count'];
+        return {
+            users: response.data,
+            nextCursor: response.headers['x-next-cursor'] || null,
+            total: total !== undefined ? parseInt(total, 10) : null
+        };
+    },
+
+    /**
+     * User counts for the dashboard, from X-Total-Count (server estimates, one row fetched each).
+     */
+    adminGetUserCounts: async (): Promise<{ total: number, active: number, admins: number }> => {
+        const [all, active, admins] = await Promise.all([
+            apiService.adminGetUsersPage({ limit: 1 }),
+            apiService.adminGetUsersPage({ limit: 1, status: 'active' }),
+            apiService.adminGetUsersPage({ limit: 1, role: 'admin' })
+        ]);
+        return {
+            total: all.total ?? all.users.length,
+            active: active.total ?? active.users.length,
+            admins: admins.total ?? admins.users.length
+        };
     },
 
     adminCreateUser: async (userData: any) => {
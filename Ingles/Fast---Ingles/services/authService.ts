@@ -31,8 +31,12 @@ export const authService = {
     // --- ADMIN METHODS ---
     // These likely require the user to be an admin in the Backend DB.
 
-    getAllUsers: async (): Promise<User[]> => {
-        return apiService.adminGetAllUsers();
+    getUserCounts: async (): Promise<{ total: number, active: number, admins: number }> => {
+        return apiService.adminGetUserCounts();
+    },
+
+    getUsersPage: async (cursor?: string): Promise<{ users: User[], nextCursor: string | null, total: number | null }> => {
+        return apiService.adminGetUsersPage({ cursor });
     },
 
     adminCreateUser: async (userData: any): Promise<User> => {